@@ -0,0 +1,62 @@
+"""Benchmark biaya ekstraksi field per card: extract_clean_text per field vs satu kali iterasi.
+
+Contoh:
+    python benchmarks/bench_card_fields.py --repeat 200
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+from utils.extract import extract_clean_text
+from utils.parsers import FIELD_PATTERNS, extract_card_fields
+
+
+def per_field_scan(paragraphs):
+    """Cara lama: satu pemindaian paragraf dan regex tanpa kompilasi per field."""
+    return {
+        field: extract_clean_text(paragraphs, keyword, pattern, default)
+        for field, (keyword, pattern, default) in FIELD_PATTERNS.items()
+    }
+
+
+def single_pass(paragraphs):
+    return extract_card_fields(p.string for p in paragraphs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(ROOT, "tests", "fixtures", "*.html"))
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    cards = []
+    for path in sorted(glob.glob(args.fixtures)):
+        with open(path, 'rb') as f:
+            soup = BeautifulSoup(f.read(), "html.parser")
+        cards.extend(card.find_all('p') for card in soup.find_all('div', class_='collection-card'))
+
+    results = {}
+    for name, func in (("extract_clean_text x4", per_field_scan), ("extract_card_fields", single_pass)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for paragraphs in cards:
+                func(paragraphs)
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed / (args.repeat * len(cards)) * 1e6
+
+    assert all(per_field_scan(p) == single_pass(p) for p in cards), "Hasil ekstraksi berbeda"
+
+    baseline = results["extract_clean_text x4"]
+    print(f"Cards: {len(cards)} x {args.repeat} ulangan")
+    for name, micros in results.items():
+        print(f"{name:<24} {micros:8.2f} us/card  ({baseline / micros:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark sink CSV vs Parquet: waktu tulis, ukuran file, dan waktu baca (penuh dan proyeksi kolom).
+
+Contoh:
+    python benchmarks/bench_columnar.py --rows 1000000
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.datagen import synthetic_cleaned_frame
+from utils.load import read_parquet_data, save_to_csv, save_to_parquet
+
+
+def _timed(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--compression", default="zstd")
+    args = parser.parse_args()
+
+    df = synthetic_cleaned_frame(args.rows)
+    projection = ["Title", "Price"]
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "fashion_data.csv")
+        parquet_dir = os.path.join(tmp, "parquet")
+
+        _, csv_write = _timed(save_to_csv, df, csv_path)
+        _, csv_read = _timed(pd.read_csv, csv_path)
+        _, csv_proj = _timed(pd.read_csv, csv_path, usecols=projection)
+        csv_size = os.path.getsize(csv_path)
+
+        _, pq_write = _timed(save_to_parquet, df, parquet_dir, datetime.now(), args.compression)
+        _, pq_read = _timed(read_parquet_data, parquet_dir)
+        _, pq_proj = _timed(read_parquet_data, parquet_dir, projection)
+        pq_size = _dir_size(parquet_dir)
+
+    print(f"Rows: {args.rows:,}  (proyeksi: {', '.join(projection)})")
+    print(f"{'format':<10} {'tulis s':>8} {'MiB':>8} {'baca s':>8} {'proyeksi s':>11}")
+    print(f"{'csv':<10} {csv_write:>8.2f} {csv_size / 2**20:>8.1f} {csv_read:>8.2f} {csv_proj:>11.2f}")
+    print(f"{'parquet':<10} {pq_write:>8.2f} {pq_size / 2**20:>8.1f} {pq_read:>8.2f} {pq_proj:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
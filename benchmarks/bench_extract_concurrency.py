@@ -0,0 +1,61 @@
+"""Benchmark waktu scraping sekuensial vs paralel terhadap server katalog lokal.
+
+Contoh:
+    python benchmarks/bench_extract_concurrency.py --pages 50 --latency 0.05 --workers 8
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.stub_server import StubCatalogServer
+from utils.extract import scrape_fashion_products
+
+
+def _without_timestamp(rows):
+    return [{key: value for key, value in row.items() if key != "Timestamp"} for row in rows]
+
+
+def _timed(func, **kwargs):
+    # Output print per halaman diredam agar tidak mempengaruhi pengukuran
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(**kwargs)
+        elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="Latensi buatan server per request (detik)")
+    parser.add_argument("--delay", type=float, default=0.1, help="Jeda antar halaman pada jalur sekuensial")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rps", type=float, default=20.0, help="Batas request per detik pada jalur paralel")
+    args = parser.parse_args()
+
+    with StubCatalogServer(total_pages=args.pages, latency=args.latency) as server:
+        sequential, seq_time = _timed(
+            scrape_fashion_products,
+            total_pages=args.pages, delay=args.delay, base_url=server.base_url,
+        )
+        concurrent, conc_time = _timed(
+            scrape_fashion_products,
+            total_pages=args.pages, max_workers=args.workers,
+            requests_per_second=args.rps, base_url=server.base_url,
+        )
+
+    assert _without_timestamp(sequential) == _without_timestamp(concurrent), "Hasil paralel berbeda dari sekuensial"
+
+    print(f"Halaman          : {args.pages} (latensi {args.latency:.3f}s)")
+    print(f"Sekuensial       : {seq_time:.2f}s (delay={args.delay}s, {len(sequential)} produk)")
+    print(f"Paralel          : {conc_time:.2f}s (workers={args.workers}, rps={args.rps}, {len(concurrent)} produk)")
+    print(f"Speedup          : {seq_time / conc_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
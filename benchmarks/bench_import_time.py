@@ -0,0 +1,87 @@
+"""Benchmark waktu import modul pipeline dengan `python -X importtime`, sekaligus penjaga regresi.
+
+Setiap target di-import di interpreter baru (tanpa cache modul), diulang beberapa kali
+dan diambil waktu terbaik. Selain total waktu, dicek juga bahwa library sink yang berat
+(SQLAlchemy, Google API) tidak ikut ter-import oleh modul yang seharusnya ringan, dan
+`main` tidak memuat library crawl (requests, bs4, asyncio) sebelum mode crawl dijalankan.
+
+Contoh:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --budget-ms 1500 --top 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modul -> paket berat yang tidak boleh ikut ter-import saat startup
+TARGETS = {
+    'utils.extract': ('sqlalchemy', 'googleapiclient', 'google.oauth2'),
+    'utils.transform': ('sqlalchemy', 'googleapiclient', 'google.oauth2'),
+    'utils.load': ('sqlalchemy', 'googleapiclient', 'google.oauth2'),
+    'main': ('sqlalchemy', 'googleapiclient', 'google.oauth2', 'requests', 'bs4', 'asyncio'),
+}
+
+
+def measure_import(module: str) -> dict:
+    """Meng-import `module` di interpreter baru dan mem-parse keluaran `-X importtime`.
+
+    Mengembalikan dict berisi total_ms (jumlah waktu self semua modul) dan modules,
+    yaitu {nama modul: waktu kumulatif dalam ms}.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        modules[name.strip()] = int(cumulative_us) / 1000
+    return {"total_ms": total_us / 1000, "modules": modules}
+
+
+def forbidden_imports(modules: dict, forbidden) -> list:
+    """Daftar paket terlarang (beserta submodulnya) yang ikut ter-import."""
+    return sorted(
+        package for package in forbidden
+        if any(name == package or name.startswith(f'{package}.') for name in modules)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Jumlah modul termahal yang ditampilkan per target")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Exit code 1 jika total import melewati batas ini")
+    args = parser.parse_args()
+
+    failures = []
+    for module, forbidden in TARGETS.items():
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["total_ms"])
+        leaked = forbidden_imports(best["modules"], forbidden)
+        print(f"{module:<16} {best['total_ms']:>8.1f} ms  ({len(best['modules'])} modul)")
+        top = sorted(
+            ((name, ms) for name, ms in best["modules"].items() if '.' not in name and name != module),
+            key=lambda item: item[1], reverse=True,
+        )[:args.top]
+        for name, ms in top:
+            print(f"    {name:<24} {ms:>8.1f} ms")
+        if leaked:
+            failures.append(f"{module} meng-import {', '.join(leaked)}")
+        if args.budget_ms is not None and best["total_ms"] > args.budget_ms:
+            failures.append(f"{module} butuh {best['total_ms']:.1f} ms (batas {args.budget_ms:.1f} ms)")
+
+    for failure in failures:
+        print(f"REGRESI: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark skalabilitas tahap parsing di process pool (halaman per detik untuk 1..N worker).
+
+Korpus halaman diambil dari fixture HTML tersimpan (diulang `--repeat` kali), atau
+dari halaman tiruan `stub_server.render_page` jika `--synthetic-pages` diisi.
+Baris `sekuensial` adalah parsing di proses utama tanpa pool sebagai pembanding.
+
+Contoh:
+    python benchmarks/bench_parse_processes.py --repeat 100 --workers 1,2,4,8
+    python benchmarks/bench_parse_processes.py --synthetic-pages 400 --parser lxml
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from benchmarks.stub_server import render_page
+from utils.extract import PARSER_BACKENDS, get_parser, parse_page, parse_pages_parallel
+
+
+def load_corpus(pattern, repeat, synthetic_pages):
+    if synthetic_pages:
+        return [render_page(page_number, synthetic_pages).encode("utf-8") for page_number in range(1, synthetic_pages + 1)]
+    pages = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages * repeat
+
+
+def bench_sequential(pages, parser_name):
+    parser = get_parser(parser_name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        cards = sum(len(parse_page(content, page_number, parser)) for page_number, content in enumerate(pages, 1))
+        return cards, time.perf_counter() - start
+
+
+def bench_workers(pages, parser_name, workers):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()  # Termasuk waktu menyalakan worker
+        cards = sum(len(rows) for rows in parse_pages_parallel(pages, parser_name, workers))
+        return cards, time.perf_counter() - start
+
+
+def main():
+    default_workers = ",".join(str(n) for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(ROOT, "tests", "fixtures", "catalog_page*.html"))
+    parser.add_argument("--repeat", type=int, default=100, help="Pengulangan fixture untuk membentuk korpus")
+    parser.add_argument("--synthetic-pages", type=int, default=0, help="Pakai N halaman tiruan alih-alih fixture")
+    parser.add_argument("--workers", default=default_workers, help="Daftar jumlah worker dipisah koma")
+    parser.add_argument("--parser", choices=tuple(PARSER_BACKENDS), default="bs4")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.fixtures, args.repeat, args.synthetic_pages)
+    if not pages:
+        parser.error(f"Tidak ada fixture yang cocok dengan {args.fixtures}")
+
+    print(f"Korpus: {len(pages)} halaman, parser {args.parser}, {os.cpu_count()} CPU")
+    print(f"{'worker':<11} {'cards':>8} {'detik':>8} {'halaman/s':>10} {'speedup':>8}")
+    cards, elapsed = bench_sequential(pages, args.parser)
+    baseline = len(pages) / elapsed
+    print(f"{'sekuensial':<11} {cards:>8} {elapsed:>8.2f} {baseline:>10.1f} {1.0:>7.1f}x")
+    for workers in (int(n) for n in args.workers.split(",") if n.strip()):
+        cards, elapsed = bench_workers(pages, args.parser, workers)
+        rate = len(pages) / elapsed
+        print(f"{workers:<11} {cards:>8} {elapsed:>8.2f} {rate:>10.1f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
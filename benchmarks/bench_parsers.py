@@ -0,0 +1,60 @@
+"""Microbenchmark backend parser pada fixture HTML tersimpan (cards per detik).
+
+Contoh:
+    python benchmarks/bench_parsers.py --repeat 50
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from utils.extract import PARSER_BACKENDS, get_parser, parse_page
+
+
+def load_fixtures(pattern):
+    pages = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def bench_backend(name, pages, repeat):
+    parser = get_parser(name)
+    cards = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for page_number, content in enumerate(pages, start=1):
+                cards += len(parse_page(content, page_number, parser))
+        elapsed = time.perf_counter() - start
+    return cards, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(ROOT, "tests", "fixtures", "catalog_page*.html"))
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.fixtures)
+    if not pages:
+        parser.error(f"Tidak ada fixture yang cocok dengan {args.fixtures}")
+
+    baseline = None
+    print(f"{'backend':<8} {'cards':>8} {'detik':>8} {'cards/s':>10} {'speedup':>8}")
+    for name in PARSER_BACKENDS:
+        cards, elapsed = bench_backend(name, pages, args.repeat)
+        rate = cards / elapsed
+        baseline = baseline or rate
+        print(f"{name:<8} {cards:>8} {elapsed:>8.2f} {rate:>10.0f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
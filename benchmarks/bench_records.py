@@ -0,0 +1,68 @@
+"""Benchmark memori penampung hasil scraping: list dictionary vs ProductColumns.
+
+Kedua cara menerima batch halaman yang sama dari generator sintetis lalu membentuk
+DataFrame mentah. Puncak alokasi diukur dengan tracemalloc, dan ukuran penampung
+sebelum konversi ke DataFrame dilaporkan terpisah.
+
+Contoh:
+    python benchmarks/bench_records.py --cards 300000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from benchmarks.datagen import synthetic_card_pages
+from utils.records import ProductColumns
+
+
+def collect_dicts(cards):
+    data = []
+    for products in synthetic_card_pages(cards):
+        data.extend(products)
+    return data, lambda: pd.DataFrame(data)
+
+
+def collect_columns(cards):
+    columns = ProductColumns()
+    for products in synthetic_card_pages(cards):
+        columns.extend(products)
+    return columns, columns.to_frame
+
+
+def measure(collect, cards):
+    """Mengukur durasi (tanpa tracemalloc), memori penampung, dan puncak alokasi hingga DataFrame terbentuk."""
+    start = time.perf_counter()
+    _, to_frame = collect(cards)
+    to_frame()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    container, to_frame = collect(cards)
+    held, _ = tracemalloc.get_traced_memory()
+    frame = to_frame()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return elapsed, held, peak, len(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=300_000)
+    args = parser.parse_args()
+
+    print(f"Cards sintetis: {args.cards:,}")
+    print(f"{'penampung':<15} {'detik':>7} {'penampung MiB':>14} {'puncak MiB':>11} {'byte/baris':>11}")
+    for name, collect in (("list dict", collect_dicts), ("ProductColumns", collect_columns)):
+        elapsed, held, peak, rows = measure(collect, args.cards)
+        print(f"{name:<15} {elapsed:>7.2f} {held / 2**20:>14,.1f} {peak / 2**20:>11,.1f} {held / rows:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
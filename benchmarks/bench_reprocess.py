@@ -0,0 +1,76 @@
+"""Benchmark memori reprocess CSV: baca seluruh file sekaligus vs per chunk (`reprocess_csv`).
+
+File CSV mentah sintetis dengan beberapa ukuran ditulis ke direktori sementara, lalu
+puncak alokasi (tracemalloc, proses utama) dan durasi kedua cara dibandingkan. Pada
+cara per chunk, puncak memori seharusnya tetap walaupun ukuran file bertambah.
+
+Contoh:
+    python benchmarks/bench_reprocess.py --rows 100000 400000 --chunksize 50000
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from benchmarks.datagen import synthetic_raw_frame
+from utils.load import save_to_csv
+from utils.reprocess import reprocess_csv
+from utils.transform import clean_and_transform
+
+
+def full_file(path, output):
+    df = clean_and_transform(pd.read_csv(path, dtype=str, keep_default_na=False))
+    save_to_csv(df, output)
+
+
+def chunked(path, output, chunksize):
+    reprocess_csv([path], sinks=("csv",), kind="raw", chunksize=chunksize, sink_options={"filename_csv": output})
+
+
+def measure(func):
+    """Mengembalikan (durasi tanpa tracemalloc, puncak alokasi dalam byte)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 400_000])
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="etl_reprocess_")
+    try:
+        print(f"{'baris':>10} {'cara':<10} {'durasi s':>9} {'puncak MiB':>11}")
+        for rows in args.rows:
+            path = os.path.join(workdir, f"raw_{rows}.csv")
+            output = os.path.join(workdir, "out.csv")
+            synthetic_raw_frame(rows).to_csv(path, index=False)
+            for name, func in (
+                ("full", lambda: full_file(path, output)),
+                ("chunked", lambda: chunked(path, output, args.chunksize)),
+            ):
+                elapsed, peak = measure(func)
+                print(f"{rows:>10,} {name:<10} {elapsed:>9.3f} {peak / 2**20:>11.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Generator data sintetis (mentah dan hasil transformasi) untuk benchmark skala besar."""
+import numpy as np
+import pandas as pd
+
+PRODUCT_TYPES = np.array(["T-shirt", "Hoodie", "Pants", "Outerwear", "Jacket", "Shirt", "Skirt", "Dress"])
+SIZES = np.array(["S", "M", "L", "XL", "XXL"])
+GENDERS = np.array(["Men", "Women", "Unisex"])
+
+
+def synthetic_raw_frame(rows: int, seed: int = 0, invalid_ratio: float = 0.05) -> pd.DataFrame:
+    """Membuat DataFrame mentah dengan format yang sama seperti hasil `extract_product_data`."""
+    rng = np.random.default_rng(seed)
+    index = np.arange(rows)
+    ratings = np.char.add("⭐ ", np.char.mod("%.1f", rng.uniform(1, 5, rows)))
+    invalid = rng.random(rows) < invalid_ratio
+    ratings = np.where(invalid, "Invalid Rating", ratings)
+    return pd.DataFrame({
+        "Title": np.char.add(np.char.add(rng.choice(PRODUCT_TYPES, rows), " "), index.astype(str)),
+        "Price": np.char.add("$", np.char.mod("%.2f", rng.uniform(10, 500, rows))),
+        "Rating": ratings,
+        "Colors": rng.integers(1, 9, rows).astype(str),
+        "Size": rng.choice(SIZES, rows),
+        "Gender": rng.choice(GENDERS, rows),
+        "Timestamp": pd.Timestamp("2025-05-12 21:55:46.510667") + pd.to_timedelta(index, unit="ms"),
+    }).astype({"Title": object, "Price": object, "Rating": object, "Colors": object,
+               "Size": object, "Gender": object})
+
+
+def synthetic_cleaned_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Membuat DataFrame hasil transformasi sintetis dengan skema yang sama seperti output clean_and_transform."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Title": [f"Product {i}" for i in range(rows)],
+        "Price": (rng.uniform(10, 500, rows) * 16000).round(1),
+        "Rating": rng.uniform(1, 5, rows).round(1),
+        "Colors": rng.integers(1, 9, rows),
+        "Size": rng.choice(SIZES, rows),
+        "Gender": rng.choice(GENDERS, rows),
+        "Timestamp": pd.Timestamp("2025-05-12T21:55:46.510667").strftime('%Y-%m-%dT%H:%M:%S.%f'),
+    })
+
+
+def synthetic_card_pages(cards: int, cards_per_page: int = 20, seed: int = 0):
+    """Menghasilkan list produk per halaman dengan format yang sama seperti hasil `parse_page`.
+
+    Setiap nilai string dibuat ulang per card seperti hasil parsing HTML, dan semua
+    produk dalam satu halaman berbagi satu Timestamp.
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2025-05-12 21:55:46.510667").to_pydatetime()
+    for first in range(0, cards, cards_per_page):
+        count = min(cards_per_page, cards - first)
+        prices = rng.uniform(10, 500, count)
+        ratings = rng.uniform(1, 5, count)
+        colors = rng.integers(1, 9, count)
+        sizes = rng.integers(0, len(SIZES), count)
+        genders = rng.integers(0, len(GENDERS), count)
+        timestamp = start + pd.Timedelta(milliseconds=first).to_pytimedelta()
+        yield [
+            {
+                "Title": f"{PRODUCT_TYPES[(first + i) % len(PRODUCT_TYPES)]} {first + i}",
+                "Price": f"${prices[i]:.2f}",
+                "Rating": f"⭐ {ratings[i]:.1f}",
+                "Colors": f"{colors[i]}",
+                "Size": f"{SIZES[sizes[i]]}",
+                "Gender": f"{GENDERS[genders[i]]}",
+                "Timestamp": timestamp,
+            }
+            for i in range(count)
+        ]
@@ -0,0 +1,79 @@
+"""Service Google Sheets tiruan di memori untuk pengujian dan benchmark sink Google Sheets.
+
+Hanya mendukung bagian API yang dipakai `sync_google_spreadsheet`: values.get,
+values.batchUpdate, values.clear, spreadsheets.get, dan spreadsheets.batchUpdate
+(deleteDimension). Setiap pemanggilan `execute()` dicatat di `service.calls`.
+"""
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+class FakeRequest:
+    def __init__(self, service, name, func):
+        self.service, self.name, self.func = service, name, func
+
+    def execute(self):
+        self.service.calls.append(self.name)
+        if self.service.rate_limited_calls:
+            self.service.rate_limited_calls -= 1
+            raise HttpError(httplib2.Response({"status": 429}), b"Rate limit exceeded")
+        return self.func()
+
+
+class FakeValues:
+    def __init__(self, service):
+        self.service = service
+
+    def get(self, spreadsheetId, range, valueRenderOption=None):
+        # Sheets mengembalikan angka bulat tanpa desimal dan membuang sel kosong di ujung baris
+        def read():
+            rows = [[int(v) if isinstance(v, float) and v.is_integer() else v for v in row]
+                    for row in self.service.grid]
+            return {"values": rows} if rows else {}
+        return FakeRequest(self.service, "values.get", read)
+
+    def batchUpdate(self, spreadsheetId, body):
+        def write():
+            for entry in body["data"]:
+                start = int(entry["range"].split("!A")[1]) - 1
+                for offset, row in enumerate(entry["values"]):
+                    while len(self.service.grid) <= start + offset:
+                        self.service.grid.append([])
+                    self.service.grid[start + offset] = list(row)
+            self.service.written_rows += sum(len(entry["values"]) for entry in body["data"])
+        return FakeRequest(self.service, "values.batchUpdate", write)
+
+    def clear(self, spreadsheetId, range):
+        start = int(range.split("!A")[1].split(":")[0]) - 1
+        return FakeRequest(self.service, "values.clear", lambda: self.service.grid.__delitem__(slice(start, None)))
+
+
+class FakeSpreadsheets:
+    def __init__(self, service):
+        self.service = service
+
+    def values(self):
+        return FakeValues(self.service)
+
+    def get(self, spreadsheetId, fields=None):
+        return FakeRequest(self.service, "spreadsheets.get",
+                           lambda: {"sheets": [{"properties": {"title": "Sheet1", "sheetId": 7}}]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        def apply():
+            for request in body["requests"]:
+                span = request["deleteDimension"]["range"]
+                assert span["sheetId"] == 7
+                del self.service.grid[span["startIndex"]:span["endIndex"]]
+        return FakeRequest(self.service, "spreadsheets.batchUpdate", apply)
+
+
+class FakeSheetsService:
+    def __init__(self, grid=None, rate_limited_calls=0):
+        self.grid = [list(row) for row in (grid or [])]
+        self.calls = []
+        self.written_rows = 0
+        self.rate_limited_calls = rate_limited_calls
+
+    def spreadsheets(self):
+        return FakeSpreadsheets(self)
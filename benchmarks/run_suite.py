@@ -0,0 +1,226 @@
+"""Suite benchmark offline: extract, transform, setiap sink load, dan end-to-end tanpa jaringan/layanan eksternal.
+
+Halaman katalog disajikan dari fixture HTML sintetis (tests/fixtures) oleh StubCatalogServer,
+data besar dibuat oleh `benchmarks.datagen`, PostgreSQL diganti SQLite, dan Google
+Sheets diganti service tiruan di memori. Hasil disimpan sebagai JSON di
+`benchmarks/results/` dan dapat dibandingkan dengan run sebelumnya.
+
+Contoh:
+    python benchmarks/run_suite.py
+    python benchmarks/run_suite.py --rows 1000000 --only transform --compare latest
+    python benchmarks/run_suite.py --compare benchmarks/results/20250512T215546_ab12cd3.json --fail-on-regression
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from benchmarks.datagen import synthetic_cleaned_frame, synthetic_raw_frame
+from benchmarks.fake_sheets import FakeSheetsService
+from benchmarks.stub_server import StubCatalogServer, load_html_pages
+from utils.extract import get_parser, parse_page, scrape_fashion_products
+from utils.load import dispose_engines, save_to_csv, save_to_parquet, save_to_postgresql, sync_google_spreadsheet
+from utils.transform import clean_and_transform, transform_with_schema
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+FIXTURES = os.path.join(ROOT, 'tests', 'fixtures', 'catalog_page*.html')
+
+
+def run_case(func, repeat):
+    """Menjalankan `func` sebanyak `repeat` kali; `func` mengembalikan jumlah baris yang diproses."""
+    durations = []
+    rows = 0
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            rows = func()
+            durations.append(time.perf_counter() - start)
+    best = min(durations)
+    return {
+        "rows": rows,
+        "repeat": repeat,
+        "min_seconds": best,
+        "median_seconds": statistics.median(durations),
+        "rows_per_second": rows / best if best else None,
+    }
+
+
+def build_cases(args, workdir, base_url, fixture_pages):
+    """Membentuk daftar (nama, callable) untuk setiap benchmark.
+
+    Case scraping memakai stub server di `base_url` yang dijalankan sekali oleh
+    pemanggil, sehingga start/shutdown server tidak ikut terukur.
+    """
+    raw = synthetic_raw_frame(args.rows)
+    cleaned = synthetic_cleaned_frame(args.rows)
+    sheet_rows = cleaned.head(args.sheet_rows)
+    counter = {"run": 0}
+
+    def scrape(**options):
+        return len(scrape_fashion_products(args.pages, delay=0, base_url=base_url, **options))
+
+    def parse(backend):
+        parser = get_parser(backend)
+        return lambda: sum(len(parse_page(content, i, parser)) for i, content in enumerate(fixture_pages * 10, 1))
+
+    def sqlite_engine():
+        counter["run"] += 1
+        path = os.path.join(workdir, f"bench_{counter['run']}.sqlite")
+        return create_engine(f"sqlite:///{path}")
+
+    def load_postgresql(mode):
+        def run():
+            engine = sqlite_engine()
+            save_to_postgresql(cleaned, "bench", "bench", "bench", mode=mode, engine=engine)
+            if mode == 'upsert':
+                save_to_postgresql(cleaned, "bench", "bench", "bench", mode=mode, engine=engine)  # Semua baris konflik
+            engine.dispose()
+            return len(cleaned)
+        return run
+
+    def load_gsheets():
+        service = FakeSheetsService()
+        sync_google_spreadsheet(sheet_rows, "bench", service=service)
+        changed = sheet_rows.copy()
+        changed.loc[changed.index[::10], "Price"] += 1.0
+        sync_google_spreadsheet(changed, "bench", service=service)
+        return len(sheet_rows)
+
+    def end_to_end():
+        data = scrape_fashion_products(args.pages, delay=0, max_workers=8, base_url=base_url)
+        df_cleaned = clean_and_transform(pd.DataFrame(data))
+        save_to_csv(df_cleaned, os.path.join(workdir, "e2e.csv"))
+        engine = sqlite_engine()
+        save_to_postgresql(df_cleaned, "bench", "bench", "bench", engine=engine)
+        engine.dispose()
+        return len(df_cleaned)
+
+    return [
+        ("extract.scrape_sequential", lambda: scrape()),
+        ("extract.scrape_threads8", lambda: scrape(max_workers=8)),
+        ("extract.parse_bs4", parse('bs4')),
+        ("extract.parse_lxml", parse('lxml')),
+        ("transform.clean_and_transform", lambda: len(clean_and_transform(raw))),
+        ("transform.transform_with_schema", lambda: len(transform_with_schema(raw))),
+        ("load.csv", lambda: save_to_csv(cleaned, os.path.join(workdir, "bench.csv")) and len(cleaned)),
+        ("load.parquet", lambda: save_to_parquet(cleaned, os.path.join(workdir, "parquet")) and len(cleaned)),
+        ("load.postgresql_sqlite_replace", load_postgresql('replace')),
+        ("load.postgresql_sqlite_upsert", load_postgresql('upsert')),
+        ("load.gsheets_fake_sync", load_gsheets),
+        ("e2e.scrape_transform_load", end_to_end),
+    ]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def resolve_baseline(compare):
+    if compare != "latest":
+        return compare
+    results = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+    return results[-1] if results else None
+
+
+def compare_results(current, baseline, threshold):
+    """Mencetak perbandingan dengan baseline dan mengembalikan daftar case yang melambat."""
+    regressions = []
+    print(f"\nPerbandingan dengan {baseline['commit']} ({baseline['created_at']}):")
+    print(f"{'case':<34} {'baseline s':>11} {'sekarang s':>11} {'rasio':>7}")
+    for name, result in current["cases"].items():
+        previous = baseline["cases"].get(name)
+        if not previous or not previous.get("min_seconds"):
+            print(f"{name:<34} {'-':>11} {result['min_seconds']:>11.4f} {'baru':>7}")
+            continue
+        ratio = result["min_seconds"] / previous["min_seconds"]
+        flag = "  <-- regresi" if ratio > 1 + threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<34} {previous['min_seconds']:>11.4f} {result['min_seconds']:>11.4f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Jumlah baris sintetis untuk transform/load")
+    parser.add_argument("--pages", type=int, default=20, help="Jumlah halaman yang disajikan stub server")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latensi buatan stub server per request (detik)")
+    parser.add_argument("--sheet-rows", type=int, default=5_000, help="Jumlah baris untuk sink Google Sheets tiruan")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default=None, help="Hanya jalankan case yang namanya mengandung teks ini")
+    parser.add_argument("--compare", default=None, help="Path hasil JSON sebelumnya, atau 'latest'")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Batas perlambatan relatif untuk regresi")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit code 1 jika ada regresi")
+    parser.add_argument("--no-save", action="store_true", help="Jangan simpan hasil ke benchmarks/results")
+    args = parser.parse_args()
+
+    baseline_path = resolve_baseline(args.compare) if args.compare else None
+    workdir = tempfile.mkdtemp(prefix="etl_bench_")
+    cases = {}
+    fixture_pages = load_html_pages(FIXTURES)
+    server = StubCatalogServer(total_pages=args.pages, latency=args.latency, html_pages=fixture_pages).start()
+    try:
+        for name, func in build_cases(args, workdir, server.base_url, fixture_pages):
+            if args.only and args.only not in name:
+                continue
+            cases[name] = run_case(func, args.repeat)
+            result = cases[name]
+            print(f"{name:<34} {result['min_seconds']:>9.4f}s  {result['rows']:>9,} baris  "
+                  f"{result['rows_per_second'] or 0:>12,.0f} baris/s")
+    finally:
+        server.stop()
+        dispose_engines()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    current = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {"rows": args.rows, "pages": args.pages, "latency": args.latency,
+                   "sheet_rows": args.sheet_rows, "repeat": args.repeat},
+        "cases": cases,
+    }
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{current['commit']}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nHasil disimpan ke {path}")
+
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("params") != current["params"]:
+            print("Peringatan: parameter baseline berbeda, perbandingan mungkin tidak sebanding.")
+        regressions = compare_results(current, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+    elif args.compare:
+        print("Tidak ada hasil sebelumnya untuk dibandingkan.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Server HTTP lokal yang meniru katalog Fashion Studio untuk keperluan benchmark dan pengujian."""
+import glob
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PRODUCT_TYPES = ["T-shirt", "Hoodie", "Pants", "Outerwear", "Jacket", "Shirt", "Skirt", "Dress"]
+SIZES = ["S", "M", "L", "XL", "XXL"]
+GENDERS = ["Men", "Women", "Unisex"]
+
+CARD_TEMPLATE = """
+        <div class="collection-card">
+            <div style="position: relative;">
+                <img src="https://picsum.photos/280/350?random={index}" class="collection-image" alt="{title}">
+            </div>
+            <div class="product-details">
+                <h3 class="product-title">{title}</h3>
+                <div class="price-container"><span class="price">{price}</span></div>
+                <p style="font-size: 14px; color: #777;">Rating: {rating} / 5</p>
+                <p style="font-size: 14px; color: #777;">{colors} Colors</p>
+                <p style="font-size: 14px; color: #777;">Size: {size}</p>
+                <p style="font-size: 14px; color: #777;">Gender: {gender}</p>
+            </div>
+        </div>"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>Fashion Studio</title></head>
+<body>
+    <div class="collection-grid" id="collectionList">{cards}
+    </div>
+    <ul class="pagination">{pagination}
+    </ul>
+</body>
+</html>
+"""
+
+
+def render_card(index: int, rng: random.Random) -> str:
+    """Membuat satu elemen 'collection-card' dengan data acak yang deterministik."""
+    if index % 20 == 0:
+        # Meniru produk rusak pada situs asli
+        return CARD_TEMPLATE.format(
+            index=index,
+            title="Unknown Product",
+            price="$100.00",
+            rating="⭐ Invalid Rating",
+            colors=5,
+            size="M",
+            gender="Men",
+        )
+    return CARD_TEMPLATE.format(
+        index=index,
+        title=f"{rng.choice(PRODUCT_TYPES)} {index + 1}",
+        price=f"${rng.uniform(10, 500):.2f}",
+        rating=f"⭐ {rng.uniform(1, 5):.1f}",
+        colors=rng.randint(1, 8),
+        size=rng.choice(SIZES),
+        gender=rng.choice(GENDERS),
+    )
+
+
+def render_page(page_number: int, total_pages: int = 50, cards_per_page: int = 20, pagination: bool = True) -> str:
+    """Membuat HTML satu halaman katalog, dengan markup pagination jika `pagination` True."""
+    rng = random.Random(page_number)
+    start = (page_number - 1) * cards_per_page
+    cards = "".join(render_card(start + i, rng) for i in range(cards_per_page))
+    if not pagination:
+        return PAGE_TEMPLATE.format(cards=cards, pagination="")
+    markup = f'\n        <li class="page-item current"><span class="page-link">Page {page_number} of {total_pages}</span></li>'
+    if page_number < total_pages:
+        markup += f'\n        <li class="page-item next"><a class="page-link" href="/page{page_number + 1}">Next</a></li>'
+    return PAGE_TEMPLATE.format(cards=cards, pagination=markup)
+
+
+def load_html_pages(pattern: str) -> list:
+    """Membaca file HTML (misalnya fixture sintetis tests/fixtures/catalog_page*.html) sebagai bytes."""
+    pages = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "rb") as f:
+            pages.append(f.read())
+    return pages
+
+
+class StubCatalogServer:
+    """Menjalankan katalog tiruan di thread terpisah dengan latensi buatan per request."""
+
+    def __init__(self, total_pages=50, cards_per_page=20, latency=0.05, host="127.0.0.1", port=0, pagination=True,
+                 html_pages=None):
+        self.total_pages = total_pages
+        self.cards_per_page = cards_per_page
+        self.pagination = pagination
+        self.html_pages = list(html_pages) if html_pages else None
+        self.latency = latency
+        self.request_count = 0
+        self.not_modified_count = 0
+        self._pages = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page_body(self, page_number: int) -> bytes:
+        """Mengembalikan isi halaman (di-cache) sebagai bytes.
+
+        Jika `html_pages` diberikan, halaman diambil bergiliran dari HTML tersebut
+        (misalnya file fixture) alih-alih dibuat oleh `render_page`.
+        """
+        if page_number not in self._pages:
+            if self.html_pages:
+                html = self.html_pages[(page_number - 1) % len(self.html_pages)]
+                html = html.decode("utf-8") if isinstance(html, bytes) else html
+            else:
+                html = render_page(page_number, self.total_pages, self.cards_per_page, self.pagination)
+            version = self._versions.get(page_number, 0)
+            if version:
+                html = html.replace("</body>", f"<!-- revisi {version} -->\n</body>")
+            self._pages[page_number] = html.encode("utf-8")
+        return self._pages[page_number]
+
+    def page_etag(self, page_number: int) -> str:
+        return f'"page{page_number}-v{self._versions.get(page_number, 0)}"'
+
+    def update_page(self, page_number: int):
+        """Menandai halaman berubah sehingga ETag lama tidak lagi valid."""
+        self._versions[page_number] = self._versions.get(page_number, 0) + 1
+        self._pages.pop(page_number, None)
+
+    def resolve(self, path: str):
+        """Mengubah path request menjadi nomor halaman, atau None jika tidak dikenal."""
+        path = path.split("?", 1)[0]
+        if path in ("", "/"):
+            return 1
+        if path.startswith("/page") and path[5:].isdigit():
+            page_number = int(path[5:])
+            if 1 < page_number <= self.total_pages:
+                return page_number
+        return None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                page_number = server.resolve(self.path)
+                if page_number is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                etag = server.page_etag(page_number)
+                if self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                body = server.page_body(page_number)
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
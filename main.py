@@ -1,43 +1,444 @@
 # Import Library dan Modular Code
+# Modul crawl (requests, bs4, asyncio) di-import di dalam fungsi mode yang memakainya,
+# sehingga `--help` dan subcommand transform/load tidak ikut memuatnya
+import argparse
+import sys
 import pandas as pd
-from utils.extract import scrape_fashion_products
-from utils.transform import clean_and_transform
-from utils.load import load_data
+from utils.transform import clean_and_transform, transform_batches, EXCHANGE_RATE
+from utils.load import load_data, load_batches, save_to_csv, close_analytics_stores, SINK_NAMES, OPTIONAL_SINKS
+from utils.reprocess import INPUT_KINDS, DEFAULT_CHUNKSIZE
+from utils import metrics, profiling
 
-def main():
+def main(sinks=SINK_NAMES, gsheets_mode='replace', resume=False, crawl_options=None, preview=True):
+    """Menjalankan seluruh ETL; mengembalikan True jika semua sink berhasil dimuat."""
+    from utils.checkpoint import CrawlCheckpoint
+    from utils.extract import scrape_fashion_products_frame
+
+    checkpoint = CrawlCheckpoint()
     try:
         print("Memulai proses ekstraksi data...")
-        extracted_data = scrape_fashion_products(total_pages=50)
-        if not extracted_data:
+        with metrics.timed('stage_duration_seconds', stage='extract'), profiling.stage('extract'):
+            df_raw = scrape_fashion_products_frame(checkpoint=checkpoint, resume=resume, **(crawl_options or {}))
+        if df_raw.empty:
             print("Tidak ada data yang berhasil diambil. Proses dihentikan.")
-            return
+            return False
 
-        df_raw = pd.DataFrame(extracted_data)
         print(f"Ekstraksi selesai. Jumlah data: {len(df_raw)}")
 
-        # Menampilakan informasi dan head data sebelum transformasi
-        print("\n=======Informasi Data Sebelum Transformasi:=======")
-        print(df_raw.info())
-        print("\n=======Data Head Sebelum Transformasi:=======")
-        print(df_raw.head())
+        if preview:
+            # Menampilakan informasi dan head data sebelum transformasi
+            print("\n=======Informasi Data Sebelum Transformasi:=======")
+            print(df_raw.info())
+            print("\n=======Data Head Sebelum Transformasi:=======")
+            print(df_raw.head())
 
         print("\nMemulai proses transformasi data...")
-        df_cleaned = clean_and_transform(df_raw)
+        with metrics.timed('stage_duration_seconds', stage='transform'), profiling.stage('transform'):
+            df_cleaned = clean_and_transform(df_raw)
         print(f"Transformasi selesai. Jumlah data setelah dibersihkan: {len(df_cleaned)}")
 
-        # Menampilkan informasi dan head data setelah transformasi
-        print("\n=======Informasi Data Setelah Transformasi:=======")
-        print(df_cleaned.info())
-        print("\n=======Data Head Setelah Transformasi:=======")
-        print(df_cleaned.head())
+        if preview:
+            # Menampilkan informasi dan head data setelah transformasi
+            print("\n=======Informasi Data Setelah Transformasi:=======")
+            print(df_cleaned.info())
+            print("\n=======Data Head Setelah Transformasi:=======")
+            print(df_cleaned.head())
 
-        print("\nMemulai proses load data ke storage (CSV, PostgreSQL, Google Sheets)...")
+        print(f"\nMemulai proses load data ke storage ({', '.join(sinks)})...")
 
-        load_data(df=df_cleaned)
+        with metrics.timed('stage_duration_seconds', stage='load'), profiling.stage('load'):
+            results = load_data(df=df_cleaned, sinks=sinks, gsheets_mode=gsheets_mode)
+        failed = [result["sink"] for result in results if not result["success"]]
+        if failed:
+            print(f"Proses ETL selesai dengan kegagalan pada sink: {', '.join(failed)}.")
+            return False
         print("Proses ETL selesai dengan sukses.")
+        return True
+
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses utama: {e}")
+        return False
+    finally:
+        checkpoint.close()
+
+def main_streaming(sinks=SINK_NAMES, resume=False, crawl_options=None):
+    """Menjalankan ETL per halaman: setiap batch langsung ditransformasi dan dimuat ke storage.
+
+    Mengembalikan True jika ada data yang dimuat dan semua sink berhasil.
+    """
+    from utils.checkpoint import CrawlCheckpoint
+    from utils.extract import iter_scrape_fashion_products
+
+    checkpoint = CrawlCheckpoint()
+    try:
+        print("Memulai proses ETL streaming (extract -> transform -> load per halaman)...")
+        batches = iter_scrape_fashion_products(checkpoint=checkpoint, resume=resume, **(crawl_options or {}))
+        results = []
+        with profiling.stage('streaming'):  # Tahap berjalan bergantian per halaman, diprofil sebagai satu kesatuan
+            total_rows = load_batches(transform_batches(batches), sinks=sinks, results=results)
+        failed = [result["sink"] for result in results if not result["success"]]
+        if failed:
+            print(f"Proses ETL streaming selesai dengan kegagalan pada sink: {', '.join(failed)}. "
+                  f"Jumlah data dimuat ke semua sink: {total_rows}")
+            return False
+        if not total_rows:
+            print("Tidak ada data yang berhasil dimuat. Storage tidak diubah.")
+            return False
+        print(f"Proses ETL streaming selesai dengan sukses. Jumlah data dimuat: {total_rows}")
+        return True
+
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses utama: {e}")
+        return False
+    finally:
+        checkpoint.close()
+
+def main_async(sinks=SINK_NAMES, crawl_options=None, queue_size=None, batch_rows=None):
+    """Menjalankan ETL dengan pipeline asyncio: fetch, parse, transform, dan load berjalan bersamaan.
+
+    `queue_size` dan `batch_rows` kosong berarti memakai default `utils.async_pipeline`.
+    Mengembalikan True jika ada data yang dimuat dan semua sink berhasil.
+    """
+    import asyncio
+    from utils.async_pipeline import run_async_pipeline, print_pipeline_report
+
+    try:
+        print("Memulai proses ETL asyncio (fetch -> parse -> transform -> load bersamaan)...")
+        crawl_options = {**(crawl_options or {})}
+        crawl_options["max_workers"] = crawl_options.get("max_workers") or 4
+        pipeline_options = {
+            name: value for name, value in (("queue_size", queue_size), ("batch_rows", batch_rows)) if value is not None
+        }
+        with profiling.stage('async'):
+            report = asyncio.run(run_async_pipeline(sinks=sinks, **pipeline_options, **crawl_options))
+        print_pipeline_report(report)
+        failed = [result["sink"] for result in report["sinks"] if not result["success"]]
+        if failed:
+            print(f"Proses ETL selesai dengan kegagalan pada sink: {', '.join(failed)}.")
+            return False
+        if not report["rows"]:
+            print("Tidak ada data yang berhasil dimuat.")
+            return False
+        print(f"Proses ETL asyncio selesai dengan sukses. Jumlah data dimuat: {report['rows']}")
+        return True
+
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses utama: {e}")
+        return False
+
+def main_incremental(sinks=('postgresql',), state_path='.state/products.sqlite', resume=False, crawl_options=None):
+    """Menjalankan ETL hanya untuk produk baru/berubah sejak run sebelumnya.
+
+    Produk yang fingerprint kontennya sama dengan run sebelumnya tidak ditransformasi
+    maupun dimuat ulang. Changeset dimuat ke PostgreSQL dengan mode upsert; sink yang
+    menimpa seluruh isi (CSV, Google Sheets) ditolak oleh CLI. Produk hanya dianggap
+    hilang dari katalog jika semua halaman berhasil diambil, dan hanya dilaporkan,
+    tidak dihapus dari tabel. Mengembalikan True jika changeset berhasil dimuat dan
+    state diperbarui.
+    """
+    from utils.checkpoint import CrawlCheckpoint
+    from utils.extract import scrape_fashion_products
+    from utils.state import ProductStateStore
+
+    state = ProductStateStore(state_path)
+    checkpoint = CrawlCheckpoint()
+    try:
+        print("Memulai proses ekstraksi data (mode incremental)...")
+        with profiling.stage('extract'):
+            extracted_data = scrape_fashion_products(checkpoint=checkpoint, resume=resume, **(crawl_options or {}))
+        if not extracted_data:
+            print("Tidak ada data yang berhasil diambil. Proses dihentikan.")
+            return False
+
+        failed_pages = checkpoint.failed_pages()
+        if failed_pages:
+            # Produk di halaman yang gagal tidak terlihat, bukan berarti hilang dari katalog
+            print(f"Crawl tidak lengkap ({len(failed_pages)} halaman gagal), deteksi produk hilang dilewati.")
+        changeset = state.compute_changeset(extracted_data, detect_removed=not failed_pages)
+        pending = changeset["new"] + changeset["changed"]
+        print(
+            f"Deteksi perubahan: {len(changeset['new'])} baru, {len(changeset['changed'])} berubah, "
+            f"{changeset['unchanged']} tidak berubah, {len(changeset['removed'])} hilang dari katalog."
+        )
+
+        if pending:
+            with profiling.stage('transform'):
+                df_cleaned = clean_and_transform(pd.DataFrame(pending))
+            print(f"Transformasi selesai. Jumlah data setelah dibersihkan: {len(df_cleaned)}")
+            with profiling.stage('load'):
+                results = load_data(df=df_cleaned, sinks=sinks, postgres_mode='upsert')
+            failed = [result["sink"] for result in results if not result["success"]]
+            if failed:
+                # State tidak diperbarui agar changeset yang sama dicoba lagi pada run berikutnya
+                print(f"Proses ETL gagal pada sink: {', '.join(failed)}. State tidak diperbarui.")
+                return False
+
+        stats = state.commit(changeset)
+        print(f"Proses ETL incremental selesai. {stats['skipped_ratio']:.0%} produk dilewati karena tidak berubah.")
+        return True
 
     except Exception as e:
         print(f"Terjadi kesalahan di proses utama: {e}")
+        return False
+    finally:
+        state.close()
+        checkpoint.close()
+
+def run_extract(output='raw_fashion_data.csv', resume=False, crawl_options=None):
+    """Hanya menjalankan tahap extract dan menyimpan data mentah ke CSV."""
+    from utils.checkpoint import CrawlCheckpoint
+    from utils.extract import scrape_fashion_products_frame
+
+    checkpoint = CrawlCheckpoint()
+    try:
+        print("Memulai proses ekstraksi data...")
+        with metrics.timed('stage_duration_seconds', stage='extract'), profiling.stage('extract'):
+            df_raw = scrape_fashion_products_frame(checkpoint=checkpoint, resume=resume, **(crawl_options or {}))
+        if df_raw.empty:
+            print("Tidak ada data yang berhasil diambil. Proses dihentikan.")
+            return False
+        print(f"Ekstraksi selesai. Jumlah data: {len(df_raw)}")
+        return save_to_csv(df_raw, output)
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses extract: {e}")
+        return False
+    finally:
+        checkpoint.close()
+
+def run_transform(input_path='raw_fashion_data.csv', output='cleaned_fashion_data.csv'):
+    """Hanya menjalankan tahap transform atas CSV mentah hasil `extract`."""
+    try:
+        # Semua kolom dibaca sebagai teks agar aturan pembersihan sama dengan data hasil scraping
+        df_raw = pd.read_csv(input_path, dtype=str, keep_default_na=False)
+        print(f"Memulai proses transformasi {len(df_raw)} baris dari {input_path}...")
+        with metrics.timed('stage_duration_seconds', stage='transform'), profiling.stage('transform'):
+            df_cleaned = clean_and_transform(df_raw)
+        if df_cleaned.empty:
+            print("Tidak ada data yang lolos transformasi. Proses dihentikan.")
+            return False
+        print(f"Transformasi selesai. Jumlah data setelah dibersihkan: {len(df_cleaned)}")
+        return save_to_csv(df_cleaned, output)
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses transform: {e}")
+        return False
+
+def run_load(input_path='cleaned_fashion_data.csv', sinks=SINK_NAMES, gsheets_mode='replace'):
+    """Hanya menjalankan tahap load atas CSV hasil `transform`; library sink di-import saat dipakai."""
+    try:
+        df_cleaned = pd.read_csv(input_path)
+        print(f"Memulai proses load {len(df_cleaned)} baris ke storage ({', '.join(sinks)})...")
+        with metrics.timed('stage_duration_seconds', stage='load'), profiling.stage('load'):
+            results = load_data(df=df_cleaned, sinks=sinks, gsheets_mode=gsheets_mode)
+        return all(result["success"] for result in results)
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses load: {e}")
+        return False
+
+def run_reprocess(input_paths, sinks=('csv',), kind='auto', exchange_rate=EXCHANGE_RATE, source_rate=EXCHANGE_RATE,
+                  chunksize=DEFAULT_CHUNKSIZE, workers=None, output='fashion_data.csv'):
+    """Memproses ulang CSV lama per chunk dengan aturan transformasi terbaru lalu memuatnya ke sink."""
+    from utils.reprocess import reprocess_csv
+
+    try:
+        with metrics.timed('stage_duration_seconds', stage='reprocess'), profiling.stage('reprocess'):
+            summary = reprocess_csv(
+                input_paths, sinks, kind, exchange_rate, source_rate, chunksize, workers,
+                sink_options={"filename_csv": output},
+            )
+        return bool(summary["rows_out"]) and all(result["success"] for result in summary["sinks"])
+    except Exception as e:
+        print(f"Terjadi kesalahan di proses reprocess: {e}")
+        return False
+
+def _add_sink_arguments(parser, suppress=False):
+    """Menambahkan --sinks dan --gsheets-mode; `suppress=True` untuk salinan di subcommand.
+
+    Default subparser menimpa nilai yang sudah diberikan sebelum nama subcommand,
+    sehingga salinan di subcommand memakai default SUPPRESS (atribut hanya diisi jika
+    opsinya benar-benar diberikan) dan default aslinya berasal dari parser utama.
+    """
+    parser.add_argument(
+        "--sinks", default=argparse.SUPPRESS if suppress else None,
+        help=f"Daftar sink dipisah koma (pilihan: {', '.join(SINK_NAMES + OPTIONAL_SINKS)}; "
+             "default: semua sink utama; --incremental hanya mendukung postgresql)"
+    )
+    parser.add_argument(
+        "--gsheets-mode", choices=("replace", "sync"), default=argparse.SUPPRESS if suppress else "replace",
+        help="'sync' hanya menulis baris yang berubah ke Google Sheets (hanya pipeline penuh dan subcommand load)"
+    )
+
+def _add_crawl_arguments(parser, suppress=False):
+    """Menambahkan opsi crawl (pipeline penuh dan subcommand extract); lihat `_add_sink_arguments` untuk `suppress`."""
+    def default(value):
+        return argparse.SUPPRESS if suppress else value
+
+    parser.add_argument(
+        "--pages", type=int, default=default(None),
+        help="Jumlah halaman yang di-scraping (default: dideteksi dari pagination halaman pertama)"
+    )
+    parser.add_argument(
+        "--base-url", default=default(None), help="URL halaman pertama katalog (default: katalog Fashion Studio)"
+    )
+    parser.add_argument(
+        "--url-template", default=default(None),
+        help="Template URL halaman ke-2 dan seterusnya, dengan placeholder {base_url} dan {page_number}"
+    )
+    parser.add_argument(
+        "--fetch-workers", type=int, default=default(None),
+        help="Jumlah thread fetch paralel (default: sekuensial dengan jeda antar halaman)"
+    )
+    parser.add_argument(
+        "--rps", type=float, default=default(None),
+        help="Batas request per detik ke situs untuk semua mode crawl (default: 0.5, sama dengan jeda 2 detik)"
+    )
+    parser.add_argument(
+        "--parse-workers", type=int, default=default(None),
+        help="Jumlah proses parser HTML (default: parsing di proses utama)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", default=default(False),
+        help="Lanjutkan crawl sebelumnya: halaman yang sudah selesai diambil dari checkpoint"
+    )
+
+def build_parser():
+    """Parser CLI: tanpa subcommand menjalankan seluruh pipeline, atau satu tahap lewat extract/transform/load."""
+    parser = argparse.ArgumentParser(description="Pipeline ETL produk Fashion Studio")
+    _add_crawl_arguments(parser)
+    parser.add_argument("--stream", action="store_true", help="Proses data per halaman dengan memori terbatas")
+    parser.add_argument(
+        "--async", dest="async_pipeline", action="store_true",
+        help="Jalankan fetch, parse, transform, dan load bersamaan dengan pipeline asyncio"
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=None,
+        help="Batas ukuran setiap antrean antar tahap pada mode --async (default: 8)"
+    )
+    parser.add_argument(
+        "--batch-rows", type=int, default=None,
+        help="Jumlah baris minimum per batch transform/load pada mode --async (default: 500)"
+    )
+    parser.add_argument(
+        "--no-preview", action="store_true",
+        help="Jangan tampilkan df.info() dan head() sebelum/sesudah transformasi"
+    )
+    parser.add_argument("--metrics-json", default=None, help="Path laporan metrik run dalam format JSON")
+    parser.add_argument(
+        "--metrics-prom", default=None,
+        help="Path file metrik format Prometheus (untuk textfile collector node_exporter)"
+    )
+    parser.add_argument(
+        "--profile", default=None,
+        help="Profiling per tahap: 'cpu', 'memory', atau 'cpu,memory' (default dari env ETL_PROFILE)"
+    )
+    parser.add_argument(
+        "--profile-dir", default=None,
+        help="Direktori hasil profiling (default dari env ETL_PROFILE_DIR atau 'profiles')"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Hanya transformasi dan upsert produk yang baru/berubah sejak run sebelumnya ke PostgreSQL; "
+             "produk yang hilang dari katalog hanya dilaporkan, tidak dihapus dari tabel"
+    )
+    _add_sink_arguments(parser)
+
+    commands = parser.add_subparsers(dest="command", metavar="{extract,transform,load,reprocess}")
+    extract = commands.add_parser("extract", help="Scraping saja, simpan data mentah ke CSV")
+    _add_crawl_arguments(extract, suppress=True)
+    extract.add_argument("--output", default="raw_fashion_data.csv", help="Path CSV data mentah")
+    transform = commands.add_parser("transform", help="Bersihkan CSV data mentah hasil extract")
+    transform.add_argument("--input", default="raw_fashion_data.csv", help="Path CSV data mentah")
+    transform.add_argument("--output", default="cleaned_fashion_data.csv", help="Path CSV data bersih")
+    load = commands.add_parser("load", help="Muat CSV data bersih ke sink terpilih")
+    load.add_argument("--input", default="cleaned_fashion_data.csv", help="Path CSV data bersih")
+    _add_sink_arguments(load, suppress=True)
+    reprocess = commands.add_parser(
+        "reprocess", help="Proses ulang CSV lama per chunk dengan aturan transformasi terbaru tanpa scraping ulang"
+    )
+    reprocess.add_argument("--input", nargs="+", required=True, help="Satu atau beberapa path CSV mentah/bersih")
+    reprocess.add_argument("--kind", choices=INPUT_KINDS, default="auto", help="Jenis CSV input (default: deteksi)")
+    reprocess.add_argument("--exchange-rate", type=float, default=EXCHANGE_RATE, help="Kurs dolar ke rupiah yang baru")
+    reprocess.add_argument(
+        "--source-rate", type=float, default=EXCHANGE_RATE,
+        help="Kurs yang dipakai saat CSV bersih dibuat (hanya untuk --kind cleaned)"
+    )
+    reprocess.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Jumlah baris per chunk")
+    reprocess.add_argument(
+        "--workers", type=int, default=None, help="Jumlah proses transformasi (default: di proses utama)"
+    )
+    reprocess.add_argument("--output", default="fashion_data.csv", help="Path CSV hasil untuk sink csv")
+    reprocess.add_argument(
+        "--sinks", default=argparse.SUPPRESS,
+        help=f"Daftar sink dipisah koma (pilihan: {', '.join(SINK_NAMES + OPTIONAL_SINKS)}; default: csv)"
+    )
+    return parser
+
+def cli(argv=None) -> int:
+    """Entry point CLI; mengembalikan exit code (1 jika tahap atau sink mana pun gagal)."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        modes = [flag for flag, enabled in (
+            ("--incremental", args.incremental), ("--async", args.async_pipeline), ("--stream", args.stream),
+        ) if enabled]
+        if len(modes) > 1:
+            parser.error(f"{' dan '.join(modes)} tidak dapat digabung; pilih salah satu mode")
+        if args.async_pipeline and args.resume:
+            parser.error("--resume tidak didukung bersama --async (pipeline asyncio tidak memakai checkpoint crawl)")
+        if modes and args.gsheets_mode == 'sync':
+            # Sync membandingkan seluruh isi sheet, hanya pipeline penuh yang memuat semua data sekaligus
+            parser.error(f"--gsheets-mode sync tidak didukung bersama {modes[0]} (sink ditulis per batch atau changeset)")
+    sinks = tuple(name.strip() for name in args.sinks.split(",") if name.strip()) if args.sinks else None
+    if args.command is None and args.incremental and sinks and set(sinks) - {'postgresql'}:
+        # Sink lain akan ditimpa hanya dengan changeset sehingga data lama hilang
+        parser.error("--incremental hanya mendukung sink postgresql (changeset dimuat dengan upsert)")
+    crawl_options = {
+        "total_pages": args.pages, "base_url": args.base_url, "url_template": args.url_template,
+        "max_workers": args.fetch_workers, "parse_workers": args.parse_workers, "requests_per_second": args.rps,
+    }
+    # Opsi yang tidak diberikan memakai default fungsi crawl
+    crawl_options = {key: value for key, value in crawl_options.items() if value is not None}
+    if args.metrics_json or args.metrics_prom:
+        metrics.start_run()
+    try:
+        profiling.start_profiling(args.profile, args.profile_dir)
+    except ValueError as e:
+        parser.error(str(e))
+    with metrics.timed('stage_duration_seconds', stage='total'):
+        if args.command == "extract":
+            succeeded = run_extract(args.output, resume=args.resume, crawl_options=crawl_options)
+        elif args.command == "transform":
+            succeeded = run_transform(args.input, args.output)
+        elif args.command == "load":
+            succeeded = run_load(args.input, sinks or SINK_NAMES, args.gsheets_mode)
+        elif args.command == "reprocess":
+            succeeded = run_reprocess(
+                args.input, sinks or ('csv',), args.kind, args.exchange_rate, args.source_rate, args.chunksize,
+                args.workers, args.output,
+            )
+        elif args.incremental:
+            succeeded = main_incremental(sinks or ('postgresql',), resume=args.resume, crawl_options=crawl_options)
+        elif args.async_pipeline:
+            succeeded = main_async(sinks or SINK_NAMES, crawl_options, args.queue_size, args.batch_rows)
+        elif args.stream:
+            succeeded = main_streaming(sinks or SINK_NAMES, resume=args.resume, crawl_options=crawl_options)
+        else:
+            succeeded = main(
+                sinks or SINK_NAMES, args.gsheets_mode, resume=args.resume, crawl_options=crawl_options,
+                preview=not args.no_preview,
+            )
+    close_analytics_stores()  # Agregat analitik run ini dihitung sekali di akhir
+    profiler = profiling.stop_profiling()
+    if profiler is not None:
+        print(f"[Profiling] {len(profiler.reports)} laporan disimpan di {profiler.run_dir}")
+    run = metrics.finish_run()
+    if run is not None:
+        if args.metrics_json:
+            run.write_json(args.metrics_json)
+            print(f"Laporan metrik disimpan ke {args.metrics_json}")
+        if args.metrics_prom:
+            run.write_prometheus(args.metrics_prom)
+            print(f"Metrik Prometheus disimpan ke {args.metrics_prom}")
+    return 0 if succeeded else 1
 
 if __name__ == '__main__':
-    main()
+    sys.exit(cli())
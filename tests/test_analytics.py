@@ -0,0 +1,133 @@
+import os
+import sqlite3
+import sys
+from datetime import datetime
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+# Menambahkan path agar bisa import utils
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.analytics import AnalyticsStore
+from utils.load import close_analytics_stores, load_batches, save_to_analytics_store
+
+
+def _cleaned(prices, gender="Men"):
+    return pd.DataFrame({
+        "Title": [f"Shirt {i}" for i in range(len(prices))],
+        "Price": [float(price) for price in prices],
+        "Rating": [4.0 + i / 10 for i in range(len(prices))],
+        "Colors": [3] * len(prices),
+        "Size": ["M"] * len(prices),
+        "Gender": [gender] * len(prices),
+        "Timestamp": ["2025-05-10T10:00:00"] * len(prices),
+    })
+
+
+@pytest.fixture(autouse=True)
+def _close_cached_stores():
+    yield
+    close_analytics_stores()
+
+
+@pytest.fixture
+def store(tmp_path):
+    analytics = AnalyticsStore(str(tmp_path / "data" / "analytics.sqlite"))
+    yield analytics
+    analytics.close()
+
+
+# Test setiap run ditambahkan tanpa menimpa run sebelumnya dan riwayat harga bisa dikueri
+def test_runs_are_appended_and_price_history(store):
+    store.append_run(_cleaned([100, 200]), datetime(2025, 5, 10))
+    store.append_run(_cleaned([110, 200]), datetime(2025, 5, 11))
+
+    runs = store.runs()
+    assert runs["rows"].tolist() == [2, 2]
+    history = store.price_history("Shirt 0")
+    assert history["Price"].tolist() == [100.0, 110.0]
+    assert history["run_at"].tolist() == ["2025-05-10T00:00:00", "2025-05-11T00:00:00"]
+    assert store.price_history("Shirt 0", gender="Women").empty
+
+
+# Test agregat per Gender/Size berisi distribusi harga dan rating per run
+def test_aggregates_per_segment(store):
+    frame = pd.concat([_cleaned([100, 200, 300]), _cleaned([50], gender="Women")], ignore_index=True)
+    run_id = store.append_run(frame, datetime(2025, 5, 10))
+
+    aggregates = store.aggregates(run_id).set_index("Gender")
+    assert aggregates.loc["Men", "products"] == 3
+    assert aggregates.loc["Men", "price_median"] == 200.0
+    assert aggregates.loc["Men", "price_p25"] == 150.0
+    assert aggregates.loc["Men", "rating_max"] == pytest.approx(4.2)
+    assert aggregates.loc["Women", "price_mean"] == 50.0
+    assert len(store.aggregates(gender="Women", size="M")) == 1
+
+
+# Test batch dengan run_at yang sama digabung ke satu run dan agregatnya dihitung ulang
+def test_batches_share_one_run(store):
+    run_at = datetime(2025, 5, 10)
+    first = store.append_run(_cleaned([100]), run_at)
+    second = store.append_run(_cleaned([300]), run_at)
+    assert first == second
+    assert store.runs()["rows"].tolist() == [2]
+    assert store.aggregates(first)["price_mean"].tolist() == [200.0]
+
+
+# Test price_changes hanya melaporkan produk yang harganya berubah dibanding run sebelumnya
+def test_price_changes_against_previous_run(store):
+    store.append_run(_cleaned([100, 200]), datetime(2025, 5, 10))
+    store.append_run(_cleaned([120, 200]), datetime(2025, 5, 11))
+    changes = store.price_changes()
+    assert changes[["Title", "old_price", "new_price", "change"]].values.tolist() == [["Shirt 0", 100.0, 120.0, 20.0]]
+
+
+# Test sink analytics pada load_batches menyimpan semua batch sebagai satu run
+def test_analytics_sink_in_load_batches(tmp_path):
+    path = str(tmp_path / "analytics.sqlite")
+    loaded = load_batches([_cleaned([100]), _cleaned([200])], sinks=("analytics",), analytics_path=path)
+    assert loaded == 2
+    assert save_to_analytics_store(_cleaned([150]), path)
+
+    store = AnalyticsStore(path)
+    try:
+        assert store.runs()["rows"].tolist() == [2, 1]
+    finally:
+        store.close()
+
+
+# Test sink analytics memakai satu store per run dan agregat dihitung sekali, bukan per batch
+def test_analytics_batches_reuse_store_and_refresh_once(tmp_path):
+    path = str(tmp_path / "analytics.sqlite")
+    batches = [_cleaned([100 + i]) for i in range(5)]
+    with patch("utils.load.AnalyticsStore", wraps=AnalyticsStore) as mock_store, \
+            patch.object(AnalyticsStore, "_refresh_aggregates", autospec=True,
+                         side_effect=AnalyticsStore._refresh_aggregates) as mock_refresh:
+        assert load_batches(batches, sinks=("analytics",), analytics_path=path) == 5
+        assert mock_store.call_count == 1
+        assert mock_refresh.call_count == 0
+        close_analytics_stores()
+        assert mock_refresh.call_count == 1
+
+    store = AnalyticsStore(path)
+    try:
+        assert store.runs()["rows"].tolist() == [5]
+        assert store.aggregates()["price_mean"].tolist() == [102.0]
+    finally:
+        store.close()
+
+
+# Test file analitik dari skema lama (tanpa penanda agregat usang) tetap bisa dibuka
+def test_store_migrates_old_runs_table(tmp_path):
+    path = str(tmp_path / "analytics.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE runs (run_id INTEGER PRIMARY KEY AUTOINCREMENT, run_at TEXT NOT NULL UNIQUE, "
+                 "rows INTEGER NOT NULL DEFAULT 0)")
+    conn.close()
+    store = AnalyticsStore(path)
+    try:
+        run_id = store.append_run(_cleaned([100, 300]), datetime(2025, 5, 10))
+        assert store.aggregates(run_id)["price_median"].tolist() == [200.0]
+    finally:
+        store.close()
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+import pandas as pd
+
+# Menambahkan path agar bisa import utils dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.async_pipeline import run_async_pipeline
+from utils.load import save_to_csv
+from benchmarks.stub_server import StubCatalogServer
+
+
+def _run(server, tmp_path, **options):
+    sink_options = {"filename_csv": str(tmp_path / "fashion.csv")}
+    return asyncio.run(run_async_pipeline(
+        base_url=server.base_url, sinks=("csv",), sink_options=sink_options, **{"delay": 0, **options}
+    ))
+
+
+# Test pipeline asyncio memuat semua baris bersih ke sink dan melaporkan statistik tahap/antrean
+def test_async_pipeline_loads_all_rows(tmp_path):
+    with StubCatalogServer(total_pages=4, cards_per_page=20, latency=0) as server:
+        report = _run(server, tmp_path, batch_rows=30)
+
+    df = pd.read_csv(tmp_path / "fashion.csv")
+    assert report["rows"] == len(df) == 76
+    assert report["sinks"] == [{"sink": "csv", "success": True, "rows": 76, "duration": report["sinks"][0]["duration"],
+                                "error": None, "timed_out": False}]
+    assert report["stages"]["parse"]["items"] == 4
+    assert report["stages"]["load_csv"]["items"] == report["stages"]["transform"]["items"]
+    assert 0 <= report["stages"]["fetch"]["utilization"] <= 1
+    assert set(report["queues"]) == {"html", "rows", "sink_csv"}
+
+
+# Test sink yang lambat menahan tahap sebelumnya tanpa antrean melebihi batasnya
+def test_async_pipeline_backpressure_from_slow_sink(tmp_path):
+    def slow_save(*args, **kwargs):
+        time.sleep(0.05)
+        return save_to_csv(*args, **kwargs)
+
+    with StubCatalogServer(total_pages=12, cards_per_page=20, latency=0) as server:
+        with patch("utils.load.save_to_csv", side_effect=slow_save):
+            report = _run(server, tmp_path, batch_rows=1, queue_size=2)
+
+    assert report["rows"] == len(pd.read_csv(tmp_path / "fashion.csv"))
+    assert all(queue["max_depth"] <= queue["maxsize"] for queue in report["queues"].values())
+    assert report["queues"]["sink_csv"]["max_depth"] >= 1
+    assert report["stages"]["transform"]["blocked_seconds"] > 0
+
+
+# Test halaman yang gagal diambil dilewati dan dicatat tanpa menghentikan pipeline
+def test_async_pipeline_skips_failed_pages(tmp_path):
+    with StubCatalogServer(total_pages=3, cards_per_page=20, latency=0) as server:
+        report = _run(server, tmp_path, total_pages=5, retries=0)
+    assert report["failed_pages"] == [4, 5]
+    assert report["rows"] == 57
+
+
+# Test sink yang melewati timeout dilaporkan gagal dan dilewati pada batch berikutnya
+def test_async_pipeline_applies_sink_timeouts(tmp_path):
+    release = threading.Event()
+    calls = []
+
+    def stuck_save(*args, **kwargs):
+        calls.append(kwargs.get("append"))
+        release.wait(5)
+        return True
+
+    with StubCatalogServer(total_pages=3, cards_per_page=20, latency=0) as server:
+        with patch("utils.load.save_to_csv", side_effect=stuck_save):
+            report = _run(server, tmp_path, batch_rows=1, timeouts={"csv": 0.1})
+    release.set()
+
+    assert calls == [False]
+    [result] = report["sinks"]
+    assert not result["success"] and result["timed_out"] and result["rows"] == 0
+    assert report["stages"]["transform"]["items"] == 3
@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import pytest
+from unittest.mock import patch
+
+# Menambahkan path agar bisa import utils dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.cache import ResponseCache
+from utils.extract import scrape_fashion_products, parse_page
+from benchmarks.stub_server import StubCatalogServer
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60, max_bytes=1000)
+    yield response_cache
+    response_cache.close()
+
+
+def _without_timestamp(rows):
+    return [{key: value for key, value in row.items() if key != "Timestamp"} for row in rows]
+
+
+# Test header conditional GET dibentuk dari validator yang tersimpan
+def test_conditional_headers(cache):
+    assert cache.conditional_headers("http://x/") == {}
+    cache.store("http://x/", b"body", etag='"abc"', last_modified="Mon, 12 May 2025 10:00:00 GMT")
+    assert cache.conditional_headers("http://x/") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 12 May 2025 10:00:00 GMT",
+    }
+
+
+# Test respons tanpa validator tidak disimpan
+def test_store_without_validators_is_skipped(cache):
+    cache.store("http://x/", b"body")
+    assert "http://x/" not in cache
+
+
+# Test entri kedaluwarsa setelah TTL terlewati
+def test_entry_expires_after_ttl(cache):
+    cache.store("http://x/", b"body", etag='"abc"')
+    with patch("utils.cache.time.time", return_value=time.time() + 120):
+        assert cache.conditional_headers("http://x/") == {}
+    assert "http://x/" not in cache
+
+
+# Test eviksi LRU ketika total ukuran melebihi max_bytes
+def test_eviction_is_size_bounded(cache):
+    cache.store("http://x/1", b"a" * 400, etag='"1"')
+    cache.store("http://x/2", b"b" * 400, etag='"2"')
+    cache.get_body("http://x/1")  # halaman 1 menjadi yang terbaru diakses
+    cache.store("http://x/3", b"c" * 400, etag='"3"')
+    assert "http://x/1" in cache
+    assert "http://x/2" not in cache
+    assert "http://x/3" in cache
+    assert cache.total_size() <= 1000
+
+
+# Test run kedua memakai 304 sehingga download dan parsing dilewati
+def test_scrape_with_cache_skips_unchanged_pages(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    with StubCatalogServer(total_pages=3, latency=0) as server:
+        first = scrape_fashion_products(3, delay=0, base_url=server.base_url, cache=response_cache)
+        server.update_page(2)
+        with patch("utils.extract.parse_page", wraps=parse_page) as mock_parse:
+            second = scrape_fashion_products(3, delay=0, base_url=server.base_url, cache=response_cache)
+        assert server.not_modified_count == 2
+    response_cache.close()
+
+    assert mock_parse.call_count == 1  # hanya halaman 2 yang berubah
+    assert len(first) == 60
+    assert _without_timestamp(first) == _without_timestamp(second)
+
+
+# Test deteksi jumlah halaman dengan cache tidak meminta halaman pertama dua kali
+def test_discovery_with_cache_requests_first_page_once(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    with StubCatalogServer(total_pages=3, cards_per_page=2, latency=0) as server:
+        first = scrape_fashion_products(delay=0, base_url=server.base_url, cache=response_cache)
+        assert server.request_count == 3
+        with patch("utils.extract.parse_page", wraps=parse_page) as mock_parse:
+            second = scrape_fashion_products(delay=0, base_url=server.base_url, cache=response_cache)
+        assert server.request_count == 6
+        assert server.not_modified_count == 3
+    response_cache.close()
+
+    assert mock_parse.call_count == 0  # Produk halaman pertama (304) diambil dari cache
+    assert len(first) == 6
+    assert _without_timestamp(first) == _without_timestamp(second)
+
+
+# Test 304 dengan body cache yang hilang/rusak diulang tanpa header conditional
+def test_not_modified_with_missing_body_refetches(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    with StubCatalogServer(total_pages=3, cards_per_page=2, latency=0) as server:
+        first = scrape_fashion_products(3, delay=0, base_url=server.base_url, cache=response_cache)
+        with response_cache._conn:
+            response_cache._conn.execute("UPDATE responses SET body = x'', rows = NULL")
+        second = scrape_fashion_products(3, delay=0, base_url=server.base_url, cache=response_cache)
+        assert server.not_modified_count == 3
+        assert server.request_count == 9
+    assert response_cache.get_body(server.base_url)
+    response_cache.close()
+
+    assert _without_timestamp(first) == _without_timestamp(second)
@@ -0,0 +1,83 @@
+import os
+import sys
+from datetime import datetime
+import pytest
+from unittest.mock import patch
+
+# Menambahkan path agar bisa import utils
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.checkpoint import CrawlCheckpoint
+from utils.extract import scrape_fashion_products
+
+BASE_URL = 'http://localhost/'
+
+
+def _page(url):
+    title = url.rsplit('/', 1)[-1] or 'page1'
+    return f'<div class="collection-card"><div class="product-details"><h3 class="product-title">{title}</h3></div></div>'.encode()
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    store = CrawlCheckpoint(str(tmp_path / "state" / "checkpoint.sqlite"))
+    yield store
+    store.close()
+
+
+# Test status halaman dan produk (termasuk Timestamp) tersimpan dan bisa dibaca kembali
+def test_checkpoint_roundtrip(checkpoint):
+    timestamp = datetime(2025, 5, 1, 12, 30)
+    checkpoint.mark_done(1, [{"Title": "A", "Timestamp": timestamp}])
+    checkpoint.mark_failed(2)
+    assert checkpoint.completed_pages() == [1]
+    assert checkpoint.failed_pages() == [2]
+    assert checkpoint.load_rows(1) == [{"Title": "A", "Timestamp": timestamp}]
+    assert checkpoint.load_rows(2) == []
+
+    checkpoint.reset()
+    assert checkpoint.completed_pages() == [] and checkpoint.failed_pages() == []
+
+
+# Test halaman gagal masuk antrean retry, crawl tetap lanjut, dan hasil tetap sesuai urutan halaman
+@patch('utils.extract.fetching_content')
+def test_failed_page_is_retried_instead_of_stopping(mock_fetch, checkpoint):
+    failures = {'page3': 1}
+
+    def fake_fetch(url, **kwargs):
+        name = url.rsplit('/', 1)[-1]
+        if failures.get(name):
+            failures[name] -= 1
+            return None
+        return _page(url)
+
+    mock_fetch.side_effect = fake_fetch
+    data = scrape_fashion_products(5, delay=0, base_url=BASE_URL, checkpoint=checkpoint)
+    assert [row['Title'] for row in data] == ['page1', 'page2', 'page3', 'page4', 'page5']
+    assert checkpoint.completed_pages() == [1, 2, 3, 4, 5]
+
+
+# Test resume hanya mengambil halaman yang belum selesai, sisanya dari checkpoint
+@patch('utils.extract.fetching_content')
+def test_resume_skips_completed_pages(mock_fetch, checkpoint):
+    mock_fetch.side_effect = lambda url, **kwargs: None if url.endswith('page3') else _page(url)
+    first = scrape_fashion_products(4, delay=0, base_url=BASE_URL, checkpoint=checkpoint, page_retries=0)
+    assert [row['Title'] for row in first] == ['page1', 'page2', 'page4']
+    assert checkpoint.failed_pages() == [3]
+
+    mock_fetch.reset_mock()
+    mock_fetch.side_effect = lambda url, **kwargs: _page(url)
+    resumed = scrape_fashion_products(4, max_workers=2, delay=0, base_url=BASE_URL, checkpoint=checkpoint, resume=True)
+    assert [call.args[0] for call in mock_fetch.call_args_list] == [BASE_URL + 'page3']
+    assert [row['Title'] for row in resumed] == ['page1', 'page2', 'page3', 'page4']
+    assert checkpoint.failed_pages() == []
+
+
+# Test tanpa resume, checkpoint lama direset dan semua halaman diambil ulang
+@patch('utils.extract.fetching_content')
+def test_run_without_resume_starts_fresh(mock_fetch, checkpoint):
+    checkpoint.mark_done(1, [{"Title": "stale"}])
+    mock_fetch.side_effect = lambda url, **kwargs: _page(url)
+    data = scrape_fashion_products(2, delay=0, base_url=BASE_URL, checkpoint=checkpoint)
+    assert [row['Title'] for row in data] == ['page1', 'page2']
+    assert mock_fetch.call_count == 2
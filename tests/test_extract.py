@@ -1,12 +1,17 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 import sys
 import os
 
 # Menambahkan direktori parent ke dalam path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from utils.extract import fetching_content, extract_clean_text, extract_product_data, scrape_fashion_products, HEADERS
+from utils.extract import (
+    fetching_content, extract_clean_text, extract_product_data, scrape_fashion_products, HEADERS,
+    build_page_url, RateLimiter, iter_scrape_fashion_products, DEFAULT_TIMEOUT, DEFAULT_RETRIES, summarize_fetch_stats,
+    parse_total_pages, discover_total_pages, parse_page, parse_pages_parallel, polite_requests_per_second
+)
+from benchmarks.stub_server import StubCatalogServer
 from bs4 import BeautifulSoup
 from datetime import datetime
 import requests
@@ -14,28 +19,72 @@ import time
 
 class TestExtractFunctions(unittest.TestCase):
 
-    @patch('utils.extract.requests.get')
-    def test_fetching_content_returns_content_on_success(self, mock_get):
+    @patch('utils.extract.get_session')
+    def test_fetching_content_returns_content_on_success(self, mock_get_session):
         """Uji untuk memastikan fetching_content mengembalikan konten saat respon HTTP sukses (status code 200)."""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.content = b"<html><body>Test Content</body></html>"
+        mock_get = mock_get_session.return_value.get
         mock_get.return_value = mock_response
         url = "http://example.com"
         content = fetching_content(url)
         self.assertEqual(content, b"<html><body>Test Content</body></html>")
-        mock_get.assert_called_once_with(url, headers=HEADERS)
+        mock_get.assert_called_once_with(url, headers=HEADERS, timeout=DEFAULT_TIMEOUT)
 
-    @patch('utils.extract.requests.get')
-    def test_fetching_content_returns_none_on_failure(self, mock_get):
+    @patch('utils.extract.get_session')
+    def test_fetching_content_returns_none_on_failure(self, mock_get_session):
         """Uji untuk memastikan fetching_content mengembalikan None saat permintaan HTTP gagal (RequestException)."""
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = requests.exceptions.RequestException("HTTP Error")
+        mock_get = mock_get_session.return_value.get
         mock_get.return_value = mock_response
         url = "http://example.com/error"
         content = fetching_content(url)
         self.assertIsNone(content)
-        mock_get.assert_called_once_with(url, headers=HEADERS)
+        mock_get.assert_called_once_with(url, headers=HEADERS, timeout=DEFAULT_TIMEOUT)
+
+    @patch('utils.extract.time.sleep')
+    def test_fetching_content_retries_on_server_error(self, mock_sleep):
+        """Uji untuk memastikan fetching_content mengulang request pada status 503 dengan backoff eksponensial."""
+        failed = MagicMock(status_code=503, headers={})
+        success = MagicMock(status_code=200, content=b"ok")
+        session = MagicMock()
+        session.get.side_effect = [failed, failed, success]
+        stats = []
+        content = fetching_content("http://example.com", session=session, backoff_factor=0.5, stats=stats)
+        self.assertEqual(content, b"ok")
+        self.assertEqual(session.get.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+        self.assertEqual(stats[0]["retries"], 2)
+        self.assertEqual(stats[0]["status"], 200)
+
+    @patch('utils.extract.time.sleep')
+    def test_fetching_content_gives_up_after_connection_errors(self, mock_sleep):
+        """Uji untuk memastikan fetching_content mengembalikan None setelah retry koneksi habis."""
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError("reset")
+        stats = []
+        content = fetching_content("http://example.com", session=session, retries=2, stats=stats)
+        self.assertIsNone(content)
+        self.assertEqual(session.get.call_count, 3)
+        self.assertEqual(stats[0]["retries"], 2)
+        self.assertIsNone(stats[0]["status"])
+
+    def test_summarize_fetch_stats(self):
+        """Uji untuk memastikan ringkasan stats menghitung retry, kegagalan, dan latensi."""
+        stats = [
+            {"url": "a", "status": 200, "latency": 0.1, "retries": 0, "bytes": 10},
+            {"url": "b", "status": 200, "latency": 0.3, "retries": 2, "bytes": 20},
+            {"url": "c", "status": None, "latency": 0.2, "retries": 3, "bytes": 0},
+        ]
+        summary = summarize_fetch_stats(stats)
+        self.assertEqual(summary["requests"], 3)
+        self.assertEqual(summary["retries"], 5)
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(summary["bytes"], 30)
+        self.assertAlmostEqual(summary["latency_mean"], 0.2)
+        self.assertEqual(summary["latency_max"], 0.3)
 
     def test_extract_clean_text_finds_text(self):
         """Uji untuk memastikan extract_clean_text berhasil mengekstrak teks yang sesuai jika ditemukan."""
@@ -150,10 +199,131 @@ class TestExtractFunctions(unittest.TestCase):
             data = scrape_fashion_products(1, delay=0.1)
             self.assertEqual(len(data), 1)
             self.assertEqual(data[0]['Title'], "Test")
-            mock_fetch.assert_called_once_with('https://fashion-studio.dicoding.dev/')
+            mock_fetch.assert_called_once_with(
+                'https://fashion-studio.dicoding.dev/',
+                session=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, stats=ANY
+            )
             mock_extract.assert_called_once()
             mock_sleep.assert_called_once_with(0.1)
 
+    def test_build_page_url(self):
+        """Uji untuk memastikan URL halaman pertama dan berikutnya dibentuk dengan benar."""
+        self.assertEqual(build_page_url(1), 'https://fashion-studio.dicoding.dev/')
+        self.assertEqual(build_page_url(7, 'http://localhost/'), 'http://localhost/page7')
+        self.assertEqual(
+            build_page_url(3, 'http://shop/', '{base_url}catalog?page={page_number}'), 'http://shop/catalog?page=3'
+        )
+
+    def test_parse_total_pages_from_pagination_markup(self):
+        """Uji untuk memastikan jumlah halaman dibaca dari teks "Page X of N" atau link pagination."""
+        fixture = os.path.join(os.path.dirname(__file__), 'fixtures', 'catalog_page1.html')
+        with open(fixture, 'rb') as f:
+            self.assertEqual(parse_total_pages(f.read()), (50, True))
+        links = '<a href="/page2">2</a><a href="/page7">7</a><a href="/about">About</a>'
+        self.assertEqual(parse_total_pages(links), (7, False))
+        query_links = '<a href="/catalog?page=4">4</a>'
+        self.assertEqual(parse_total_pages(query_links, '{base_url}catalog?page={page_number}'), (4, False))
+        self.assertEqual(parse_total_pages('<div class="collection-card"></div>'), (None, False))
+
+    def test_scrape_discovers_page_count_without_refetching_first_page(self):
+        """Uji untuk memastikan total_pages=None mendeteksi jumlah halaman dan hanya meminta halaman yang ada."""
+        with StubCatalogServer(total_pages=3, cards_per_page=2, latency=0) as server:
+            data = scrape_fashion_products(delay=0, base_url=server.base_url)
+            self.assertEqual(len(data), 6)
+            self.assertEqual(server.request_count, 3)
+
+    def test_discover_total_pages_probes_without_markup(self):
+        """Uji untuk memastikan probe menemukan halaman terakhir jika pagination tidak tersedia."""
+        with StubCatalogServer(total_pages=13, cards_per_page=1, latency=0, pagination=False) as server:
+            fetch_options = {"retries": 0}
+            self.assertEqual(discover_total_pages(server.base_url, fetch_options=fetch_options), 13)
+            self.assertEqual(discover_total_pages(server.base_url, fetch_options=fetch_options, max_pages=5), 5)
+
+    @patch('utils.extract.fetching_content')
+    def test_scrape_fashion_products_concurrent_keeps_page_order(self, mock_fetch):
+        """Uji untuk memastikan mode paralel mengembalikan produk sesuai urutan halaman."""
+        def fake_fetch(url, **kwargs):
+            time.sleep(0.01 if url.endswith('/') else 0)  # halaman 1 selesai paling akhir
+            title = url.rsplit('/', 1)[-1] or 'page1'
+            return f"""
+                <div class="collection-card">
+                    <div class="product-details"><h3 class="product-title">{title}</h3></div>
+                </div>
+            """.encode()
+        mock_fetch.side_effect = fake_fetch
+        data = scrape_fashion_products(4, max_workers=4, delay=0, base_url='http://localhost/')
+        self.assertEqual([row['Title'] for row in data], ['page1', 'page2', 'page3', 'page4'])
+
+    @patch('utils.extract.fetching_content')
+    def test_scrape_fashion_products_concurrent_stops_at_failed_page(self, mock_fetch):
+        """Uji untuk memastikan mode paralel berhenti pada halaman gagal seperti jalur sekuensial."""
+        card = b'<div class="collection-card"><h3 class="product-title">X</h3></div>'
+        mock_fetch.side_effect = lambda url, **kwargs: None if url.endswith('page3') else card
+        data = scrape_fashion_products(5, max_workers=2, delay=0, base_url='http://localhost/')
+        self.assertEqual(len(data), 2)
+
+    @patch('utils.extract.fetching_content')
+    def test_concurrent_scrape_is_rate_limited_by_default(self, mock_fetch):
+        """Uji untuk memastikan mode paralel tanpa requests_per_second dibatasi 1/delay request per detik."""
+        mock_fetch.return_value = b'<div class="collection-card"><h3 class="product-title">X</h3></div>'
+        start = time.monotonic()
+        scrape_fashion_products(4, max_workers=4, delay=0.05, base_url='http://localhost/')
+        self.assertGreaterEqual(time.monotonic() - start, 3 * 0.05 - 0.005)
+        self.assertEqual(polite_requests_per_second(None, 2), 0.5)
+        self.assertEqual(polite_requests_per_second(5, 2), 5)
+        self.assertIsNone(polite_requests_per_second(None, 0))
+
+    def test_rate_limiter_spaces_requests(self):
+        """Uji untuk memastikan RateLimiter memberi jarak minimal antar request."""
+        limiter = RateLimiter(requests_per_second=50)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 50 - 0.005)
+
+    @patch('utils.extract.fetching_content')
+    def test_iter_scrape_fashion_products_yields_per_page(self, mock_fetch):
+        """Uji untuk memastikan generator menghasilkan batch per halaman sebelum halaman berikutnya diambil."""
+        mock_fetch.return_value = b'<div class="collection-card"><h3 class="product-title">X</h3></div>'
+        batches = iter_scrape_fashion_products(3, delay=0, base_url='http://localhost/')
+        first = next(batches)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertEqual(len(list(batches)), 2)
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    @patch('utils.extract.fetching_content')
+    def test_iter_scrape_concurrent_bounds_pages_in_flight(self, mock_fetch):
+        """Uji untuk memastikan mode paralel hanya mengambil halaman sebanyak jendela in-flight saat konsumen berhenti."""
+        mock_fetch.return_value = b'<div class="collection-card"><h3 class="product-title">X</h3></div>'
+        batches = iter_scrape_fashion_products(50, max_workers=2, delay=0, base_url='http://localhost/')
+        next(batches)
+        time.sleep(0.1)
+        self.assertLessEqual(mock_fetch.call_count, 5)  # 2 * max_workers dan satu halaman pengganti
+        self.assertEqual(len(list(batches)), 49)
+        self.assertEqual(mock_fetch.call_count, 50)
+
+    def test_scrape_with_parse_workers_matches_sequential(self):
+        """Uji untuk memastikan pipeline fetch thread -> parse proses menghasilkan data yang sama sesuai urutan."""
+        def without_timestamp(rows):
+            return [{key: value for key, value in row.items() if key != 'Timestamp'} for row in rows]
+
+        with StubCatalogServer(total_pages=6, cards_per_page=3, latency=0) as server:
+            sequential = scrape_fashion_products(6, delay=0, base_url=server.base_url)
+            pipelined = scrape_fashion_products(6, max_workers=3, parse_workers=2, delay=0, base_url=server.base_url)
+        self.assertEqual(len(pipelined), 18)
+        self.assertEqual(without_timestamp(pipelined), without_timestamp(sequential))
+
+    def test_parse_pages_parallel_keeps_page_order(self):
+        """Uji untuk memastikan parse_pages_parallel mengembalikan hasil per halaman sesuai urutan input."""
+        pages = [
+            f'<div class="collection-card"><div class="product-details"><h3 class="product-title">P{i}</h3></div></div>'
+            for i in range(1, 7)
+        ]
+        results = list(parse_pages_parallel(pages, parse_workers=2))
+        self.assertEqual([rows[0]['Title'] for rows in results], [f'P{i}' for i in range(1, 7)])
+        self.assertEqual(results[0][0]['Rating'], parse_page(pages[0], 1)[0]['Rating'])
+
 
 if __name__ == '__main__':
     unittest.main()
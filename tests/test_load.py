@@ -1,18 +1,38 @@
 import pytest
 import pandas as pd
+from datetime import datetime
+from sqlalchemy import create_engine, inspect
 from unittest.mock import patch, MagicMock
 import sys
 import os
+import threading
 
-# Menambahkan path agar bisa import utils
+# Menambahkan path agar bisa import utils dan benchmarks
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from utils.load import (
     save_to_csv,
     save_to_postgresql,
     save_to_google_spreadsheet,
-    load_data
+    load_data,
+    load_batches,
+    copy_insert,
+    get_engine,
+    dispose_engines,
+    run_sinks,
+    save_to_parquet,
+    read_parquet_data,
+    sync_google_spreadsheet
 )
+from benchmarks.fake_sheets import FakeSheetsService
+from benchmarks.bench_import_time import TARGETS, forbidden_imports, measure_import
+
+# Engine di-cache per URL; dikosongkan agar mock tidak terbawa antar test
+@pytest.fixture(autouse=True)
+def clear_engine_cache():
+    dispose_engines()
+    yield
+    dispose_engines()
 
 # Fixture DataFrame
 @pytest.fixture
@@ -51,7 +71,7 @@ def test_save_to_csv_exception(mock_to_csv, capsys, sample_dataframe):
     assert "[CSV Error] Gagal menyimpan data ke CSV: Disk penuh" in captured.out
 
 # Test Fungsi save_to_postgresql (normal)
-@patch("utils.load.create_engine")
+@patch("sqlalchemy.create_engine")
 def test_save_to_postgresql(mock_create_engine, sample_dataframe):
     mock_engine = MagicMock()
     mock_create_engine.return_value = mock_engine
@@ -68,7 +88,7 @@ def test_save_to_postgresql(mock_create_engine, sample_dataframe):
     sample_dataframe.to_sql.assert_called_once_with("fashion_products", mock_engine, index=False, if_exists="replace")
 
 # Test Fungsi save_to_postgresql (exception)
-@patch("utils.load.create_engine", side_effect=Exception("Connection failed"))
+@patch("sqlalchemy.create_engine", side_effect=Exception("Connection failed"))
 def test_save_to_postgresql_exception(mock_create_engine, sample_dataframe, capsys):
     save_to_postgresql(
         df=sample_dataframe,
@@ -80,8 +100,8 @@ def test_save_to_postgresql_exception(mock_create_engine, sample_dataframe, caps
     assert "[PostgreSQL Error]" in captured.out
 
 # Test Fungsi save_to_google_spreadsheet (normal)
-@patch("utils.load.Credentials.from_service_account_file")
-@patch("utils.load.build")
+@patch("google.oauth2.service_account.Credentials.from_service_account_file")
+@patch("googleapiclient.discovery.build")
 def test_save_to_google_spreadsheet(mock_build, mock_creds, sample_dataframe):
     mock_service = MagicMock()
     mock_spreadsheets = MagicMock()
@@ -107,7 +127,7 @@ def test_save_to_google_spreadsheet(mock_build, mock_creds, sample_dataframe):
     assert mock_values.update.called
 
 # Test Fungsi save_to_google_spreadsheet (exception)
-@patch("utils.load.Credentials.from_service_account_file", side_effect=Exception("Invalid credentials"))
+@patch("google.oauth2.service_account.Credentials.from_service_account_file", side_effect=Exception("Invalid credentials"))
 def test_save_to_google_spreadsheet_exception(mock_creds, sample_dataframe, capsys):
     save_to_google_spreadsheet(
         df=sample_dataframe,
@@ -127,3 +147,303 @@ def test_load_data(mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
     mock_csv.assert_called_once()
     mock_postgres.assert_called_once()
     mock_gsheet.assert_called_once()
+
+# Test save_to_csv mode append tidak menulis header ulang
+def test_save_to_csv_append(tmp_path, sample_dataframe):
+    file_path = tmp_path / "test_fashion.csv"
+    save_to_csv(sample_dataframe, filename=str(file_path))
+    save_to_csv(sample_dataframe, filename=str(file_path), append=True)
+
+    df_read = pd.read_csv(file_path)
+    assert len(df_read) == 2
+    assert list(df_read.columns) == list(sample_dataframe.columns)
+
+# Test save_to_google_spreadsheet mode append memakai values().append tanpa clear
+@patch("google.oauth2.service_account.Credentials.from_service_account_file")
+@patch("googleapiclient.discovery.build")
+def test_save_to_google_spreadsheet_append(mock_build, mock_creds, sample_dataframe):
+    mock_values = mock_build.return_value.spreadsheets.return_value.values.return_value
+
+    save_to_google_spreadsheet(
+        df=sample_dataframe,
+        spreadsheet_id="fake_id",
+        range_name="Sheet1!A1",
+        credential_file="fake_credential.json",
+        append=True
+    )
+
+    assert not mock_values.clear.called
+    body = mock_values.append.call_args.kwargs["body"]
+    assert body["values"] == sample_dataframe.values.tolist()
+
+# Test load_batches: batch pertama mengganti isi storage, batch berikutnya append
+@patch("utils.load.save_to_csv")
+@patch("utils.load.save_to_postgresql")
+@patch("utils.load.save_to_google_spreadsheet")
+def test_load_batches(mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
+    total = load_batches(iter([sample_dataframe, sample_dataframe, sample_dataframe]))
+
+    assert total == 3
+    assert [c.kwargs["append"] for c in mock_csv.call_args_list] == [False, True, True]
+    assert [c.kwargs["if_exists"] for c in mock_postgres.call_args_list] == ["replace", "append", "append"]
+    assert [c.kwargs["append"] for c in mock_gsheet.call_args_list] == [False, True, True]
+
+# Test load_batches melaporkan sink yang gagal dan tidak menghitung batch yang gagal dimuat
+@patch("utils.load.save_to_csv", side_effect=[True, False, True])
+def test_load_batches_reports_failures(mock_csv, sample_dataframe):
+    results = []
+    total = load_batches(iter([sample_dataframe] * 3), sinks=("csv",), results=results)
+    assert total == 2
+    assert results[0]["sink"] == "csv" and not results[0]["success"] and results[0]["rows"] == 2
+
+# Test sink yang timeout dilewati pada batch berikutnya
+def test_load_batches_skips_timed_out_sink(sample_dataframe):
+    release = threading.Event()
+    calls = []
+
+    def slow_csv(df, filename, append=False):
+        calls.append(append)
+        release.wait(5)
+        return True
+
+    results = []
+    with patch("utils.load.save_to_csv", side_effect=slow_csv), \
+            patch("utils.load.save_to_parquet", return_value=True):
+        total = load_batches(
+            iter([sample_dataframe] * 3), sinks=("csv", "parquet"), timeouts={"csv": 0.1}, results=results,
+        )
+    release.set()
+    assert calls == [False]
+    by_sink = {result["sink"]: result for result in results}
+    assert by_sink["csv"]["timed_out"] and not by_sink["csv"]["success"]
+    assert by_sink["parquet"]["success"] and by_sink["parquet"]["rows"] == 3
+    assert total == 0
+
+# Test mode upsert memperbarui baris dengan natural key yang sama (SQLite sebagai pengganti PostgreSQL)
+def test_save_to_postgresql_upsert_sqlite(tmp_path, sample_dataframe):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fashion.db'}")
+    save_to_postgresql(sample_dataframe, "db", "user", "pw", mode="upsert", engine=engine)
+
+    updated = pd.concat([
+        sample_dataframe.assign(Price=200000.0),
+        sample_dataframe.assign(Title="Item B"),
+    ], ignore_index=True)
+    save_to_postgresql(updated, "db", "user", "pw", mode="upsert", engine=engine)
+
+    result = pd.read_sql("SELECT * FROM fashion_products ORDER BY Title", engine)
+    assert result["Title"].tolist() == ["Item A", "Item B"]
+    assert result.loc[0, "Price"] == 200000.0
+    indexes = inspect(engine).get_indexes("fashion_products")
+    assert any(ix["unique"] and ix["column_names"] == ["Title", "Size", "Gender"] for ix in indexes)
+    assert not inspect(engine).has_table("fashion_products_staging")
+
+# Test mode snapshot menambahkan baris per run dengan RunTimestamp
+def test_save_to_postgresql_snapshot_sqlite(tmp_path, sample_dataframe):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fashion.db'}")
+    for day in (1, 2):
+        save_to_postgresql(
+            sample_dataframe, "db", "user", "pw",
+            mode="snapshot", engine=engine, run_timestamp=datetime(2025, 5, day)
+        )
+
+    result = pd.read_sql("SELECT * FROM fashion_products_snapshots", engine)
+    assert result["RunTimestamp"].tolist() == ["2025-05-01T00:00:00", "2025-05-02T00:00:00"]
+    index_names = {ix["name"] for ix in inspect(engine).get_indexes("fashion_products_snapshots")}
+    assert {"ix_fashion_products_snapshots_run", "ix_fashion_products_snapshots_title_run"} <= index_names
+
+# Test mode yang tidak dikenal menghasilkan pesan error
+def test_save_to_postgresql_unknown_mode(sample_dataframe, capsys):
+    save_to_postgresql(sample_dataframe, "db", "user", "pw", mode="merge", engine=MagicMock())
+    assert "[PostgreSQL Error]" in capsys.readouterr().out
+
+# Test engine dipakai ulang untuk URL yang sama
+@patch("sqlalchemy.create_engine")
+def test_get_engine_reuses_engine(mock_create_engine):
+    first = get_engine("postgresql+psycopg2://u:p@localhost:5432/db")
+    second = get_engine("postgresql+psycopg2://u:p@localhost:5432/db")
+    assert first is second
+    mock_create_engine.assert_called_once()
+
+# Test save_to_postgresql memakai COPY dengan chunking saat use_copy=True
+@patch("sqlalchemy.create_engine")
+def test_save_to_postgresql_use_copy(mock_create_engine, sample_dataframe):
+    sample_dataframe.to_sql = MagicMock()
+    save_to_postgresql(sample_dataframe, "db", "user", "pw", use_copy=True, chunksize=500)
+    save_to_postgresql(sample_dataframe, "db", "user", "pw", use_copy=True, chunksize=500)
+
+    mock_create_engine.assert_called_once()
+    sample_dataframe.to_sql.assert_called_with(
+        "fashion_products", mock_create_engine.return_value, index=False, if_exists="replace",
+        method=copy_insert, chunksize=500
+    )
+
+# Test copy_insert mengalirkan CSV di memori ke COPY FROM STDIN dengan NULL yang benar
+def test_copy_insert_streams_csv_buffer():
+    cursor = MagicMock()
+    conn = MagicMock()
+    conn.connection.cursor.return_value.__enter__.return_value = cursor
+    conn.dialect.identifier_preparer.quote = lambda name: f'"{name}"'
+    table = MagicMock(schema=None)
+    table.name = "fashion_products"
+
+    copied = {}
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(sql=sql, data=buffer.read())
+    copy_insert(table, conn, ["Title", "Price"], iter([("Item, A", 1.5), ("", None)]))
+
+    assert copied["sql"] == (
+        'COPY "fashion_products" ("Title", "Price") FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+    )
+    assert copied["data"] == '"Item, A",1.5\r\n,\\N\r\n'
+
+# Test load_data mengembalikan hasil terstruktur dan mengisolasi sink yang gagal
+@patch("utils.load.save_to_csv", return_value=True)
+@patch("utils.load.save_to_postgresql", side_effect=RuntimeError("DB down"))
+@patch("utils.load.save_to_google_spreadsheet", return_value=False)
+def test_load_data_structured_results(mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
+    results = load_data(sample_dataframe)
+
+    by_sink = {result["sink"]: result for result in results}
+    assert [result["sink"] for result in results] == ["csv", "postgresql", "gsheets"]
+    assert by_sink["csv"]["success"] and by_sink["csv"]["rows"] == 1
+    assert not by_sink["postgresql"]["success"] and by_sink["postgresql"]["error"] == "DB down"
+    assert not by_sink["gsheets"]["success"] and by_sink["gsheets"]["rows"] == 0
+    assert all(result["duration"] >= 0 for result in results)
+
+# Test sink jaringan dapat dilewati
+@patch("utils.load.save_to_csv", return_value=True)
+@patch("utils.load.save_to_postgresql")
+@patch("utils.load.save_to_google_spreadsheet")
+def test_load_data_selected_sinks(mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
+    results = load_data(sample_dataframe, sinks=("csv",))
+    assert [result["sink"] for result in results] == ["csv"]
+    mock_postgres.assert_not_called()
+    mock_gsheet.assert_not_called()
+    with pytest.raises(ValueError):
+        load_data(sample_dataframe, sinks=("ftp",))
+
+# Test sink yang lambat dilaporkan timeout tanpa menahan sink lain
+def test_run_sinks_timeout():
+    release = threading.Event()
+    results = run_sinks(
+        {"slow": lambda: release.wait(5), "fast": lambda: True},
+        rows=10,
+        timeouts={"slow": 0.1, "fast": 1},
+    )
+    release.set()
+    assert results[0]["sink"] == "slow" and not results[0]["success"]
+    assert "Timeout" in results[0]["error"]
+    assert results[1]["success"] and results[1]["rows"] == 10
+
+# Test save_to_parquet menulis file terpartisi per tanggal run dan mempertahankan tipe kolom
+def test_save_to_parquet_roundtrip(tmp_path, sample_dataframe):
+    base_dir = tmp_path / "parquet"
+    assert save_to_parquet(sample_dataframe, str(base_dir), run_timestamp=datetime(2025, 5, 10, 10))
+
+    partition = base_dir / "run_date=2025-05-10"
+    files = [path.name for path in partition.iterdir()]
+    assert files == ["fashion_20250510T100000000000_part0000.parquet"]
+
+    df_read = read_parquet_data(str(base_dir))
+    assert df_read["Price"].dtype == float
+    assert df_read["Rating"].dtype == float
+    pd.testing.assert_frame_equal(df_read, sample_dataframe)
+
+# Test reader mendukung proyeksi kolom dan filter partisi
+def test_read_parquet_data_projection(tmp_path, sample_dataframe):
+    base_dir = str(tmp_path / "parquet")
+    save_to_parquet(sample_dataframe, base_dir, run_timestamp=datetime(2025, 5, 10))
+    save_to_parquet(sample_dataframe.assign(Title="Item B"), base_dir, run_timestamp=datetime(2025, 5, 11))
+
+    projected = read_parquet_data(base_dir, columns=["Title", "Price"])
+    assert list(projected.columns) == ["Title", "Price"]
+    assert projected["Title"].tolist() == ["Item A", "Item B"]
+    assert read_parquet_data(base_dir, run_date="2025-05-11")["Title"].tolist() == ["Item B"]
+    assert read_parquet_data(base_dir, run_date="2025-01-01").empty
+
+# Test kegagalan di tengah penulisan tidak meninggalkan file sementara maupun file final
+def _partial_write(table, path, **kwargs):
+    with open(path, "wb") as f:
+        f.write(b"PAR1")
+    raise OSError("Disk penuh")
+
+@patch("pyarrow.parquet.write_table", side_effect=_partial_write)
+def test_save_to_parquet_failure_is_atomic(mock_write, tmp_path, sample_dataframe, capsys):
+    base_dir = tmp_path / "parquet"
+    assert save_to_parquet(sample_dataframe, str(base_dir)) is False
+    assert "[Parquet Error]" in capsys.readouterr().out
+    assert not list(base_dir.rglob("*.parquet*"))
+
+# Fake Google Sheets service (values.get/batchUpdate/clear dan spreadsheets.get/batchUpdate)
+@pytest.fixture
+def catalog_dataframe():
+    return pd.DataFrame({
+        "Title": ["Item A", "Item B", "Item C", "Item D"],
+        "Price": [160000.0, 320000.0, 480000.0, 640000.0],
+        "Rating": [4.5, 3.9, 4.1, 2.5],
+        "Colors": [3, 5, 2, 1],
+        "Size": ["M", "L", "S", "XL"],
+        "Gender": ["Men", "Women", "Unisex", "Men"],
+        "Timestamp": ["2025-05-10T10:00:00.000000"] * 4
+    })
+
+def _grid_for(df):
+    return [df.columns.tolist()] + df.values.tolist()
+
+# Test sinkronisasi pertama ke sheet kosong menulis seluruh data
+def test_sync_google_spreadsheet_initial_full_write(catalog_dataframe):
+    service = FakeSheetsService()
+    summary = sync_google_spreadsheet(catalog_dataframe, "fake_id", service=service)
+
+    assert summary["added"] == 4
+    assert service.grid == _grid_for(catalog_dataframe)
+    assert "values.clear" not in service.calls
+
+# Test sinkronisasi delta hanya menulis baris berubah/baru dan menghapus baris yang hilang
+def test_sync_google_spreadsheet_delta(catalog_dataframe):
+    service = FakeSheetsService(_grid_for(catalog_dataframe))
+    updated = catalog_dataframe.drop(index=1).copy()
+    updated.loc[2, "Price"] = 500000.0
+    updated = pd.concat([updated, catalog_dataframe.iloc[[0]].assign(Title="Item E")], ignore_index=True)
+
+    summary = sync_google_spreadsheet(updated, "fake_id", service=service)
+
+    assert summary == {"added": 1, "changed": 1, "removed": 1, "unchanged": 2}
+    assert service.written_rows == 2
+    assert service.calls == ["values.get", "values.batchUpdate", "spreadsheets.get", "spreadsheets.batchUpdate"]
+    assert sorted(map(tuple, service.grid[1:])) == sorted(map(tuple, updated.values.tolist()))
+
+# Test tidak ada penulisan jika data tidak berubah
+def test_sync_google_spreadsheet_no_changes(catalog_dataframe):
+    service = FakeSheetsService(_grid_for(catalog_dataframe))
+    summary = sync_google_spreadsheet(catalog_dataframe, "fake_id", service=service)
+    assert summary["unchanged"] == 4
+    assert service.calls == ["values.get"]
+
+# Test baris yang hanya berbeda di kolom Timestamp tidak dianggap berubah
+def test_sync_google_spreadsheet_ignores_timestamp(catalog_dataframe):
+    service = FakeSheetsService(_grid_for(catalog_dataframe))
+    rescraped = catalog_dataframe.assign(Timestamp="2025-05-11T10:00:00.000000")
+    summary = sync_google_spreadsheet(rescraped, "fake_id", service=service)
+    assert summary == {"added": 0, "changed": 0, "removed": 0, "unchanged": 4}
+    assert service.calls == ["values.get"]
+
+    rescraped.loc[0, "Price"] = 170000.0
+    summary = sync_google_spreadsheet(rescraped, "fake_id", service=service)
+    assert summary["changed"] == 1 and service.written_rows == 1
+
+# Test penulisan dibagi per chunk dan backoff saat rate limit
+@patch("utils.load.time.sleep")
+def test_sync_google_spreadsheet_chunks_and_backoff(mock_sleep, catalog_dataframe):
+    service = FakeSheetsService(_grid_for(catalog_dataframe.iloc[:1]), rate_limited_calls=2)
+    summary = sync_google_spreadsheet(catalog_dataframe, "fake_id", service=service, chunk_size=2)
+
+    assert summary["added"] == 3
+    assert service.calls.count("values.batchUpdate") == 2
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+    assert service.grid == _grid_for(catalog_dataframe)
+
+# Test library sink yang berat tidak ikut ter-import saat startup modul pipeline
+@pytest.mark.parametrize("module", sorted(TARGETS))
+def test_sink_dependencies_are_imported_lazily(module):
+    result = measure_import(module)
+    assert forbidden_imports(result["modules"], TARGETS[module]) == []
@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+import pandas as pd
+import pytest
+
+# Menambahkan path agar bisa import main, utils, dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from unittest.mock import patch
+from main import build_parser, cli, main_incremental
+from utils.state import ProductStateStore
+from benchmarks.stub_server import StubCatalogServer
+
+
+# Test subcommand extract -> transform -> load menjalankan setiap tahap secara terpisah lewat file CSV
+def test_cli_subcommands_run_stages_separately(tmp_path, monkeypatch):
+    # Checkpoint crawl (.state/) dan sink analytics (data/) ditulis relatif ke cwd
+    monkeypatch.chdir(tmp_path)
+    raw, cleaned, output = tmp_path / "raw.csv", tmp_path / "cleaned.csv", tmp_path / "data" / "analytics.sqlite"
+    with StubCatalogServer(total_pages=2, cards_per_page=20, latency=0) as server:
+        assert cli(["extract", "--base-url", server.base_url, "--output", str(raw)]) == 0
+    assert len(pd.read_csv(raw)) == 40
+
+    assert cli(["transform", "--input", str(raw), "--output", str(cleaned)]) == 0
+    df_cleaned = pd.read_csv(cleaned)
+    assert df_cleaned["Price"].dtype == "float64" and len(df_cleaned) == 38
+
+    assert cli(["load", "--input", str(cleaned), "--sinks", "analytics"]) == 0
+    assert output.exists()
+
+
+# Test import main tidak memuat library crawl sebelum mode crawl dijalankan
+def test_import_main_skips_crawl_libraries():
+    code = "import sys, main; print(sorted({'requests', 'bs4', 'asyncio'} & set(sys.modules)))"
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+# Test pipeline penuh dan streaming mengembalikan exit code 1 jika ada sink yang gagal
+def test_cli_pipeline_exit_code_reflects_sink_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Checkpoint crawl ditulis ke .state/ relatif ke cwd
+    failed = [{"sink": "csv", "success": False, "rows": 0, "duration": 0.0, "error": "disk penuh"}]
+    with StubCatalogServer(total_pages=1, cards_per_page=20, latency=0) as server:
+        options = ["--base-url", server.base_url, "--rps", "1000", "--sinks", "csv", "--no-preview"]
+        assert cli(options) == 0
+        with patch("main.load_data", return_value=failed):
+            assert cli(options) == 1
+        with patch("utils.load.save_to_csv", return_value=False):
+            assert cli(["--stream", *options]) == 1
+
+
+# Test subcommand mengembalikan exit code 1 jika input tidak ada
+def test_cli_transform_missing_input(tmp_path, capsys):
+    assert cli(["transform", "--input", str(tmp_path / "missing.csv")]) == 1
+    assert "Terjadi kesalahan di proses transform" in capsys.readouterr().out
+
+
+# Test reprocess dengan output default tidak menimpa file input yang bernama sama
+def test_cli_reprocess_refuses_default_output_as_input(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({"Title": ["A"], "Price": [160000.0], "Rating": [4.5], "Colors": [3], "Size": ["M"],
+                  "Gender": ["Men"], "Timestamp": ["2025-05-10T10:00:00"]}).to_csv("fashion_data.csv", index=False)
+    before = (tmp_path / "fashion_data.csv").read_bytes()
+    assert cli(["reprocess", "--input", "fashion_data.csv", "--kind", "cleaned", "--exchange-rate", "15000"]) == 1
+    assert "sama dengan salah satu file input" in capsys.readouterr().out
+    assert (tmp_path / "fashion_data.csv").read_bytes() == before
+
+
+# Test opsi yang diberikan sebelum nama subcommand tidak ditimpa default subcommand
+def test_cli_options_before_subcommand_are_kept():
+    parser = build_parser()
+    args = parser.parse_args(["--sinks", "csv", "--gsheets-mode", "sync", "load"])
+    assert (args.sinks, args.gsheets_mode) == ("csv", "sync")
+    args = parser.parse_args(["--pages", "3", "--resume", "--base-url", "http://stub/", "extract"])
+    assert (args.pages, args.resume, args.base_url) == (3, True, "http://stub/")
+    args = parser.parse_args(["extract", "--pages", "4"])
+    assert (args.pages, args.resume) == (4, False)
+    assert parser.parse_args(["--rps", "1.5", "extract"]).rps == 1.5
+    assert parser.parse_args(["--async"]).rps is None
+
+
+# Test opsi yang tidak didukung pipeline asyncio ditolak alih-alih diabaikan
+def test_cli_async_rejects_unsupported_options(capsys):
+    for argv in (["--async", "--resume"], ["--async", "--gsheets-mode", "sync"]):
+        with pytest.raises(SystemExit) as exc:
+            cli(argv)
+        assert exc.value.code == 2
+    assert "tidak didukung bersama --async" in capsys.readouterr().err
+
+
+# Test mode pipeline yang saling eksklusif dan sync Google Sheets per batch ditolak
+def test_cli_rejects_conflicting_modes(capsys):
+    cases = (
+        (["--stream", "--gsheets-mode", "sync"], "--gsheets-mode sync tidak didukung bersama --stream"),
+        (["--incremental", "--stream"], "--incremental dan --stream tidak dapat digabung"),
+        (["--incremental", "--async"], "--incremental dan --async tidak dapat digabung"),
+        (["--async", "--stream"], "--async dan --stream tidak dapat digabung"),
+    )
+    for argv, message in cases:
+        with pytest.raises(SystemExit) as exc:
+            cli(argv)
+        assert exc.value.code == 2
+        assert message in capsys.readouterr().err
+
+
+# Test --incremental menolak sink yang akan ditimpa hanya dengan changeset
+def test_cli_incremental_rejects_replace_sinks(capsys):
+    for argv in (["--incremental", "--sinks", "csv"], ["--incremental", "--sinks", "postgresql,gsheets"]):
+        with pytest.raises(SystemExit) as exc:
+            cli(argv)
+        assert exc.value.code == 2
+    assert "--incremental hanya mendukung sink postgresql" in capsys.readouterr().err
+
+
+# Test crawl incremental yang tidak lengkap tidak menandai produk di halaman gagal sebagai hilang
+def test_main_incremental_partial_crawl_keeps_products(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)  # Checkpoint crawl ditulis ke .state/ relatif ke cwd
+    state_path = str(tmp_path / "state.sqlite")
+    loaded = [{"sink": "postgresql", "success": True, "rows": 0, "attempts": 1, "duration": 0.0}]
+    options = {"total_pages": 3, "delay": 0, "retries": 0, "page_retries": 0}
+    with patch("main.load_data", return_value=loaded):
+        with StubCatalogServer(total_pages=3, cards_per_page=20, latency=0) as server:
+            main_incremental(state_path=state_path, crawl_options={**options, "base_url": server.base_url})
+        # Halaman 3 tidak ada di server kedua, sehingga gagal diambil
+        with StubCatalogServer(total_pages=2, cards_per_page=20, latency=0) as server:
+            main_incremental(state_path=state_path, crawl_options={**options, "base_url": server.base_url})
+
+    assert "deteksi produk hilang dilewati" in capsys.readouterr().out
+    state = ProductStateStore(state_path)
+    history = state.run_history()
+    state.close()
+    assert len(history) == 2 and history[-1]["removed"] == 0
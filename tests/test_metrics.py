@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+import pytest
+
+# Menambahkan path agar bisa import utils dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import metrics
+from utils.extract import scrape_fashion_products_frame
+from utils.transform import clean_and_transform
+from utils.load import run_sinks
+from benchmarks.stub_server import StubCatalogServer
+
+
+@pytest.fixture
+def run():
+    current = metrics.start_run("test-run")
+    yield current
+    metrics.finish_run()
+
+
+# Test fungsi metrik tidak melakukan apa pun jika tidak ada run aktif
+def test_metrics_are_noop_without_active_run():
+    assert metrics.active_run() is None
+    metrics.inc("anything_total")
+    with metrics.timed("anything_seconds"):
+        pass
+    assert metrics.finish_run() is None
+
+
+# Test histogram menghitung bucket kumulatif, sum, min, dan max
+def test_histogram_buckets():
+    histogram = metrics.Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        histogram.observe(value)
+    summary = histogram.to_dict()
+    assert summary["buckets"] == {"0.1": 1, "1.0": 2}
+    assert summary["count"] == 3 and summary["sum"] == pytest.approx(2.55)
+    assert summary["min"] == 0.05 and summary["max"] == 2.0
+
+
+# Test pipeline mencatat fetch, parse, baris yang dibuang, dan hasil sink
+def test_pipeline_records_stage_metrics(run, tmp_path):
+    with StubCatalogServer(total_pages=3, cards_per_page=20, latency=0) as server:
+        df_raw = scrape_fashion_products_frame(3, delay=0, base_url=server.base_url)
+    df_cleaned = clean_and_transform(df_raw)
+    run_sinks({"csv": lambda: True, "gsheets": lambda: False}, len(df_cleaned))
+
+    assert run.counter_value("fetch_requests_total", status=200) == 3
+    assert run.counter_value("fetch_bytes_total") > 0
+    assert run.counter_value("rows_out_total", stage="parse") == 60
+    assert run.counter_value("rows_in_total", stage="transform") == 60
+    assert run.counter_value("rows_dropped_total", stage="transform", reason="invalid_rating") == 3
+    assert run.counter_value("rows_out_total", stage="transform") == 57
+    assert run.counter_value("rows_out_total", stage="load_csv") == 57
+    assert run.counter_value("sink_failures_total", sink="gsheets") == 1
+
+    report_path = tmp_path / "reports" / "run.json"
+    run.write_json(str(report_path))
+    report = json.loads(report_path.read_text())
+    assert report["run_id"] == "test-run"
+    histograms = {item["name"]: item for item in report["histograms"] if not item["labels"]}
+    assert histograms["parse_duration_seconds"]["count"] == 3
+
+
+# Test format textfile Prometheus untuk counter dan histogram
+def test_prometheus_textfile(run, tmp_path):
+    metrics.inc("rows_dropped_total", 2, stage="transform", reason="invalid_rating")
+    metrics.observe("sink_duration_seconds", 0.2, sink="csv")
+    path = tmp_path / "etl.prom"
+    run.write_prometheus(str(path))
+    text = path.read_text()
+    assert "# TYPE etl_rows_dropped_total counter" in text
+    assert 'etl_rows_dropped_total{reason="invalid_rating",stage="transform"} 2' in text
+    assert 'etl_sink_duration_seconds_bucket{sink="csv",le="0.25"} 1' in text
+    assert 'etl_sink_duration_seconds_count{sink="csv"} 1' in text
+    assert not os.path.exists(str(path) + ".tmp")
@@ -0,0 +1,118 @@
+import os
+import sys
+import pytest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+# Menambahkan path agar bisa import utils dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.extract import BeautifulSoupParser, extract_clean_text, get_parser, parse_page, scrape_fashion_products
+from utils.parsers import FIELD_PATTERNS, LxmlParser, extract_card_fields
+from benchmarks.stub_server import StubCatalogServer, load_html_pages, render_page
+
+# catalog_page*.html adalah fixture sintetis dari `render_page`; edge_cases.html ditulis manual
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+FIXTURES = sorted(name for name in os.listdir(FIXTURE_DIR) if name.endswith('.html'))
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def _without_timestamp(rows):
+    return [{key: value for key, value in row.items() if key != "Timestamp"} for row in rows]
+
+
+# Test backend lxml menghasilkan dictionary produk yang identik dengan BeautifulSoup
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_lxml_parity_with_beautifulsoup(fixture):
+    content = _read_fixture(fixture)
+    expected = parse_page(content, 1, BeautifulSoupParser())
+    result = parse_page(content, 1, LxmlParser())
+
+    assert expected
+    assert _without_timestamp(result) == _without_timestamp(expected)
+    assert all(isinstance(row["Timestamp"], datetime) for row in result)
+    assert [list(row) for row in result] == [list(row) for row in expected]
+
+
+# Test Timestamp hanya dibuat sekali per halaman, tidak per card
+@pytest.mark.parametrize("name", ["bs4", "lxml"])
+def test_parse_page_timestamp_once_per_page(name):
+    content = _read_fixture(FIXTURES[0])
+    with patch("utils.extract.datetime", wraps=datetime) as extract_clock, \
+            patch("utils.parsers.datetime", wraps=datetime) as parsers_clock:
+        result = parse_page(content, 1, get_parser(name))
+    assert len(result) > 1
+    assert extract_clock.now.call_count + parsers_clock.now.call_count == 1
+    assert all(row["Timestamp"] is result[0]["Timestamp"] for row in result)
+
+
+# Test konten kosong tidak menghasilkan produk pada semua backend
+@pytest.mark.parametrize("name", ["bs4", "lxml"])
+def test_parse_page_without_cards(name):
+    assert parse_page(b"<html><body></body></html>", 1, get_parser(name)) == []
+
+
+# Test nama parser yang tidak dikenal ditolak
+def test_get_parser_unknown_name():
+    with pytest.raises(ValueError):
+        get_parser("regex")
+
+
+# Test fallback ke BeautifulSoup jika dependensi backend tidak tersedia
+def test_get_parser_falls_back_when_dependency_missing(capsys):
+    with patch.dict("utils.extract.PARSER_BACKENDS", {"lxml": _raise_import_error}):
+        parser = get_parser("lxml")
+    assert isinstance(parser, BeautifulSoupParser)
+    assert "menggunakan BeautifulSoup" in capsys.readouterr().out
+
+
+def _raise_import_error():
+    raise ImportError("No module named 'lxml'")
+
+
+# Test ekstraksi satu kali iterasi sama dengan extract_clean_text per field
+@pytest.mark.parametrize("texts", [
+    ["Rating: ⭐ 4.8 / 5", "3 Colors", "Size: M", "Gender: Men"],
+    ["Gender: Women", "Size: XL", "Rating: ⭐ 3.5 / 5", "Rating: ⭐ 4.9 / 5", "2 Colors"],
+    ["Rating: ⭐ Invalid Rating / 5", "Colors: many", None, "5 Colors", "Size: "],
+    ["Rating: ⭐ 4 Size: S Gender: Unisex 8 Colors"],
+    [],
+])
+def test_extract_card_fields_matches_extract_clean_text(texts):
+    paragraphs = [MagicMock(string=text) for text in texts]
+    expected = {
+        field: extract_clean_text(paragraphs, keyword, pattern, default)
+        for field, (keyword, pattern, default) in FIELD_PATTERNS.items()
+    }
+    assert extract_card_fields(texts) == expected
+
+
+# Test nilai default/sentinel dipertahankan jika tidak ada paragraf yang cocok
+def test_extract_card_fields_defaults():
+    assert extract_card_fields(["Lorem ipsum"]) == {
+        "Rating": "Invalid Rating",
+        "Colors": "No Colors",
+        "Size": "Unknown",
+        "Gender": "Unknown",
+    }
+
+
+# Test stub server menyajikan fixture HTML sehingga hasil scraping sama dengan parsing fixture langsung
+def test_stub_server_serves_fixture_pages():
+    pages = load_html_pages(os.path.join(FIXTURE_DIR, 'catalog_page*.html'))
+    expected = [row for page, content in enumerate(pages, 1) for row in parse_page(content, page)]
+    with StubCatalogServer(total_pages=2, latency=0, html_pages=pages) as server:
+        result = scrape_fashion_products(2, delay=0, base_url=server.base_url)
+    assert len(pages) == 2
+    assert _without_timestamp(result) == _without_timestamp(expected)
+
+
+# Test fixture catalog_page*.html tetap sama isinya dengan halaman sintetis dari render_page
+@pytest.mark.parametrize("page", [1, 2])
+def test_catalog_fixtures_match_render_page(page):
+    content = _read_fixture(f'catalog_page{page}.html')
+    assert _without_timestamp(parse_page(content, page)) == _without_timestamp(parse_page(render_page(page), page))
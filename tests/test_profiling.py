@@ -0,0 +1,55 @@
+import os
+import sys
+import pstats
+from contextlib import nullcontext
+import pytest
+
+# Menambahkan path agar bisa import utils
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import profiling
+
+
+@pytest.fixture(autouse=True)
+def clean_profiler(monkeypatch):
+    for name in ("ETL_PROFILE", "ETL_PROFILE_DIR", "ETL_PROFILE_TOP"):
+        monkeypatch.delenv(name, raising=False)
+    yield
+    profiling.stop_profiling()
+
+
+# Test tanpa flag maupun env, stage() mengembalikan nullcontext (tanpa overhead)
+def test_stage_is_nullcontext_when_disabled():
+    assert profiling.start_profiling() is None
+    assert isinstance(profiling.stage("extract"), nullcontext)
+
+
+# Test parsing mode profiling dari flag/env
+def test_parse_modes():
+    assert profiling.parse_modes(None) == set()
+    assert profiling.parse_modes("cpu") == {"cpu"}
+    assert profiling.parse_modes("1") == {"cpu", "memory"}
+    assert profiling.parse_modes("memory, cpu") == {"cpu", "memory"}
+    with pytest.raises(ValueError):
+        profiling.parse_modes("gpu")
+
+
+# Test env ETL_PROFILE mengaktifkan profiling dan menulis dump per tahap ke direktori run
+def test_stage_reports_written_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("ETL_PROFILE", "cpu,memory")
+    monkeypatch.setenv("ETL_PROFILE_DIR", str(tmp_path))
+    profiler = profiling.start_profiling()
+
+    with profiling.stage("transform"):
+        data = [str(i) * 10 for i in range(20000)]
+    assert data
+
+    files = sorted(os.listdir(profiler.run_dir))
+    assert files == ["transform.prof", "transform_cpu.txt", "transform_memory.txt"]
+    assert os.path.dirname(profiler.run_dir) == str(tmp_path)
+    pstats.Stats(os.path.join(profiler.run_dir, "transform.prof"))  # Dump dapat dibaca pstats
+    with open(os.path.join(profiler.run_dir, "transform_memory.txt"), encoding="utf-8") as f:
+        report = f.read()
+    assert "Puncak alokasi" in report and "test_profiling.py" in report
+    assert profiling.stop_profiling() is profiler
+    assert isinstance(profiling.stage("load"), nullcontext)
@@ -0,0 +1,47 @@
+import os
+import sys
+from datetime import datetime
+import pandas as pd
+
+# Menambahkan path agar bisa import utils dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.records import ProductColumns
+from utils.extract import parse_page
+from benchmarks.datagen import synthetic_card_pages
+
+
+# Test DataFrame dari ProductColumns identik dengan pd.DataFrame(list_of_dicts)
+def test_to_frame_matches_list_of_dicts():
+    pages = list(synthetic_card_pages(45, cards_per_page=20))
+    pages[1][3]["Timestamp"] = datetime(2024, 1, 1)  # Timestamp berbeda di tengah halaman
+    columns = ProductColumns()
+    for products in pages:
+        columns.extend(products)
+
+    expected = pd.DataFrame([product for products in pages for product in products])
+    assert len(columns) == 45
+    pd.testing.assert_frame_equal(columns.to_frame(), expected)
+
+
+# Test nilai string berulang disimpan sebagai satu objek yang sama
+def test_repeated_values_share_one_object():
+    columns = ProductColumns()
+    timestamp = datetime.now()
+    for title in ("A", "B"):
+        columns.append({
+            "Title": title, "Price": "".join(["$1", "0.00"]), "Rating": "⭐ 4.5", "Colors": "3",
+            "Size": "".join(["X", "L"]), "Gender": "Men", "Timestamp": timestamp,
+        })
+    frame = columns.to_frame()
+    assert frame["Size"][0] is frame["Size"][1]
+    assert frame["Price"][0] is frame["Price"][1]
+    assert frame["Timestamp"].nunique() == 1
+
+
+# Test semua produk dalam satu halaman berbagi satu objek Timestamp
+def test_parse_page_shares_page_timestamp():
+    card = '<div class="collection-card"><div class="product-details"><h3 class="product-title">{}</h3></div></div>'
+    products = parse_page("".join(card.format(title) for title in ("A", "B", "C")), 1)
+    assert len(products) == 3
+    assert products[0]["Timestamp"] is products[1]["Timestamp"] is products[2]["Timestamp"]
@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+# Menambahkan path agar bisa import utils dan benchmarks
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.reprocess import reprocess_csv
+from utils.transform import clean_and_transform
+from benchmarks.datagen import synthetic_raw_frame
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    path = tmp_path / "raw.csv"
+    synthetic_raw_frame(1_000, invalid_ratio=0.1).to_csv(path, index=False)
+    return path
+
+
+def _reprocess(paths, output, **options):
+    return reprocess_csv([str(path) for path in paths], sinks=("csv",), sink_options={"filename_csv": str(output)},
+                         **options)
+
+
+# Test reprocess per chunk menghasilkan data yang sama dengan transformasi seluruh file sekaligus
+def test_reprocess_raw_in_chunks_matches_full_transform(raw_csv, tmp_path):
+    output = tmp_path / "cleaned.csv"
+    summary = _reprocess([raw_csv], output, chunksize=128, exchange_rate=16500)
+
+    expected = clean_and_transform(pd.read_csv(raw_csv, dtype=str, keep_default_na=False), exchange_rate=16500)
+    result = pd.read_csv(output)
+    assert summary["kind"] == "raw" and summary["chunks"] == 8 and summary["rows_in"] == 1_000
+    assert summary["rows_out"] == len(result) == len(expected)
+    assert result["Price"].tolist() == expected["Price"].tolist()
+    assert summary["sinks"][0]["success"] and summary["sinks"][0]["rows"] == len(expected)
+
+
+# Test process pool menjaga urutan chunk dan beberapa file dibaca sebagai satu aliran
+def test_reprocess_with_workers_keeps_order(raw_csv, tmp_path):
+    sequential, parallel = tmp_path / "sequential.csv", tmp_path / "parallel.csv"
+    _reprocess([raw_csv, raw_csv], sequential, chunksize=100)
+    summary = _reprocess([raw_csv, raw_csv], parallel, chunksize=100, workers=2)
+    assert summary["chunks"] == 20
+    pd.testing.assert_frame_equal(pd.read_csv(parallel), pd.read_csv(sequential))
+
+
+# Test CSV bersih lama dihitung ulang dari kurs lama ke kurs baru
+def test_reprocess_cleaned_export_with_new_rate(raw_csv, tmp_path):
+    cleaned, output = tmp_path / "cleaned.csv", tmp_path / "rerated.csv"
+    _reprocess([raw_csv], cleaned)
+    summary = _reprocess([cleaned], output, exchange_rate=17000, chunksize=300)
+
+    before, after = pd.read_csv(cleaned), pd.read_csv(output)
+    assert summary["kind"] == "cleaned"
+    assert after["Price"].tolist() == (before["Price"] / 16000 * 17000).round(1).tolist()
+    assert after["Title"].tolist() == before["Title"].tolist()
+
+
+# Test nama sink yang tidak dikenal ditolak sebelum file dibaca
+def test_reprocess_rejects_unknown_sink(raw_csv):
+    with pytest.raises(ValueError, match="Sink tidak dikenal"):
+        reprocess_csv([str(raw_csv)], sinks=("ftp",))
+
+
+# Test reprocess menolak menimpa file input yang sedang dibaca lewat sink csv
+def test_reprocess_refuses_to_overwrite_input(raw_csv, tmp_path, monkeypatch):
+    before = raw_csv.read_bytes()
+    with pytest.raises(ValueError, match="sama dengan salah satu file input"):
+        _reprocess([raw_csv], raw_csv)
+
+    monkeypatch.chdir(tmp_path)
+    default_output = tmp_path / "fashion_data.csv"
+    default_output.write_bytes(before)
+    with pytest.raises(ValueError, match="sama dengan salah satu file input"):
+        reprocess_csv(["fashion_data.csv"], sinks=("csv",), kind="raw")
+    assert raw_csv.read_bytes() == default_output.read_bytes() == before
+
+
+# Test sink yang timeout dilewati pada chunk berikutnya, sink lain tetap menulis semua chunk
+def test_reprocess_skips_timed_out_sink(raw_csv, tmp_path):
+    release = threading.Event()
+    calls = []
+
+    def slow_csv(df, filename, append=False):
+        calls.append(append)
+        release.wait(5)
+        return True
+
+    with patch("utils.load.save_to_csv", side_effect=slow_csv):
+        summary = reprocess_csv(
+            [str(raw_csv)], sinks=("csv", "parquet"), chunksize=250, timeouts={"csv": 0.1},
+            sink_options={"parquet_dir": str(tmp_path / "parquet")},
+        )
+    release.set()
+    assert calls == [False]
+    by_sink = {result["sink"]: result for result in summary["sinks"]}
+    assert by_sink["csv"]["timed_out"] and not by_sink["csv"]["success"]
+    assert by_sink["parquet"]["success"] and by_sink["parquet"]["rows"] == summary["rows_out"]
@@ -0,0 +1,73 @@
+import os
+import sys
+from datetime import datetime
+import pytest
+
+# Menambahkan path agar bisa import utils
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.state import ProductStateStore, fingerprint_product, product_key
+
+
+def _product(title, price="$10.00", size="M", gender="Men"):
+    return {
+        "Title": title, "Price": price, "Rating": "⭐ 4.5", "Colors": "3",
+        "Size": size, "Gender": gender, "Timestamp": datetime.now(),
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    state = ProductStateStore(str(tmp_path / "state" / "products.sqlite"))
+    yield state
+    state.close()
+
+
+# Test fingerprint tidak dipengaruhi Timestamp, tetapi berubah jika harga berubah
+def test_fingerprint_ignores_timestamp():
+    first, second = _product("Shirt"), _product("Shirt")
+    second["Timestamp"] = datetime(2020, 1, 1)
+    assert fingerprint_product(first) == fingerprint_product(second)
+    assert fingerprint_product(first) != fingerprint_product(_product("Shirt", price="$12.00"))
+    assert product_key(first) == product_key(_product("Shirt", price="$12.00"))
+
+
+# Test run pertama menganggap semua produk baru, run kedua tanpa perubahan melewati semuanya
+def test_changeset_first_and_repeated_run(store):
+    products = [_product("Shirt"), _product("Pants")]
+    first = store.compute_changeset(products)
+    assert len(first["new"]) == 2 and first["unchanged"] == 0
+    store.commit(first)
+
+    second = store.compute_changeset([_product("Shirt"), _product("Pants")])
+    assert second["new"] == [] and second["changed"] == [] and second["removed"] == []
+    stats = store.commit(second)
+    assert stats["unchanged"] == 2
+    assert stats["skipped_ratio"] == 1.0
+
+
+# Test produk berubah, baru, dan hilang terdeteksi dengan benar
+def test_changeset_detects_changed_new_and_removed(store):
+    store.commit(store.compute_changeset([_product("Shirt"), _product("Pants"), _product("Hat")]))
+
+    changeset = store.compute_changeset([_product("Shirt", price="$15.00"), _product("Pants"), _product("Jacket")])
+    assert [p["Title"] for p in changeset["changed"]] == ["Shirt"]
+    assert [p["Title"] for p in changeset["new"]] == ["Jacket"]
+    assert changeset["removed"] == [product_key(_product("Hat"))]
+
+    partial = store.compute_changeset([_product("Shirt")], detect_removed=False)
+    assert partial["removed"] == []
+
+
+# Test changeset yang belum di-commit tetap terdeteksi pada run berikutnya dan statistik run tercatat
+def test_uncommitted_changes_are_retried(store):
+    store.commit(store.compute_changeset([_product("Shirt")]), run_at=datetime(2025, 1, 1))
+    store.compute_changeset([_product("Shirt", price="$20.00")])  # Load gagal: tidak di-commit
+
+    retry = store.compute_changeset([_product("Shirt", price="$20.00")])
+    assert len(retry["changed"]) == 1
+    store.commit(retry, run_at=datetime(2025, 1, 2))
+
+    history = store.run_history()
+    assert [run["new"] for run in history] == [1, 0]
+    assert [run["changed"] for run in history] == [0, 1]
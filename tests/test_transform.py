@@ -1,6 +1,6 @@
 import pytest
 import pandas as pd
-from utils.transform import clean_and_transform
+from utils.transform import clean_and_transform, transform_batches, transform_with_schema
 import sys
 import os
 
@@ -59,3 +59,101 @@ def test_clean_and_transform_malformed_price():
 
     # jika konversi Price akan gagal, maka fungsi akan mengembalikan DataFrame kosong
     assert result.empty
+
+def test_transform_batches_streams_cleaned_frames():
+    valid = {
+        "Title": "Item A", "Price": "$10.00", "Rating": "⭐ 4.5", "Colors": "3 Colors",
+        "Size": "M", "Gender": "Male", "Timestamp": "2025-05-10 10:00:00"
+    }
+    invalid = {**valid, "Rating": "Invalid Rating"}
+    batches = [[valid, invalid], [invalid], [valid, valid]]
+    result = list(transform_batches(iter(batches)))
+
+    # batch yang kosong setelah dibersihkan dilewati
+    assert [len(df) for df in result] == [1, 2]
+    assert all(df["Price"].dtype == float for df in result)
+
+def test_clean_and_transform_exchange_rate():
+    data = {
+        "Title": ["Item A"], "Price": ["$10.00"], "Rating": ["⭐ 4.5"], "Colors": ["3 Colors"],
+        "Size": ["M"], "Gender": ["Male"], "Timestamp": ["2025-05-10 10:00:00"]
+    }
+    # default tetap memakai kurs 16000, kurs baru dapat diberikan tanpa mengubah kode
+    assert clean_and_transform(pd.DataFrame(data))["Price"].tolist() == [160000.0]
+    assert clean_and_transform(pd.DataFrame(data), exchange_rate=16500)["Price"].tolist() == [165000.0]
+
+def test_transform_with_schema_matches_clean_and_transform():
+    data = {
+        "Title": ["Item A", "Item B", "Item C"],
+        "Price": ["$10.00", "$1,020.50", "$30.00"],
+        "Rating": ["⭐ 4.5", "⭐ 3.9", "Invalid Rating"],
+        "Colors": ["3", "5 Colors", "2"],
+        "Size": ["M", "L", "S"],
+        "Gender": ["Male", "Female", "Unisex"],
+        "Timestamp": ["2025-05-10 10:00:00", "2025-05-10 11:00:00", "2025-05-10 12:00:00"]
+    }
+    df = pd.DataFrame(data)
+    expected = clean_and_transform(df)
+    result = transform_with_schema(df)
+
+    assert list(result.index) == list(expected.index)
+    assert result["Price"].tolist() == expected["Price"].tolist()
+    assert result["Rating"].astype(float).round(1).tolist() == expected["Rating"].tolist()
+    assert result["Colors"].tolist() == expected["Colors"].tolist()
+    assert result["Size"].astype(str).tolist() == expected["Size"].tolist()
+    assert result["Timestamp"].dt.strftime('%Y-%m-%dT%H:%M:%S.%f').tolist() == expected["Timestamp"].tolist()
+
+def test_transform_with_schema_exchange_rate():
+    data = {
+        "Title": ["Item A"], "Price": ["$10.00"], "Rating": ["⭐ 4.5"], "Colors": ["3 Colors"],
+        "Size": ["M"], "Gender": ["Male"], "Timestamp": ["2025-05-10 10:00:00"]
+    }
+    # kurs diteruskan ke skema Price, sama seperti clean_and_transform
+    assert transform_with_schema(pd.DataFrame(data))["Price"].tolist() == [160000.0]
+    assert transform_with_schema(pd.DataFrame(data), exchange_rate=16500)["Price"].tolist() == [165000.0]
+
+def test_transform_with_schema_compact_dtypes():
+    data = {
+        "Title": ["Item A"],
+        "Price": ["$10.00"],
+        "Rating": ["⭐ 4.5"],
+        "Colors": ["3"],
+        "Size": ["M"],
+        "Gender": ["Male"],
+        "Timestamp": ["2025-05-10 10:00:00"]
+    }
+    result = transform_with_schema(pd.DataFrame(data))
+
+    assert result["Price"].dtype == "float64"
+    assert result["Rating"].dtype == "float32"
+    assert result["Colors"].dtype == "uint16"
+    assert isinstance(result["Size"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["Gender"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(result["Timestamp"])
+
+def test_transform_with_schema_colors_out_of_range():
+    data = {
+        "Title": ["Item A", "Item B"],
+        "Price": ["$10.00", "$20.00"],
+        "Rating": ["⭐ 4.5", "⭐ 3.0"],
+        "Colors": ["256 Colors", "70000 Colors"],
+        "Size": ["M", "L"],
+        "Gender": ["Male", "Female"],
+        "Timestamp": ["2025-05-10 10:00:00"] * 2
+    }
+    result = transform_with_schema(pd.DataFrame(data))
+    assert result["Colors"].tolist() == [256, 70000]
+    assert result["Colors"].dtype == "int64"
+    assert transform_with_schema(pd.DataFrame(data).head(1))["Colors"].dtype == "uint16"
+
+def test_transform_with_schema_malformed_price():
+    data = {
+        "Title": ["Item A"],
+        "Price": ["INVALID"],
+        "Rating": ["⭐ 4.0"],
+        "Colors": ["3"],
+        "Size": ["M"],
+        "Gender": ["Male"],
+        "Timestamp": ["2025-05-10 10:00:00"]
+    }
+    assert transform_with_schema(pd.DataFrame(data)).empty
@@ -0,0 +1,205 @@
+"""Penyimpanan analitik lokal: riwayat hasil bersih setiap run dan agregat per Gender/Size.
+
+Contoh:
+    store = AnalyticsStore('data/analytics.sqlite')
+    store.price_history('T-shirt 2')          # harga produk di setiap run
+    store.aggregates(gender='Women')          # tren distribusi harga/rating per run
+    store.price_changes()                     # perubahan harga run terbaru vs sebelumnya
+"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import pandas as pd
+
+PRODUCT_COLUMNS = ('Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp')
+SEGMENT_COLUMNS = ('Gender', 'Size')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_at TEXT NOT NULL UNIQUE,
+    rows INTEGER NOT NULL DEFAULT 0,
+    aggregates_stale INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS products (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    Title TEXT,
+    Price REAL,
+    Rating REAL,
+    Colors INTEGER,
+    Size TEXT,
+    Gender TEXT,
+    Timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_products_title_run ON products (Title, run_id);
+CREATE INDEX IF NOT EXISTS ix_products_run_segment ON products (run_id, Gender, Size);
+CREATE TABLE IF NOT EXISTS run_aggregates (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    Gender TEXT NOT NULL,
+    Size TEXT NOT NULL,
+    products INTEGER NOT NULL,
+    price_min REAL, price_p25 REAL, price_median REAL, price_p75 REAL, price_max REAL, price_mean REAL,
+    rating_min REAL, rating_median REAL, rating_max REAL, rating_mean REAL,
+    PRIMARY KEY (run_id, Gender, Size)
+);
+CREATE INDEX IF NOT EXISTS ix_run_aggregates_segment ON run_aggregates (Gender, Size, run_id);
+"""
+
+
+def _segment_aggregates(frame: pd.DataFrame) -> pd.DataFrame:
+    """Menghitung distribusi harga dan rating per Gender/Size untuk satu run."""
+    grouped = frame.groupby(list(SEGMENT_COLUMNS), observed=True)
+    return pd.DataFrame({
+        'products': grouped.size(),
+        'price_min': grouped['Price'].min(),
+        'price_p25': grouped['Price'].quantile(0.25),
+        'price_median': grouped['Price'].median(),
+        'price_p75': grouped['Price'].quantile(0.75),
+        'price_max': grouped['Price'].max(),
+        'price_mean': grouped['Price'].mean(),
+        'rating_min': grouped['Rating'].min(),
+        'rating_median': grouped['Rating'].median(),
+        'rating_max': grouped['Rating'].max(),
+        'rating_mean': grouped['Rating'].mean(),
+    }).reset_index()
+
+
+class AnalyticsStore:
+    """Riwayat hasil transformasi setiap run di SQLite beserta agregat per Gender/Size.
+
+    Setiap run menambahkan barisnya ke tabel `products` (tidak pernah menimpa run
+    lama), dan agregat harga/rating per segmen disimpan di `run_aggregates` sehingga
+    pertanyaan umum dijawab dari indeks tanpa memindai seluruh riwayat. Agregat run
+    yang baru ditambah batch hanya ditandai usang dan dihitung sekali saat dibaca
+    (`aggregates`) atau saat store ditutup, bukan setiap batch.
+    """
+
+    def __init__(self, path: str = 'data/analytics.sqlite'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(runs)")}
+        if 'aggregates_stale' not in columns:  # File analitik dari versi sebelum penanda agregat usang
+            self._conn.execute("ALTER TABLE runs ADD COLUMN aggregates_stale INTEGER NOT NULL DEFAULT 0")
+        self._conn.commit()
+
+    def append_run(self, df: pd.DataFrame, run_at: datetime = None) -> int:
+        """Menambahkan hasil `clean_and_transform` sebagai bagian dari run `run_at`.
+
+        Pemanggilan berulang dengan `run_at` yang sama (misalnya per batch pada mode
+        streaming) menambah baris ke run yang sama; agregatnya ditandai usang dan
+        dihitung ulang sekali oleh `refresh_aggregates`. Mengembalikan run_id.
+        """
+        run_at = (run_at or datetime.now()).isoformat()
+        rows = [
+            tuple(None if pd.isna(value) else value for value in row)
+            for row in df[list(PRODUCT_COLUMNS)].astype(object).itertuples(index=False, name=None)
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO runs (run_at) VALUES (?)", (run_at,))
+            run_id = self._conn.execute("SELECT run_id FROM runs WHERE run_at = ?", (run_at,)).fetchone()[0]
+            self._conn.executemany(
+                f"INSERT INTO products (run_id, {', '.join(PRODUCT_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' * len(PRODUCT_COLUMNS))})",
+                [(run_id, *row) for row in rows],
+            )
+            self._conn.execute(
+                "UPDATE runs SET rows = rows + ?, aggregates_stale = 1 WHERE run_id = ?", (len(rows), run_id)
+            )
+        return run_id
+
+    def refresh_aggregates(self):
+        """Menghitung ulang agregat semua run yang ditandai usang, masing-masing sekali."""
+        with self._lock, self._conn:
+            stale = [row[0] for row in self._conn.execute("SELECT run_id FROM runs WHERE aggregates_stale = 1")]
+            for run_id in stale:
+                self._refresh_aggregates(run_id)
+                self._conn.execute("UPDATE runs SET aggregates_stale = 0 WHERE run_id = ?", (run_id,))
+
+    def _refresh_aggregates(self, run_id: int):
+        frame = pd.read_sql_query(
+            "SELECT Gender, Size, Price, Rating FROM products WHERE run_id = ?", self._conn, params=(run_id,)
+        )
+        self._conn.execute("DELETE FROM run_aggregates WHERE run_id = ?", (run_id,))
+        if frame.empty:
+            return
+        aggregates = _segment_aggregates(frame)
+        columns = ['run_id', *aggregates.columns]
+        self._conn.executemany(
+            f"INSERT INTO run_aggregates ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [(run_id, *row) for row in aggregates.astype(object).itertuples(index=False, name=None)],
+        )
+
+    def _query(self, sql: str, params=()) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def runs(self) -> pd.DataFrame:
+        """Daftar run yang tersimpan (run_id, run_at, rows), dari yang terlama."""
+        return self._query("SELECT run_id, run_at, rows FROM runs ORDER BY run_id")
+
+    def latest_run_id(self):
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        return row[0]
+
+    def price_history(self, title: str, size: str = None, gender: str = None) -> pd.DataFrame:
+        """Riwayat harga dan rating satu produk di setiap run, opsional difilter Size/Gender."""
+        sql = (
+            "SELECT r.run_at, p.Size, p.Gender, p.Price, p.Rating FROM products p "
+            "JOIN runs r ON r.run_id = p.run_id WHERE p.Title = ?"
+        )
+        params = [title]
+        if size is not None:
+            sql += " AND p.Size = ?"
+            params.append(size)
+        if gender is not None:
+            sql += " AND p.Gender = ?"
+            params.append(gender)
+        return self._query(sql + " ORDER BY p.run_id, p.Size, p.Gender", params)
+
+    def price_changes(self, run_id: int = None) -> pd.DataFrame:
+        """Produk (Title+Size+Gender) yang harganya berbeda dibanding run sebelumnya.
+
+        Default membandingkan run terbaru dengan run tepat sebelumnya.
+        """
+        run_id = run_id or self.latest_run_id()
+        if run_id is None:
+            return pd.DataFrame(columns=['Title', 'Size', 'Gender', 'old_price', 'new_price', 'change'])
+        sql = """
+            WITH current AS (
+                SELECT Title, Size, Gender, AVG(Price) AS price FROM products WHERE run_id = ?
+                GROUP BY Title, Size, Gender
+            ),
+            previous AS (
+                SELECT Title, Size, Gender, AVG(Price) AS price FROM products
+                WHERE run_id = (SELECT MAX(run_id) FROM runs WHERE run_id < ?)
+                GROUP BY Title, Size, Gender
+            )
+            SELECT c.Title, c.Size, c.Gender, p.price AS old_price, c.price AS new_price,
+                   c.price - p.price AS change
+            FROM current c JOIN previous p ON p.Title = c.Title AND p.Size = c.Size AND p.Gender = c.Gender
+            WHERE c.price <> p.price
+            ORDER BY ABS(c.price - p.price) DESC
+        """
+        return self._query(sql, (run_id, run_id))
+
+    def aggregates(self, run_id: int = None, gender: str = None, size: str = None) -> pd.DataFrame:
+        """Agregat harga/rating per Gender/Size; tanpa `run_id` mengembalikan semua run (tren)."""
+        self.refresh_aggregates()
+        sql = "SELECT r.run_at, a.* FROM run_aggregates a JOIN runs r ON r.run_id = a.run_id WHERE 1 = 1"
+        params = []
+        for column, value in (('a.run_id', run_id), ('a.Gender', gender), ('a.Size', size)):
+            if value is not None:
+                sql += f" AND {column} = ?"
+                params.append(value)
+        return self._query(sql + " ORDER BY a.run_id, a.Gender, a.Size", params)
+
+    def close(self):
+        self.refresh_aggregates()
+        self._conn.close()
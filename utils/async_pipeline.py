@@ -0,0 +1,328 @@
+"""Pipeline ETL asyncio: fetch, parse, transform, dan load berjalan bersamaan dengan antrean terbatas.
+
+Alur data:
+    fetch (N coroutine, request di thread pool) -> antrean `html`
+    -> parse (executor; process pool jika `parse_workers` diisi) -> antrean `rows`
+    -> transform per batch `clean_and_transform` (thread) -> satu antrean per sink
+    -> writer sink (satu coroutine per sink, penulisan di thread pool)
+
+Setiap antrean punya batas ukuran, sehingga tahap yang lebih cepat menunggu (backpressure)
+alih-alih menumpuk data di memori, dan total durasi mendekati durasi tahap paling lambat.
+Urutan baris mengikuti urutan halaman selesai diambil, bukan nomor halaman.
+Kedalaman antrean di-sampling berkala dan waktu sibuk/tertahan setiap tahap dilaporkan
+untuk membantu tuning `max_workers`, `parse_workers`, `queue_size`, dan `batch_rows`.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pandas as pd
+
+from utils import metrics
+from utils.extract import (
+    BASE_URL, DEFAULT_DELAY, DEFAULT_MAX_PAGES, DEFAULT_RETRIES, DEFAULT_TIMEOUT, PAGE_URL_TEMPLATE, build_page_url,
+    create_session, discover_total_pages, fetch_page, get_parser, parse_in_worker, polite_requests_per_second,
+    print_fetch_summary, record_parse, start_parse_pool,
+)
+from utils.load import (
+    DEFAULT_SINK_TIMEOUTS, OPTIONAL_SINKS, SINK_NAMES, batch_writers, merge_sink_results, record_sink_metrics, run_sink,
+    select_writers, sink_timeout_result,
+)
+from utils.transform import clean_and_transform
+
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_BATCH_ROWS = 500
+QUEUE_SAMPLE_INTERVAL = 0.05
+
+
+class StageStats:
+    """Waktu sibuk dan waktu tertahan (menunggu antrean berikutnya) satu tahap pipeline."""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+
+    async def run(self, awaitable):
+        """Menjalankan pekerjaan tahap ini dan mencatat durasinya sebagai waktu sibuk."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.busy_seconds += time.perf_counter() - start
+            self.items += 1
+
+    async def put(self, queue: asyncio.Queue, item):
+        """Mengirim item ke antrean berikutnya; waktu menunggu antrean penuh dicatat sebagai backpressure."""
+        start = time.perf_counter()
+        await queue.put(item)
+        self.blocked_seconds += time.perf_counter() - start
+
+    def report(self, wall_seconds: float) -> dict:
+        capacity = wall_seconds * self.workers
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy_seconds": self.busy_seconds,
+            "blocked_seconds": self.blocked_seconds,
+            "utilization": self.busy_seconds / capacity if capacity else 0.0,
+        }
+
+
+class QueueStats:
+    """Ringkasan kedalaman satu antrean dari sampling berkala."""
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+        self.samples = 0
+        self.total_depth = 0
+        self.max_depth = 0
+
+    def sample(self):
+        depth = self.queue.qsize()
+        self.samples += 1
+        self.total_depth += depth
+        self.max_depth = max(self.max_depth, depth)
+        return depth
+
+    def report(self) -> dict:
+        return {
+            "maxsize": self.queue.maxsize,
+            "max_depth": self.max_depth,
+            "mean_depth": self.total_depth / self.samples if self.samples else 0.0,
+        }
+
+
+class AsyncRateLimiter:
+    """Versi asyncio dari RateLimiter: membatasi jumlah request per detik untuk semua coroutine fetch."""
+
+    def __init__(self, requests_per_second=None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_time = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        wait_time = self._next_time - now
+        self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+async def _wait_all(tasks):
+    """Menunggu semua task; jika satu gagal, task lain dibatalkan agar tidak tertahan di antrean."""
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    for task in pending:
+        task.cancel()
+    for task in done:
+        task.result()
+
+
+async def run_async_pipeline(total_pages=None, sinks=SINK_NAMES, max_workers=4, parse_workers=None,
+                             requests_per_second=None, delay=DEFAULT_DELAY, base_url=BASE_URL, url_template=PAGE_URL_TEMPLATE,
+                             timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, stats=None, cache=None, parser='bs4',
+                             max_pages=DEFAULT_MAX_PAGES, queue_size=DEFAULT_QUEUE_SIZE,
+                             batch_rows=DEFAULT_BATCH_ROWS, sink_options=None, timeouts=None) -> dict:
+    """Menjalankan extract -> transform -> load secara bersamaan dengan backpressure antar tahap.
+
+    `max_workers` adalah jumlah fetch yang berjalan bersamaan dengan batas
+    `requests_per_second` (default 1/`delay`, seperti crawl paralel), `queue_size` batas setiap
+    antrean, dan `batch_rows` jumlah baris minimum per batch transform/load. Halaman yang
+    gagal diambil dilewati dan dicatat di laporan. `sink_options` diteruskan ke
+    `batch_writers` (misalnya filename_csv atau analytics_path). Setiap penulisan batch
+    dibatasi timeout per sink seperti `run_sinks` (`timeouts` menimpa
+    DEFAULT_SINK_TIMEOUTS); sink yang timeout dilewati pada batch berikutnya. Mengembalikan laporan
+    berisi jumlah baris, halaman gagal, hasil per sink, statistik tahap, dan antrean.
+    """
+    loop = asyncio.get_running_loop()
+    stats = [] if stats is None else stats
+    parser_name = get_parser(parser).name
+    writer_names = list(select_writers(dict.fromkeys(SINK_NAMES + OPTIONAL_SINKS), sinks))
+    run_timestamp = datetime.now()
+    started = time.perf_counter()
+
+    # Process pool dibuat sebelum thread fetch berjalan (lihat start_parse_pool)
+    parse_executor = start_parse_pool(parse_workers) if parse_workers else ThreadPoolExecutor(max_workers=1)
+    parse_count = parse_workers or 1
+    timeouts = {**DEFAULT_SINK_TIMEOUTS, **(timeouts or {})}
+    session = create_session(pool_size=max_workers)
+    fetch_options = {"session": session, "timeout": timeout, "retries": retries, "stats": stats}
+    fetch_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch')
+    transform_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transform')
+    sink_executor = ThreadPoolExecutor(max_workers=max(1, len(writer_names)), thread_name_prefix='sink')
+
+    html_queue = asyncio.Queue(maxsize=queue_size)
+    rows_queue = asyncio.Queue(maxsize=queue_size)
+    sink_queues = {name: asyncio.Queue(maxsize=queue_size) for name in writer_names}
+    queues = {"html": QueueStats(html_queue), "rows": QueueStats(rows_queue)}
+    queues.update({f"sink_{name}": QueueStats(queue) for name, queue in sink_queues.items()})
+    stages = {
+        "fetch": StageStats("fetch", max_workers),
+        "parse": StageStats("parse", parse_count),
+        "transform": StageStats("transform"),
+    }
+    stages.update({f"load_{name}": StageStats(f"load_{name}") for name in writer_names})
+    failed_pages = []
+    sink_results = {name: [] for name in writer_names}
+    rows_loaded = 0
+
+    try:
+        prefetched = {}
+        if total_pages is None:
+            total_pages = await loop.run_in_executor(
+                fetch_executor, discover_total_pages, base_url, url_template, fetch_options, cache, max_pages,
+                prefetched,
+            )
+        pages = iter(range(1, total_pages + 1))
+        rate_limiter = AsyncRateLimiter(polite_requests_per_second(requests_per_second, delay))
+
+        async def fetch_worker():
+            for page_number in pages:  # Iterator dibagi antar coroutine; aman karena satu event loop
+                url = build_page_url(page_number, base_url, url_template)
+                await rate_limiter.wait()
+                print(f"Scraping halaman: {url}")
+                content, cached_rows = await stages["fetch"].run(
+                    loop.run_in_executor(fetch_executor, fetch_page, url, fetch_options, cache, prefetched)
+                )
+                if cached_rows is None and not content:
+                    print(f"Gagal mengambil data dari halaman {page_number}, halaman dilewati.")
+                    failed_pages.append(page_number)
+                    continue
+                await stages["fetch"].put(html_queue, (page_number, url, content, cached_rows))
+
+        async def fetch_stage():
+            await _wait_all([asyncio.ensure_future(fetch_worker()) for _ in range(max_workers)])
+            for _ in range(parse_count):
+                await html_queue.put(None)
+
+        async def parse_worker():
+            while True:
+                item = await html_queue.get()
+                if item is None:
+                    return
+                page_number, url, content, products = item
+                if products is None:
+                    try:
+                        products, duration = await stages["parse"].run(
+                            loop.run_in_executor(parse_executor, parse_in_worker, content, page_number, parser_name)
+                        )
+                    except Exception as e:
+                        print(f"Terjadi kesalahan saat parsing halaman {page_number}: {e}")
+                        continue
+                    record_parse(duration, products)
+                    if cache is not None:
+                        cache.store_rows(url, products)
+                if products:
+                    await stages["parse"].put(rows_queue, products)
+
+        async def parse_stage():
+            await _wait_all([asyncio.ensure_future(parse_worker()) for _ in range(parse_count)])
+            await rows_queue.put(None)
+
+        async def emit_batch(buffer):
+            nonlocal rows_loaded
+            df_cleaned = await stages["transform"].run(
+                loop.run_in_executor(transform_executor, clean_and_transform, pd.DataFrame(buffer))
+            )
+            if df_cleaned.empty:
+                return
+            rows_loaded += len(df_cleaned)
+            for queue in sink_queues.values():
+                await stages["transform"].put(queue, df_cleaned)
+
+        async def transform_stage():
+            buffer = []
+            while True:
+                products = await rows_queue.get()
+                if products is None:
+                    break
+                buffer.extend(products)
+                if len(buffer) >= batch_rows:
+                    await emit_batch(buffer)
+                    buffer = []
+            if buffer:
+                await emit_batch(buffer)
+            for queue in sink_queues.values():
+                await queue.put(None)
+
+        async def sink_writer(name):
+            queue, stage = sink_queues[name], stages[f"load_{name}"]
+            batch_number = 0
+            timed_out = False
+            while True:
+                df = await queue.get()
+                if df is None:
+                    return
+                if timed_out:
+                    # Penulisan yang timeout mungkin masih berjalan; batch berikutnya tidak ditumpuk di atasnya
+                    skipped = sink_timeout_result(name, "Dilewati setelah timeout pada batch sebelumnya")
+                    sink_results[name].append(skipped)
+                    continue
+                write = batch_writers(df, batch_number, run_timestamp, **(sink_options or {}))[name]
+                start = time.perf_counter()
+                try:
+                    result = await stage.run(asyncio.wait_for(
+                        loop.run_in_executor(sink_executor, run_sink, name, write, len(df)), timeouts.get(name)
+                    ))
+                except asyncio.TimeoutError:
+                    timed_out = True
+                    result = sink_timeout_result(
+                        name, f"Timeout setelah {timeouts[name]} detik", time.perf_counter() - start
+                    )
+                sink_results[name].append(record_sink_metrics([result])[0])
+                batch_number += 1
+
+        async def sample_queues():
+            while True:
+                for name, queue_stats in queues.items():
+                    metrics.observe('pipeline_queue_depth', queue_stats.sample(), queue=name)
+                await asyncio.sleep(QUEUE_SAMPLE_INTERVAL)
+
+        sampler = asyncio.ensure_future(sample_queues())
+        try:
+            await _wait_all([
+                asyncio.ensure_future(fetch_stage()),
+                asyncio.ensure_future(parse_stage()),
+                asyncio.ensure_future(transform_stage()),
+                *(asyncio.ensure_future(sink_writer(name)) for name in writer_names),
+            ])
+        finally:
+            sampler.cancel()
+    finally:
+        fetch_executor.shutdown(wait=True, cancel_futures=True)
+        parse_executor.shutdown(wait=True, cancel_futures=True)
+        transform_executor.shutdown(wait=True)
+        sink_executor.shutdown(wait=False)  # Thread sink yang timeout dibiarkan selesai di latar belakang
+        session.close()
+
+    wall_seconds = time.perf_counter() - started
+    print_fetch_summary(stats)
+    report = {
+        "rows": rows_loaded,
+        "pages": total_pages,
+        "failed_pages": sorted(failed_pages),
+        "duration_seconds": wall_seconds,
+        "sinks": [merge_sink_results(name, results) for name, results in sink_results.items()],
+        "stages": {name: stage.report(wall_seconds) for name, stage in stages.items()},
+        "queues": {name: queue_stats.report() for name, queue_stats in queues.items()},
+    }
+    for name, stage in report["stages"].items():
+        metrics.inc('pipeline_stage_busy_seconds_total', stage["busy_seconds"], stage=name)
+        metrics.inc('pipeline_stage_blocked_seconds_total', stage["blocked_seconds"], stage=name)
+    return report
+
+
+def print_pipeline_report(report: dict):
+    """Menampilkan utilisasi setiap tahap dan kedalaman antrean ke console."""
+    print(f"[Pipeline] {report['rows']} baris dari {report['pages']} halaman dalam {report['duration_seconds']:.2f}s"
+          + (f", halaman gagal: {report['failed_pages']}" if report["failed_pages"] else ""))
+    for name, stage in report["stages"].items():
+        print(f"[Pipeline] tahap {name:<16} {stage['workers']:>2} worker  {stage['items']:>5} item  "
+              f"sibuk {stage['busy_seconds']:7.2f}s  tertahan {stage['blocked_seconds']:7.2f}s  "
+              f"utilisasi {stage['utilization']:6.1%}")
+    for name, queue in report["queues"].items():
+        print(f"[Pipeline] antrean {name:<14} maks {queue['max_depth']:>3}/{queue['maxsize']:<3} "
+              f"rata-rata {queue['mean_depth']:5.2f}")
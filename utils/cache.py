@@ -0,0 +1,148 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+
+class ResponseCache:
+    """Cache respons HTTP di disk (SQLite) yang menyimpan validator ETag/Last-Modified.
+
+    Setiap entri juga dapat menyimpan hasil parsing halaman sehingga respons
+    `304 Not Modified` tidak perlu di-download maupun di-parsing ulang. Entri yang
+    lebih tua dari `ttl` detik dianggap kedaluwarsa, dan total ukuran body dibatasi
+    `max_bytes` dengan eviksi least-recently-used.
+    """
+
+    def __init__(self, path: str = '.cache/http_cache.sqlite', ttl: float = 7 * 24 * 3600,
+                 max_bytes: int = 50 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                rows TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    def _fresh_entry(self, url):
+        """Mengambil entri yang belum kedaluwarsa; entri kedaluwarsa langsung dihapus."""
+        row = self._conn.execute(
+            "SELECT etag, last_modified, stored_at FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        if self.ttl is not None and time.time() - row[2] > self.ttl:
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._conn.commit()
+            return None
+        return row
+
+    def conditional_headers(self, url: str) -> dict:
+        """Membentuk header If-None-Match/If-Modified-Since untuk URL yang sudah di-cache."""
+        with self._lock:
+            row = self._fresh_entry(url)
+        if row is None:
+            return {}
+        headers = {}
+        if row[0]:
+            headers['If-None-Match'] = row[0]
+        if row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def _touch(self, url, revalidated=False):
+        now = time.time()
+        if revalidated:
+            self._conn.execute("UPDATE responses SET accessed_at = ?, stored_at = ? WHERE url = ?", (now, now, url))
+        else:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+        self._conn.commit()
+
+    def get_body(self, url: str):
+        """Mengembalikan body tersimpan setelah server mengonfirmasi 304, atau None."""
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self._touch(url, revalidated=True)
+        return row[0]
+
+    def get_rows(self, url: str):
+        """Mengembalikan hasil parsing tersimpan untuk URL (dengan Timestamp baru), atau None."""
+        with self._lock:
+            row = self._conn.execute("SELECT rows FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None or row[0] is None:
+                return None
+            self._touch(url, revalidated=True)
+        timestamp = datetime.now()
+        return [{**product, "Timestamp": timestamp} for product in json.loads(row[0])]
+
+    def store(self, url: str, body: bytes, etag=None, last_modified=None):
+        """Menyimpan body respons beserta validatornya, lalu menjalankan eviksi jika perlu."""
+        if not etag and not last_modified:
+            return  # Tanpa validator, conditional GET tidak mungkin dilakukan
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (url, etag, last_modified, body, rows, size, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, NULL, ?, ?, ?)
+                """,
+                (url, etag, last_modified, body, len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def store_rows(self, url: str, rows):
+        """Menyimpan hasil parsing halaman (tanpa Timestamp) untuk dipakai saat 304."""
+        payload = json.dumps([
+            {key: value for key, value in product.items() if key != "Timestamp"} for product in rows
+        ])
+        with self._lock:
+            self._conn.execute("UPDATE responses SET rows = ? WHERE url = ?", (payload, url))
+            self._conn.commit()
+
+    def total_size(self) -> int:
+        """Total ukuran body yang tersimpan (bytes)."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _evict(self):
+        """Menghapus entri yang paling lama tidak diakses hingga total ukuran <= max_bytes."""
+        if self.max_bytes is None:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+
+    def __contains__(self, url):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM responses WHERE url = ?", (url,)).fetchone() is not None
+
+    def close(self):
+        self._conn.close()
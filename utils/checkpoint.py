@@ -0,0 +1,109 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+def _encode_rows(rows) -> str:
+    return json.dumps([
+        {**product, "Timestamp": product["Timestamp"].isoformat()} if isinstance(product.get("Timestamp"), datetime)
+        else product
+        for product in rows
+    ])
+
+
+def _decode_rows(payload: str) -> list:
+    rows = json.loads(payload)
+    for product in rows:
+        if isinstance(product.get("Timestamp"), str):
+            product["Timestamp"] = datetime.fromisoformat(product["Timestamp"])
+    return rows
+
+
+class CrawlCheckpoint:
+    """Checkpoint crawl di SQLite: status setiap halaman beserta produk hasil ekstraksinya.
+
+    Halaman yang selesai disimpan dengan status 'done' (termasuk Timestamp aslinya),
+    sedangkan halaman yang gagal diambil disimpan dengan status 'failed' untuk di-retry.
+    Beberapa crawl dapat berbagi satu file dengan nama `crawl` yang berbeda.
+    """
+
+    def __init__(self, path: str = '.state/crawl_checkpoint.sqlite', crawl: str = 'fashion-studio'):
+        self.path = path
+        self.crawl = crawl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                crawl TEXT NOT NULL,
+                page_number INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                rows TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (crawl, page_number)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _write(self, page_number, status, rows):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO pages (crawl, page_number, status, rows, attempts, updated_at) VALUES (?, ?, ?, ?, 1, ?)
+                ON CONFLICT (crawl, page_number) DO UPDATE SET status = excluded.status, rows = excluded.rows,
+                                                              attempts = attempts + 1,
+                                                              updated_at = excluded.updated_at
+                """,
+                (self.crawl, page_number, status, rows, datetime.now().isoformat()),
+            )
+            self._conn.commit()
+
+    def mark_done(self, page_number: int, rows):
+        """Mencatat halaman selesai beserta produk hasil ekstraksinya."""
+        self._write(page_number, 'done', _encode_rows(rows))
+
+    def mark_failed(self, page_number: int):
+        """Mencatat halaman yang gagal diambil agar di-retry pada percobaan berikutnya."""
+        self._write(page_number, 'failed', None)
+
+    def _pages_with_status(self, status) -> list:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT page_number FROM pages WHERE crawl = ? AND status = ? ORDER BY page_number",
+                (self.crawl, status),
+            )]
+
+    def completed_pages(self) -> list:
+        """Nomor halaman yang sudah selesai, terurut."""
+        return self._pages_with_status('done')
+
+    def failed_pages(self) -> list:
+        """Nomor halaman yang terakhir kali gagal diambil, terurut."""
+        return self._pages_with_status('failed')
+
+    def load_rows(self, page_number: int) -> list:
+        """Mengembalikan produk tersimpan untuk halaman yang selesai, atau list kosong."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rows FROM pages WHERE crawl = ? AND page_number = ? AND status = 'done'",
+                (self.crawl, page_number),
+            ).fetchone()
+        if row is None or row[0] is None:
+            return []
+        return _decode_rows(row[0])
+
+    def reset(self):
+        """Menghapus seluruh checkpoint crawl ini untuk memulai crawl baru dari awal."""
+        with self._lock:
+            self._conn.execute("DELETE FROM pages WHERE crawl = ?", (self.crawl,))
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
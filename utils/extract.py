@@ -1,9 +1,25 @@
+import os
 import time
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from utils.parsers import LxmlParser, extract_card_fields
+from utils.records import ProductColumns
+from utils import metrics
+
+BASE_URL = 'https://fashion-studio.dicoding.dev/'
+PAGE_URL_TEMPLATE = '{base_url}page{page_number}'  # Halaman 1 selalu berada di base_url
+DEFAULT_MAX_PAGES = 1000
+DEFAULT_TIMEOUT = (5, 15)  # (connect, read) dalam detik
+DEFAULT_RETRIES = 3
+DEFAULT_DELAY = 2  # Jeda antar halaman (detik) pada jalur sekuensial
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 HEADERS = {
     "User-Agent": (
@@ -12,15 +28,160 @@ HEADERS = {
     )
 }
 
-def fetching_content(url: str):
-    """Mengambil konten dari URL dengan penanganan kesalahan jaringan."""
-    try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()  # status code sukses
-        return response.content
-    except requests.RequestException as e:
-        print(f"Error fetching content from {url}: {e}")
-        return None
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """Membuat requests.Session dengan connection pool keep-alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Mengembalikan session bersama yang dipakai ulang antar pemanggilan."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def _retry_delay(attempt, backoff_factor, response=None):
+    """Menghitung jeda backoff eksponensial, menghormati header Retry-After jika ada."""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+    return backoff_factor * (2 ** attempt)
+
+
+def _record_fetch(stats, url, start, attempt, status, size=0):
+    """Mencatat latensi dan jumlah retry satu request ke list stats dan metrik run aktif."""
+    latency = time.perf_counter() - start
+    metrics.observe('fetch_duration_seconds', latency)
+    metrics.inc('fetch_requests_total', status=status)
+    metrics.inc('fetch_bytes_total', size)
+    metrics.inc('fetch_retries_total', attempt)
+    if stats is not None:
+        stats.append({
+            "url": url,
+            "status": status,
+            "latency": latency,
+            "retries": attempt,
+            "bytes": size,
+        })
+
+
+def request_with_retry(url: str, session=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                       backoff_factor=0.5, stats=None, headers=None):
+    """Mengirim GET melalui session pooled dan mengembalikan objek response, atau None jika gagal.
+
+    Request diulang dengan backoff eksponensial untuk status 5xx/429 serta kesalahan
+    koneksi atau timeout.
+    """
+    session = session or get_session()
+    request_headers = {**HEADERS, **headers} if headers else HEADERS
+    start = time.perf_counter()
+    attempt = 0
+    while True:
+        try:
+            response = session.get(url, headers=request_headers, timeout=timeout)
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                delay = _retry_delay(attempt, backoff_factor, response)
+                print(f"Status {response.status_code} dari {url}, mencoba ulang dalam {delay:.1f} detik...")
+            else:
+                response.raise_for_status()  # status code sukses
+                _record_fetch(stats, url, start, attempt, response.status_code, len(response.content))
+                return response
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= retries:
+                print(f"Error fetching content from {url}: {e}")
+                _record_fetch(stats, url, start, attempt, None)
+                return None
+            delay = _retry_delay(attempt, backoff_factor)
+            print(f"Koneksi ke {url} gagal ({e}), mencoba ulang dalam {delay:.1f} detik...")
+        except requests.RequestException as e:
+            print(f"Error fetching content from {url}: {e}")
+            _record_fetch(stats, url, start, attempt, getattr(e.response, 'status_code', None))
+            return None
+        attempt += 1
+        time.sleep(delay)
+
+
+def fetching_content(url: str, session=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                     backoff_factor=0.5, stats=None):
+    """Mengambil konten dari URL dengan penanganan kesalahan jaringan.
+
+    Request dikirim melalui session pooled dan diulang dengan backoff eksponensial
+    untuk status 5xx/429 serta kesalahan koneksi atau timeout.
+    """
+    response = request_with_retry(url, session, timeout, retries, backoff_factor, stats)
+    return response.content if response is not None else None
+
+
+def fetch_with_cache(url: str, cache, session=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                     backoff_factor=0.5, stats=None):
+    """Mengambil konten dengan conditional GET terhadap ResponseCache.
+
+    Mengembalikan tuple (content, cached_rows). Jika server membalas 304 dan hasil
+    parsing halaman tersimpan, `cached_rows` berisi produk dari cache dan `content`
+    bernilai None sehingga download dan parsing dapat dilewati. Jika body cache sudah
+    hilang (tereviksi) atau rusak saat 304 diterima, request diulang tanpa header
+    conditional agar halaman tidak dianggap gagal.
+    """
+    response = request_with_retry(
+        url, session, timeout, retries, backoff_factor, stats,
+        headers=cache.conditional_headers(url),
+    )
+    if response is None:
+        return None, None
+
+    if response.status_code == 304:
+        rows = cache.get_rows(url)
+        if rows is not None:
+            return None, rows
+        body = cache.get_body(url)
+        if body:
+            return body, None
+        response = request_with_retry(url, session, timeout, retries, backoff_factor, stats)
+        if response is None or response.status_code == 304:
+            return None, None
+
+    cache.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    return response.content, None
+
+
+def summarize_fetch_stats(stats):
+    """Meringkas list stats request menjadi jumlah request, retry, dan latensi."""
+    if not stats:
+        return {"requests": 0, "retries": 0, "failed": 0, "not_modified": 0, "bytes": 0,
+                "latency_mean": 0.0, "latency_p95": 0.0, "latency_max": 0.0}
+    latencies = sorted(item["latency"] for item in stats)
+    p95_index = min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))
+    return {
+        "requests": len(stats),
+        "retries": sum(item["retries"] for item in stats),
+        "failed": sum(1 for item in stats if item["status"] is None or item["status"] >= 400),
+        "not_modified": sum(1 for item in stats if item["status"] == 304),
+        "bytes": sum(item["bytes"] for item in stats),
+        "latency_mean": sum(latencies) / len(latencies),
+        "latency_p95": latencies[p95_index],
+        "latency_max": latencies[-1],
+    }
+
+
+def print_fetch_summary(stats):
+    """Menampilkan ringkasan performa request ke console."""
+    summary = summarize_fetch_stats(stats)
+    print(
+        f"[Fetch] {summary['requests']} request, {summary['retries']} retry, {summary['failed']} gagal, "
+        f"{summary['not_modified']} tidak berubah (304), "
+        f"latensi rata-rata {summary['latency_mean']:.3f}s, p95 {summary['latency_p95']:.3f}s"
+    )
 
 
 def extract_clean_text(info_list, keyword, pattern, default="N/A"):
@@ -33,8 +194,12 @@ def extract_clean_text(info_list, keyword, pattern, default="N/A"):
     return default
 
 
-def extract_product_data(card):
-    """Mengambil data produk dari elemen dengan class 'collection-card'."""
+def extract_product_data(card, timestamp=None):
+    """Mengambil data produk dari elemen dengan class 'collection-card'.
+
+    `timestamp` adalah waktu halaman yang diberikan `parse_page` untuk semua card;
+    waktu saat ini hanya dipakai jika fungsi dipanggil langsung tanpa timestamp.
+    """
     try:
         # Title
         title_element = card.select_one('.product-details h3.product-title')
@@ -44,26 +209,18 @@ def extract_product_data(card):
         price_element = card.find('div', class_='price-container')
         price = price_element.text.strip() if price_element else "Price Not Available"
 
-        # Info Paragraf
-        info_paragraphs = card.find_all('p')
-
-        rating = extract_clean_text(info_paragraphs, "Rating", r"Rating:\s*(⭐\s*\d+(?:\.\d+)?)", "Invalid Rating")
-        colors = extract_clean_text(info_paragraphs, "Colors", r"(\d+)\s*Colors", "No Colors")
-        size = extract_clean_text(info_paragraphs, "Size", r"Size:\s*(\w+)", "Unknown")
-        gender = extract_clean_text(info_paragraphs, "Gender", r"Gender:\s*(\w+)", "Unknown")
-
-        # Timestamp waktu pengambilan data
-        timestamp = datetime.now()
+        # Info Paragraf (Rating, Colors, Size, Gender) dalam satu kali iterasi
+        fields = extract_card_fields(p.string for p in card.find_all('p'))
 
         # Mengembalikan hasil ekstraksi sebagai dictionary
         return {
             "Title": title,
             "Price": price,
-            "Rating": rating,
-            "Colors": colors,
-            "Size": size,
-            "Gender": gender,
-            "Timestamp": timestamp
+            "Rating": fields["Rating"],
+            "Colors": fields["Colors"],
+            "Size": fields["Size"],
+            "Gender": fields["Gender"],
+            "Timestamp": timestamp if timestamp is not None else datetime.now()
         }
 
     except Exception as e:
@@ -71,41 +228,590 @@ def extract_product_data(card):
         return None
 
 
-def scrape_fashion_products(total_pages, delay=2):
-    """Scraping data fashion dari beberapa halaman dan menyimpannya ke list dengan penanganan kesalahan."""
-    data = []
-    for page_number in range(1, total_pages + 1):
-        if page_number == 1:
-            url = 'https://fashion-studio.dicoding.dev/'
+def build_page_url(page_number: int, base_url: str = BASE_URL, url_template: str = PAGE_URL_TEMPLATE) -> str:
+    """Membentuk URL halaman katalog berdasarkan nomor halaman dan template URL."""
+    if page_number == 1:
+        return base_url
+    return url_template.format(base_url=base_url, page_number=page_number)
+
+
+_PAGE_OF_PATTERN = re.compile(r'Page\s+\d+\s+of\s+(\d+)', re.IGNORECASE)
+_HREF_PATTERN = re.compile(r'href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+def _page_link_pattern(url_template: str):
+    """Regex nomor halaman pada href, dibentuk dari bagian template setelah base_url."""
+    prefix, _, suffix = url_template.replace('{base_url}', '').partition('{page_number}')
+    return re.compile(re.escape(prefix) + r'(\d+)' + re.escape(suffix) + r'/?(?:[?#]|$)')
+
+
+def parse_total_pages(content, url_template: str = PAGE_URL_TEMPLATE):
+    """Membaca jumlah halaman dari markup pagination halaman pertama.
+
+    Mengembalikan tuple (jumlah_halaman, pasti). Teks "Page X of N" memberi jumlah
+    pasti; jika tidak ada, nomor halaman terbesar pada link pagination dipakai
+    sebagai batas bawah (pasti=False). Mengembalikan (None, False) jika keduanya tidak ada.
+    """
+    if not content:
+        return None, False
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='replace')
+    match = _PAGE_OF_PATTERN.search(content)
+    if match:
+        return int(match.group(1)), True
+    link_pattern = _page_link_pattern(url_template)
+    pages = [
+        int(link.group(1)) for link in map(link_pattern.search, _HREF_PATTERN.findall(content)) if link
+    ]
+    return (max(pages), False) if pages else (None, False)
+
+
+def _page_exists(page_number, base_url, url_template, fetch_options) -> bool:
+    content = fetching_content(build_page_url(page_number, base_url, url_template), **fetch_options)
+    if not content:
+        return False
+    marker = b'collection-card' if isinstance(content, bytes) else 'collection-card'
+    return marker in content
+
+
+def probe_total_pages(base_url: str = BASE_URL, url_template: str = PAGE_URL_TEMPLATE, fetch_options=None,
+                      known_page: int = 1, max_pages: int = DEFAULT_MAX_PAGES, max_workers: int = 8) -> int:
+    """Mencari halaman terakhir dengan probe paralel lalu binary search.
+
+    Halaman `known_page + 1, +2, +4, ...` (hingga `max_pages`) diperiksa sekaligus
+    secara paralel, lalu batas antara halaman ada dan tidak ada dipersempit dengan
+    binary search. Diasumsikan halaman bernomor urut tanpa celah.
+    """
+    fetch_options = fetch_options or {}
+    candidates = []
+    step = 1
+    while known_page + step <= max_pages:
+        candidates.append(known_page + step)
+        step *= 2
+    if not candidates:
+        return known_page
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        exists = list(executor.map(
+            lambda page_number: _page_exists(page_number, base_url, url_template, fetch_options), candidates
+        ))
+
+    low, high = known_page, None
+    for page_number, found in zip(candidates, exists):
+        if not found:
+            high = page_number
+            break
+        low = page_number
+    if high is None:
+        return low  # Semua kandidat ada: dibatasi max_pages
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if _page_exists(middle, base_url, url_template, fetch_options):
+            low = middle
         else:
-            url = f'https://fashion-studio.dicoding.dev/page{page_number}'
-        
+            high = middle
+    return low
+
+
+def discover_total_pages(base_url: str = BASE_URL, url_template: str = PAGE_URL_TEMPLATE, fetch_options=None,
+                         cache=None, max_pages: int = DEFAULT_MAX_PAGES, prefetched=None) -> int:
+    """Menentukan jumlah halaman katalog dari halaman pertama, dengan probe sebagai cadangan.
+
+    Hasil request halaman pertama disimpan ke dict `prefetched` (jika diberikan) sebagai
+    tuple (content, cached_rows) seperti `fetch_page`, baik dengan maupun tanpa cache,
+    agar halaman pertama tidak diminta ulang saat crawl. Mengembalikan 0 jika halaman
+    pertama gagal diambil.
+    """
+    fetch_options = fetch_options or {}
+    url = build_page_url(1, base_url, url_template)
+    if cache is not None:
+        content, cached_rows = fetch_with_cache(url, cache, **fetch_options)
+        fetched = content is not None or cached_rows is not None
+        if content is None and url in cache:
+            content = cache.get_body(url)  # Body tersimpan untuk membaca pagination (304 atau request gagal)
+    else:
+        content, cached_rows = fetching_content(url, **fetch_options), None
+        fetched = bool(content)
+    if fetched and content and prefetched is not None:
+        # Pada 304 dengan produk tersimpan, crawl memakai produk dari cache tanpa parsing ulang
+        prefetched[url] = (None, cached_rows) if cached_rows is not None else (content, None)
+    if not content:
+        print(f"Gagal mengambil halaman pertama {url}, jumlah halaman tidak dapat ditentukan.")
+        return 0
+
+    total_pages, exact = parse_total_pages(content, url_template)
+    if not exact:
+        total_pages = probe_total_pages(base_url, url_template, fetch_options, total_pages or 1, max_pages)
+    total_pages = min(total_pages, max_pages)
+    print(f"Jumlah halaman terdeteksi: {total_pages}{'' if exact else ' (probe)'}")
+    return total_pages
+
+
+def polite_requests_per_second(requests_per_second=None, delay=DEFAULT_DELAY):
+    """Batas request per detik yang dipakai: nilai eksplisit, atau 1/`delay` agar crawl paralel tetap sopan.
+
+    Mengembalikan None (tanpa batas) hanya jika keduanya tidak diisi atau `delay` bernilai 0.
+    """
+    if requests_per_second:
+        return requests_per_second
+    return 1.0 / delay if delay else None
+
+
+class RateLimiter:
+    """Membatasi jumlah request per detik secara global untuk semua thread."""
+
+    def __init__(self, requests_per_second=None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """Menunggu hingga slot request berikutnya tersedia."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class BeautifulSoupParser:
+    """Backend parser default berbasis BeautifulSoup (html.parser)."""
+
+    name = 'bs4'
+
+    def iter_cards(self, content):
+        soup = BeautifulSoup(content, "html.parser")
+        return soup.find_all('div', class_='collection-card')
+
+    def extract(self, card, timestamp=None):
+        return extract_product_data(card, timestamp)
+
+
+PARSER_BACKENDS = {
+    'bs4': BeautifulSoupParser,
+    'lxml': LxmlParser,
+}
+
+
+def get_parser(name: str = 'bs4'):
+    """Membuat backend parser berdasarkan nama, kembali ke BeautifulSoup jika dependensinya tidak tersedia."""
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Parser '{name}' tidak dikenal. Pilihan: {', '.join(PARSER_BACKENDS)}")
+    try:
+        return PARSER_BACKENDS[name]()
+    except ImportError as e:
+        print(f"Parser '{name}' tidak tersedia ({e}), menggunakan BeautifulSoup.")
+        return BeautifulSoupParser()
+
+
+def parse_page(content, page_number, parser=None):
+    """Parsing konten HTML satu halaman menjadi list data produk.
+
+    Semua produk dalam satu halaman berbagi satu objek Timestamp (waktu halaman
+    diproses) alih-alih satu objek per card.
+    """
+    parser = parser or BeautifulSoupParser()
+    products = []
+    cards = parser.iter_cards(content)
+    if not cards:
+        print(f"Tidak ada produk ditemukan di halaman {page_number}.")
+        return products
+
+    timestamp = datetime.now()
+    for card in cards:
+        try:
+            product = parser.extract(card, timestamp)
+            if product:
+                products.append(product)
+        except Exception as e:
+            print(f"Terjadi kesalahan saat mengekstrak data produk pada halaman {page_number}: {e}")
+    return products
+
+
+def fetch_page(url, fetch_options, cache=None, prefetched=None):
+    """Mengambil konten satu halaman; mengembalikan tuple (content, cached_rows).
+
+    Hasil di `prefetched` (misalnya halaman pertama dari deteksi pagination) dipakai
+    tanpa request ulang. Jika `cache` diberikan dan halaman tidak berubah (304),
+    `cached_rows` berisi produk dari cache.
+    """
+    if prefetched and url in prefetched:
+        return prefetched.pop(url)
+    if cache is not None:
+        return fetch_with_cache(url, cache, **fetch_options)
+    return fetching_content(url, **fetch_options), None
+
+
+def _fetch_and_parse(url, page_number, fetch_options, cache=None, parser=None, prefetched=None):
+    """Mengambil dan parsing satu halaman; mengembalikan None jika fetching gagal.
+
+    Produk dari cache (respons 304) dikembalikan tanpa download dan parsing ulang.
+    """
+    content, cached_rows = fetch_page(url, fetch_options, cache, prefetched)
+    if cached_rows is not None:
+        return cached_rows
+    if not content:
+        return None
+
+    start = time.perf_counter()
+    try:
+        products = parse_page(content, page_number, parser)
+    except Exception as e:
+        print(f"Terjadi kesalahan saat parsing halaman {page_number}: {e}")
+        return []
+    record_parse(time.perf_counter() - start, products)
+    if cache is not None:
+        cache.store_rows(url, products)
+    return products
+
+
+def record_parse(duration, products):
+    """Mencatat durasi parsing satu halaman dan jumlah produk yang dihasilkan."""
+    metrics.observe('parse_duration_seconds', duration)
+    metrics.inc('rows_out_total', len(products), stage='parse')
+
+
+_worker_parsers = {}
+
+
+def parse_in_worker(content, page_number, parser_name):
+    """Parsing satu halaman di proses worker; mengembalikan (produk, durasi parsing).
+
+    Backend parser dibuat sekali per proses. Durasi dikembalikan ke proses utama
+    karena metrik hanya dicatat di sana.
+    """
+    parser = _worker_parsers.get(parser_name)
+    if parser is None:
+        parser = _worker_parsers[parser_name] = get_parser(parser_name)
+    start = time.perf_counter()
+    products = parse_page(content, page_number, parser)
+    return products, time.perf_counter() - start
+
+
+def start_parse_pool(parse_workers):
+    """Membuat ProcessPoolExecutor dan menyalakan semua worker-nya sebelum thread lain berjalan.
+
+    Worker dibuat dari thread utama selagi belum ada thread fetch, sehingga fork
+    tidak mewarisi lock yang sedang dipegang thread lain.
+    """
+    executor = ProcessPoolExecutor(max_workers=parse_workers)
+    for future in [executor.submit(int) for _ in range(parse_workers)]:
+        future.result()
+    return executor
+
+
+def _parse_result(page_number, future):
+    """Mengambil hasil parsing dari process pool; kesalahan parsing menghasilkan list kosong."""
+    try:
+        products, duration = future.result()
+    except Exception as e:
+        print(f"Terjadi kesalahan saat parsing halaman {page_number}: {e}")
+        return []
+    record_parse(duration, products)
+    return products
+
+
+def parse_pages_parallel(pages, parser='bs4', parse_workers=None):
+    """Parsing banyak konten halaman di process pool, menghasilkan list produk sesuai urutan.
+
+    `pages` adalah iterable konten HTML (halaman ke-1, ke-2, ...). Jumlah halaman yang
+    sedang diproses dibatasi dua kali jumlah worker agar memori tetap terkendali.
+    """
+    parse_workers = parse_workers or os.cpu_count() or 1
+    parser_name = get_parser(parser).name
+    executor = start_parse_pool(parse_workers)
+    in_flight = deque()
+    try:
+        for page_number, content in enumerate(pages, start=1):
+            in_flight.append((page_number, executor.submit(parse_in_worker, content, page_number, parser_name)))
+            if len(in_flight) >= 2 * parse_workers:
+                yield _parse_result(*in_flight.popleft())
+        while in_flight:
+            yield _parse_result(*in_flight.popleft())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _scrape_single_page(page_number, base_url, rate_limiter, fetch_options, cache=None, parser=None,
+                        url_template=PAGE_URL_TEMPLATE, prefetched=None):
+    """Menunggu slot rate limiter lalu mengambil dan parsing satu halaman."""
+    url = build_page_url(page_number, base_url, url_template)
+    rate_limiter.wait()
+    print(f"Scraping halaman: {url}")
+    return _fetch_and_parse(url, page_number, fetch_options, cache, parser, prefetched)
+
+
+def _iter_pages_sequential(page_numbers, base_url, fetch_options, delay, cache=None, parser=None,
+                           url_template=PAGE_URL_TEMPLATE, prefetched=None):
+    """Generator halaman sekuensial: menghasilkan pasangan (nomor halaman, produk atau None jika gagal)."""
+    for page_number in page_numbers:
+        url = build_page_url(page_number, base_url, url_template)
+
         print(f"Scraping halaman: {url}")
-        content = fetching_content(url)
-
-        if content:
-            try:
-                # Parsing HTML dengan BeautifulSoup
-                soup = BeautifulSoup(content, "html.parser")
-                cards = soup.find_all('div', class_='collection-card')
-                if not cards:
-                    print(f"Tidak ada produk ditemukan di halaman {page_number}.")
-                    continue  # Jika tidak ada produk, maka akan melanjutkan ke halaman berikutnya
-                
-                for card in cards:
-                    try:
-                        product = extract_product_data(card)
-                        if product:
-                            data.append(product)
-                    except Exception as e:
-                        print(f"Terjadi kesalahan saat mengekstrak data produk pada halaman {page_number}: {e}")
-                time.sleep(delay)  # Delay antar halaman 
-            except Exception as e:
-                print(f"Terjadi kesalahan saat parsing halaman {page_number}: {e}")
-                continue  # Jika terjadi kesalahan parsing, maka akan melanjutkan ke halaman berikutnya
-        else:
-            print(f"Gagal mengambil data dari halaman {page_number}, berhenti scraping.")
-            break  # Jika gagal fetching, maka akan menghentikan proses
+        products = _fetch_and_parse(url, page_number, fetch_options, cache, parser, prefetched)
+        yield page_number, products
+        if products:
+            time.sleep(delay)  # Delay antar halaman
 
+
+def _iter_pages_concurrent(page_numbers, max_workers, requests_per_second, base_url, fetch_options,
+                           cache=None, parser=None, url_template=PAGE_URL_TEMPLATE, prefetched=None):
+    """Generator halaman paralel: menghasilkan pasangan (nomor halaman, produk) sesuai urutan halaman.
+
+    Halaman dikirim ke thread pool secara bertahap (maksimal dua kali `max_workers`
+    yang sedang diproses), sehingga hasil halaman tidak menumpuk saat konsumen lambat.
+    """
+    rate_limiter = RateLimiter(requests_per_second)
+    session = create_session(pool_size=max_workers)
+    fetch_options = {**fetch_options, "session": session}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(page_number):
+        return page_number, executor.submit(
+            _scrape_single_page, page_number, base_url, rate_limiter, fetch_options, cache, parser, url_template,
+            prefetched,
+        )
+
+    window = 2 * max_workers
+    pages = iter(page_numbers)
+    in_flight = deque()
+    try:
+        for page_number in pages:
+            in_flight.append(submit(page_number))
+            if len(in_flight) >= window:
+                break
+        while in_flight:
+            page_number, future = in_flight.popleft()
+            products = future.result()
+            next_page = next(pages, None)
+            if next_page is not None:
+                in_flight.append(submit(next_page))
+            yield page_number, products
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        session.close()
+
+
+def _iter_pages_multiprocess(page_numbers, fetch_workers, parse_workers, requests_per_second, base_url,
+                             fetch_options, cache=None, parser=None, url_template=PAGE_URL_TEMPLATE, prefetched=None):
+    """Generator pipeline fetch (thread) -> parse (proses), menghasilkan (nomor halaman, produk) sesuai urutan.
+
+    Thread fetch langsung mengirim konten mentah ke process pool sehingga download
+    dan parsing berjalan bersamaan. Jumlah halaman yang sedang diproses dibatasi
+    agar konten mentah tidak menumpuk di memori.
+    """
+    parser_name = parser.name if parser is not None else 'bs4'
+    parse_executor = start_parse_pool(parse_workers)
+    rate_limiter = RateLimiter(requests_per_second)
+    session = create_session(pool_size=fetch_workers)
+    fetch_options = {**fetch_options, "session": session}
+    fetch_executor = ThreadPoolExecutor(max_workers=fetch_workers)
+
+    def fetch_and_submit(page_number):
+        url = build_page_url(page_number, base_url, url_template)
+        rate_limiter.wait()
+        print(f"Scraping halaman: {url}")
+        content, cached_rows = fetch_page(url, fetch_options, cache, prefetched)
+        if cached_rows is not None or not content:
+            return url, cached_rows, None
+        return url, None, parse_executor.submit(parse_in_worker, content, page_number, parser_name)
+
+    window = 2 * max(fetch_workers, parse_workers)
+    pages = iter(page_numbers)
+    in_flight = deque()
+    try:
+        for page_number in pages:
+            in_flight.append((page_number, fetch_executor.submit(fetch_and_submit, page_number)))
+            if len(in_flight) >= window:
+                break
+        while in_flight:
+            page_number, fetch_future = in_flight.popleft()
+            url, products, parse_future = fetch_future.result()
+            if parse_future is not None:
+                products = _parse_result(page_number, parse_future)
+                if cache is not None:
+                    cache.store_rows(url, products)
+            next_page = next(pages, None)
+            if next_page is not None:
+                in_flight.append((next_page, fetch_executor.submit(fetch_and_submit, next_page)))
+            yield page_number, products
+    finally:
+        fetch_executor.shutdown(wait=True, cancel_futures=True)
+        parse_executor.shutdown(wait=True, cancel_futures=True)
+        session.close()
+
+
+def _iter_checkpointed_pages(crawl_pages, total_pages, checkpoint, resume=False, page_retries=1):
+    """Menjalankan crawl dengan checkpoint per halaman, menghasilkan produk sesuai urutan halaman.
+
+    Pada mode `resume`, halaman yang sudah selesai diambil dari checkpoint tanpa
+    request ulang. Halaman yang gagal tidak menghentikan crawl, melainkan masuk
+    antrean retry dan dicoba ulang hingga `page_retries` putaran setelah putaran
+    utama selesai. Halaman setelah halaman gagal tetap di-crawl dan disimpan di
+    checkpoint, lalu dihasilkan dari checkpoint setelah retry agar urutan halaman
+    terjaga tanpa menahan produknya di memori. Halaman yang tetap gagal dilewati
+    dan tercatat di checkpoint untuk run berikutnya.
+    """
+    if not resume:
+        checkpoint.reset()
+    completed = set(checkpoint.completed_pages())
+    pending = [page_number for page_number in range(1, total_pages + 1) if page_number not in completed]
+    if completed:
+        print(f"Melanjutkan crawl: {len(completed)} halaman sudah selesai, {len(pending)} halaman tersisa.")
+
+    resolved = set(completed)  # Halaman yang selesai (atau dilewati) dan siap dihasilkan
+    cursor = 1  # Halaman berikutnya yang harus dihasilkan
+
+    def flush():
+        nonlocal cursor
+        while cursor in resolved:
+            products = checkpoint.load_rows(cursor)
+            if products:
+                yield products
+            cursor += 1
+
+    for attempt in range(page_retries + 1):
+        if not pending:
+            break
+        if attempt:
+            print(f"Mengulang {len(pending)} halaman yang gagal (putaran retry ke-{attempt})...")
+        failed = []
+        for page_number, products in crawl_pages(pending):
+            if products is None:
+                print(f"Gagal mengambil data dari halaman {page_number}, halaman dimasukkan ke antrean retry.")
+                checkpoint.mark_failed(page_number)
+                failed.append(page_number)
+                continue
+            checkpoint.mark_done(page_number, products)
+            yield from flush()
+            if page_number == cursor:
+                # Halaman tepat di urutan berikutnya langsung dihasilkan tanpa dibaca ulang dari checkpoint
+                cursor += 1
+                if products:
+                    yield products
+            else:
+                resolved.add(page_number)
+        pending = failed
+
+    if pending:
+        print(f"Halaman yang masih gagal: {pending}. Jalankan ulang dengan resume untuk mencoba lagi.")
+    resolved.update(pending)
+    resolved.update(range(cursor, total_pages + 1))
+    yield from flush()
+
+
+def iter_scrape_fashion_products(total_pages=None, delay=DEFAULT_DELAY, max_workers=None, requests_per_second=None,
+                                 base_url=BASE_URL, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, stats=None,
+                                 cache=None, parser='bs4', checkpoint=None, resume=False, page_retries=1,
+                                 url_template=PAGE_URL_TEMPLATE, max_pages=DEFAULT_MAX_PAGES, parse_workers=None):
+    """Scraping data fashion per halaman sebagai generator.
+
+    Setiap halaman yang berhasil diproses menghasilkan satu batch (list produk)
+    sesuai urutan halaman, sehingga tahap transform dan load dapat berjalan
+    sebelum seluruh halaman selesai di-scraping. Parameter sama dengan
+    `scrape_fashion_products`.
+    """
+    stats = [] if stats is None else stats
+    requests_per_second = polite_requests_per_second(requests_per_second, delay)
+    if requests_per_second:
+        delay = 1.0 / requests_per_second  # Jalur sekuensial memakai batas yang sama sebagai jeda
+    parser = get_parser(parser)
+    fetch_options = {"session": None, "timeout": timeout, "retries": retries, "stats": stats}
+    prefetched = {}
+    if total_pages is None:
+        total_pages = discover_total_pages(base_url, url_template, fetch_options, cache, max_pages, prefetched)
+
+    if parse_workers:
+        def crawl_pages(page_numbers):
+            return _iter_pages_multiprocess(
+                page_numbers, max_workers or 1, parse_workers, requests_per_second, base_url, fetch_options, cache,
+                parser, url_template, prefetched,
+            )
+    elif max_workers:
+        def crawl_pages(page_numbers):
+            return _iter_pages_concurrent(
+                page_numbers, max_workers, requests_per_second, base_url, fetch_options, cache, parser,
+                url_template, prefetched,
+            )
+    else:
+        def crawl_pages(page_numbers):
+            return _iter_pages_sequential(
+                page_numbers, base_url, fetch_options, delay, cache, parser, url_template, prefetched
+            )
+
+    if checkpoint is not None:
+        yield from _iter_checkpointed_pages(crawl_pages, total_pages, checkpoint, resume, page_retries)
+    else:
+        for page_number, products in crawl_pages(range(1, total_pages + 1)):
+            if products is None:
+                print(f"Gagal mengambil data dari halaman {page_number}, berhenti scraping.")
+                break  # Jika gagal fetching, maka akan menghentikan proses
+            if not products:
+                continue  # Jika tidak ada produk atau parsing gagal, maka akan melanjutkan ke halaman berikutnya
+            yield products
+
+    print_fetch_summary(stats)
+
+
+def scrape_fashion_products_concurrent(total_pages=None, max_workers=8, requests_per_second=None, base_url=BASE_URL,
+                                       timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, stats=None, cache=None,
+                                       parser='bs4', checkpoint=None, resume=False, page_retries=1,
+                                       url_template=PAGE_URL_TEMPLATE, max_pages=DEFAULT_MAX_PAGES,
+                                       parse_workers=None):
+    """Scraping beberapa halaman secara paralel dengan thread pool dan batas request per detik.
+
+    Hasil disusun sesuai urutan halaman sehingga identik dengan jalur sekuensial,
+    termasuk berhenti pada halaman pertama yang gagal diambil.
+    """
+    return scrape_fashion_products(
+        total_pages, max_workers=max_workers, requests_per_second=requests_per_second, base_url=base_url,
+        timeout=timeout, retries=retries, stats=stats, cache=cache, parser=parser,
+        checkpoint=checkpoint, resume=resume, page_retries=page_retries, url_template=url_template,
+        max_pages=max_pages, parse_workers=parse_workers,
+    )
+
+
+def scrape_fashion_products(total_pages=None, delay=DEFAULT_DELAY, max_workers=None, requests_per_second=None, base_url=BASE_URL,
+                            timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, stats=None, cache=None,
+                            parser='bs4', checkpoint=None, resume=False, page_retries=1,
+                            url_template=PAGE_URL_TEMPLATE, max_pages=DEFAULT_MAX_PAGES, parse_workers=None):
+    """Scraping data fashion dari beberapa halaman dan menyimpannya ke list dengan penanganan kesalahan.
+
+    Jika `max_workers` diisi, halaman diambil secara paralel dan `requests_per_second`
+    menggantikan jeda `delay` antar halaman; tanpa `requests_per_second`, batasnya
+    1/`delay` request per detik (`delay=0` berarti tanpa batas). Latensi dan retry setiap request dicatat
+    ke list `stats` (jika diberikan) dan ringkasannya ditampilkan di akhir scraping.
+    `cache` (ResponseCache) mengaktifkan conditional GET sehingga halaman yang tidak
+    berubah tidak di-download maupun di-parsing ulang. `parser` memilih backend
+    parsing ('bs4' atau 'lxml'). Jika `checkpoint` (CrawlCheckpoint) diberikan, setiap
+    halaman yang selesai dicatat, halaman gagal di-retry hingga `page_retries` putaran
+    alih-alih menghentikan crawl, dan `resume=True` melanjutkan crawl sebelumnya.
+    Jika `total_pages` bernilai None, jumlah halaman dideteksi dari pagination halaman
+    pertama (atau probe, maksimal `max_pages`). `url_template` menentukan format URL
+    halaman ke-2 dan seterusnya. Jika `parse_workers` diisi, parsing HTML berjalan di
+    process pool dengan jumlah worker tersebut, diumpan oleh `max_workers` thread fetch.
+    """
+    data = []
+    for products in iter_scrape_fashion_products(
+        total_pages, delay, max_workers, requests_per_second, base_url, timeout, retries, stats, cache, parser,
+        checkpoint, resume, page_retries, url_template, max_pages, parse_workers,
+    ):
+        data.extend(products)
     return data
 
+
+def scrape_fashion_products_frame(total_pages=None, **scrape_options) -> pd.DataFrame:
+    """Scraping data fashion langsung menjadi DataFrame mentah dengan penampung per kolom.
+
+    Setiap batch halaman dari `iter_scrape_fashion_products` dimasukkan ke
+    `ProductColumns` sehingga seluruh hasil crawl tidak pernah disimpan sebagai list
+    dictionary. Parameter lain sama dengan `scrape_fashion_products`.
+    """
+    columns = ProductColumns()
+    for products in iter_scrape_fashion_products(total_pages, **scrape_options):
+        columns.extend(products)
+    return columns.to_frame()
@@ -1,15 +1,241 @@
+import csv
+import glob
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
 import pandas as pd
-from sqlalchemy import create_engine
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from utils import metrics
+from utils.analytics import AnalyticsStore
 
-def save_to_csv(df: pd.DataFrame, filename: str = 'fashion_data.csv'):
-    """Menyimpan DataFrame ke file CSV."""
+# SQLAlchemy dan library Google di-import di dalam fungsi sink yang memakainya, sehingga
+# run yang hanya memakai CSV/Parquet (dan test collection) tidak membayar biaya import-nya.
+
+def save_to_csv(df: pd.DataFrame, filename: str = 'fashion_data.csv', append: bool = False) -> bool:
+    """Menyimpan DataFrame ke file CSV; `append=True` menambahkan baris tanpa header.
+
+    Mengembalikan True jika berhasil, False jika gagal.
+    """
     try:
-        df.to_csv(filename, index=False)
+        if append:
+            df.to_csv(filename, index=False, mode='a', header=False)
+        else:
+            df.to_csv(filename, index=False)
         print(f"[Flatfile-.CSV] Data berhasil disimpan ke {filename}")
+        return True
     except Exception as e:
         print(f"[CSV Error] Gagal menyimpan data ke CSV: {e}")
+        return False
+
+def save_to_parquet(
+    df: pd.DataFrame,
+    base_dir: str = 'data/parquet',
+    run_timestamp: datetime = None,
+    compression: str = 'zstd',
+    part: int = 0
+) -> bool:
+    """Menyimpan DataFrame ke file Parquet terkompresi, dipartisi per tanggal run.
+
+    File ditulis ke `<base_dir>/run_date=YYYY-MM-DD/fashion_<waktu run>_part<NNNN>.parquet`
+    melalui file sementara yang kemudian di-rename secara atomik, sehingga pembaca
+    tidak pernah melihat file setengah jadi. Tipe kolom (misalnya Price dan Rating
+    sebagai float) tetap terjaga. Mengembalikan True jika berhasil, False jika gagal.
+    """
+    tmp_path = None
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        run_timestamp = run_timestamp or datetime.now()
+        partition_dir = os.path.join(base_dir, f"run_date={run_timestamp:%Y-%m-%d}")
+        os.makedirs(partition_dir, exist_ok=True)
+        path = os.path.join(partition_dir, f"fashion_{run_timestamp:%Y%m%dT%H%M%S%f}_part{part:04d}.parquet")
+        tmp_path = f"{path}.tmp"
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, tmp_path, compression=compression)
+        os.replace(tmp_path, path)
+        print(f"[Parquet] Data berhasil disimpan ke {path}")
+        return True
+    except Exception as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        print(f"[Parquet Error] Gagal menyimpan data ke Parquet: {e}")
+        return False
+
+
+def get_analytics_store(path: str = 'data/analytics.sqlite') -> AnalyticsStore:
+    """Mengembalikan AnalyticsStore yang dipakai ulang antar pemanggilan untuk file yang sama."""
+    key = os.path.abspath(path)
+    with _analytics_stores_lock:
+        if key not in _analytics_stores:
+            _analytics_stores[key] = AnalyticsStore(path)
+        return _analytics_stores[key]
+
+
+def close_analytics_stores():
+    """Menutup semua AnalyticsStore yang tersimpan; agregat run yang usang dihitung sebelum ditutup."""
+    with _analytics_stores_lock:
+        for store in _analytics_stores.values():
+            store.close()
+        _analytics_stores.clear()
+
+
+def save_to_analytics_store(
+    df: pd.DataFrame,
+    path: str = 'data/analytics.sqlite',
+    run_timestamp: datetime = None
+) -> bool:
+    """Menambahkan hasil bersih ke penyimpanan analitik lokal sebagai satu run.
+
+    Batch dengan `run_timestamp` yang sama digabung ke run yang sama; agregat per
+    Gender/Size dihitung sekali saat dibaca atau saat store ditutup. Store untuk satu
+    path dipakai ulang antar batch (lihat `get_analytics_store`). Mengembalikan True
+    jika berhasil, False jika gagal.
+    """
+    try:
+        run_id = get_analytics_store(path).append_run(df, run_timestamp)
+        print(f"[Analytics] {len(df)} baris ditambahkan ke run {run_id} di {path}")
+        return True
+    except Exception as e:
+        print(f"[Analytics Error] Gagal menyimpan data ke penyimpanan analitik: {e}")
+        return False
+
+
+def read_parquet_data(
+    base_dir: str = 'data/parquet',
+    columns: list = None,
+    run_date: str = None,
+    memory_map: bool = True
+) -> pd.DataFrame:
+    """Membaca file Parquet hasil save_to_parquet dengan proyeksi kolom.
+
+    `columns` membatasi kolom yang dibaca dari disk, `run_date` ('YYYY-MM-DD')
+    membatasi ke satu partisi, dan `memory_map=True` membaca file lewat mmap.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    partition = f"run_date={run_date}" if run_date else "run_date=*"
+    paths = sorted(glob.glob(os.path.join(base_dir, partition, "*.parquet")))
+    if not paths:
+        return pd.DataFrame(columns=columns)
+    tables = [pq.read_table(path, columns=columns, memory_map=memory_map) for path in paths]
+    return pa.concat_tables(tables).to_pandas()
+
+
+NATURAL_KEY = ('Title', 'Size', 'Gender')
+SNAPSHOT_COLUMN = 'RunTimestamp'
+COPY_NULL = '\\N'
+
+_engines = {}
+_engines_lock = threading.Lock()
+_analytics_stores = {}
+_analytics_stores_lock = threading.Lock()
+
+
+def build_postgres_url(db_name: str, user: str, password: str, host: str = 'localhost', port: int = 5432) -> str:
+    """Membentuk URL koneksi SQLAlchemy untuk PostgreSQL (driver psycopg2)."""
+    return f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}'
+
+
+def get_engine(url: str):
+    """Mengembalikan engine SQLAlchemy dengan connection pool yang dipakai ulang antar pemanggilan."""
+    from sqlalchemy import create_engine
+
+    with _engines_lock:
+        if url not in _engines:
+            _engines[url] = create_engine(url, pool_pre_ping=True)
+        return _engines[url]
+
+
+def dispose_engines():
+    """Menutup semua engine yang tersimpan beserta koneksi pool-nya."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+def copy_insert(table, conn, keys, data_iter):
+    """Method `to_sql` yang mengalirkan baris ke PostgreSQL lewat COPY FROM STDIN.
+
+    Baris ditulis ke buffer CSV di memori (tanpa file sementara); nilai None
+    ditulis sebagai \\N agar terbaca sebagai NULL, berbeda dari string kosong.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in data_iter:
+        writer.writerow([COPY_NULL if value is None else value for value in row])
+    buffer.seek(0)
+
+    quote = conn.dialect.identifier_preparer.quote
+    table_name = f'{quote(table.schema)}.{quote(table.name)}' if table.schema else quote(table.name)
+    columns = ', '.join(quote(key) for key in keys)
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer,
+        )
+
+
+def _ensure_table(df: pd.DataFrame, table_name: str, conn):
+    """Membuat tabel dengan skema DataFrame jika belum ada (tanpa menyisipkan baris)."""
+    df.head(0).to_sql(table_name, conn, index=False, if_exists='append')
+
+
+def _upsert_dataframe(df: pd.DataFrame, table_name: str, engine, key_columns=NATURAL_KEY, to_sql_options=None) -> int:
+    """Upsert DataFrame melalui tabel staging dan INSERT ... ON CONFLICT pada natural key."""
+    from sqlalchemy import text
+
+    quote = engine.dialect.identifier_preparer.quote
+    df = df.drop_duplicates(subset=list(key_columns), keep='last')
+    staging_table = f'{table_name}_staging'
+    columns = ', '.join(quote(column) for column in df.columns)
+    keys = ', '.join(quote(column) for column in key_columns)
+    updates = ', '.join(
+        f'{quote(column)} = EXCLUDED.{quote(column)}' for column in df.columns if column not in key_columns
+    )
+
+    with engine.begin() as conn:
+        _ensure_table(df, table_name, conn)
+        conn.execute(text(
+            f'CREATE UNIQUE INDEX IF NOT EXISTS {quote(f"ux_{table_name}_natural_key")} '
+            f'ON {quote(table_name)} ({keys})'
+        ))
+        df.to_sql(staging_table, conn, index=False, if_exists='replace', **(to_sql_options or {}))
+        # "WHERE true" diperlukan SQLite agar ON CONFLICT tidak dibaca sebagai bagian dari SELECT
+        conn.execute(text(
+            f'INSERT INTO {quote(table_name)} ({columns}) '
+            f'SELECT {columns} FROM {quote(staging_table)} WHERE true '
+            f'ON CONFLICT ({keys}) DO UPDATE SET {updates}'
+        ))
+        conn.execute(text(f'DROP TABLE {quote(staging_table)}'))
+    return len(df)
+
+
+def _append_snapshot(df: pd.DataFrame, table_name: str, engine, run_timestamp=None, to_sql_options=None) -> int:
+    """Menambahkan DataFrame sebagai snapshot append-only yang diberi kolom waktu run."""
+    from sqlalchemy import text
+
+    quote = engine.dialect.identifier_preparer.quote
+    snapshot = df.assign(**{SNAPSHOT_COLUMN: (run_timestamp or datetime.now()).isoformat()})
+
+    with engine.begin() as conn:
+        snapshot.to_sql(table_name, conn, index=False, if_exists='append', **(to_sql_options or {}))
+        conn.execute(text(
+            f'CREATE INDEX IF NOT EXISTS {quote(f"ix_{table_name}_run")} '
+            f'ON {quote(table_name)} ({quote(SNAPSHOT_COLUMN)})'
+        ))
+        conn.execute(text(
+            f'CREATE INDEX IF NOT EXISTS {quote(f"ix_{table_name}_title_run")} '
+            f'ON {quote(table_name)} ({quote("Title")}, {quote(SNAPSHOT_COLUMN)})'
+        ))
+    return len(snapshot)
+
 
 def save_to_postgresql(
     df: pd.DataFrame,
@@ -18,29 +244,88 @@ def save_to_postgresql(
     password: str,
     host: str = 'localhost',
     port: int = 5432,
-    table_name: str = 'fashion_products'
+    table_name: str = 'fashion_products',
+    if_exists: str = 'replace',
+    mode: str = 'replace',
+    engine=None,
+    run_timestamp=None,
+    use_copy: bool = False,
+    chunksize: int = None
 ):
-    """Menyimpan DataFrame ke PostgreSQL dengan mengganti seluruh isi tabel."""
+    """Menyimpan DataFrame ke PostgreSQL.
+
+    Mode yang tersedia:
+    - 'replace'  : mengganti seluruh isi tabel (atau menambah baris jika `if_exists='append'`).
+    - 'upsert'   : memperbarui/menyisipkan baris berdasarkan natural key Title+Size+Gender.
+    - 'snapshot' : menambahkan baris ke tabel `<table_name>_snapshots` dengan kolom RunTimestamp.
+    Indeks yang dibutuhkan setiap mode dibuat otomatis. `engine` dapat diisi engine
+    SQLAlchemy lain (misalnya SQLite); jika kosong, engine PostgreSQL dengan pool
+    dipakai ulang antar pemanggilan. `use_copy=True` mengirim data lewat COPY FROM
+    STDIN per `chunksize` baris, bukan INSERT per baris. Mengembalikan True jika
+    berhasil, False jika gagal.
+    """
     try:
-        engine = create_engine(f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}')
-        df.to_sql(table_name, engine, index=False, if_exists='replace')
-        print(f"[PostgreSQL] Data berhasil disimpan ke tabel {table_name}.")
+        if engine is None:
+            engine = get_engine(build_postgres_url(db_name, user, password, host, port))
+        to_sql_options = {'method': copy_insert, 'chunksize': chunksize} if use_copy else {}
+
+        start = time.perf_counter()
+        if mode == 'upsert':
+            rows = _upsert_dataframe(df, table_name, engine, to_sql_options=to_sql_options)
+            message = f"{rows} baris berhasil di-upsert ke tabel {table_name}"
+        elif mode == 'snapshot':
+            snapshot_table = f'{table_name}_snapshots'
+            rows = _append_snapshot(df, snapshot_table, engine, run_timestamp, to_sql_options)
+            message = f"Snapshot {rows} baris berhasil ditambahkan ke tabel {snapshot_table}"
+        elif mode == 'replace':
+            df.to_sql(table_name, engine, index=False, if_exists=if_exists, **to_sql_options)
+            rows = len(df)
+            message = f"Data berhasil disimpan ke tabel {table_name}"
+        else:
+            raise ValueError(f"Mode '{mode}' tidak dikenal (replace, upsert, snapshot)")
+        elapsed = time.perf_counter() - start
+        print(f"[PostgreSQL] {message}. ({rows / elapsed if elapsed else 0:,.0f} baris/detik)")
+        return True
     except Exception as e:
         print(f"[PostgreSQL Error] Gagal menyimpan ke PostgreSQL: {e}")
+        return False
+
+def build_sheets_service(credential_file: str = 'client_secret.json'):
+    """Membuat client Google Sheets API v4 dari file service account."""
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+
+    creds = Credentials.from_service_account_file(
+        credential_file,
+        scopes=["https://www.googleapis.com/auth/spreadsheets"]
+    )
+    return build('sheets', 'v4', credentials=creds)
+
 
 def save_to_google_spreadsheet(
     df: pd.DataFrame,
     spreadsheet_id: str,
     range_name: str,
-    credential_file: str = 'client_secret.json'
+    credential_file: str = 'client_secret.json',
+    append: bool = False
 ):
-    """Menyimpan DataFrame ke Google Spreadsheet."""
+    """Menyimpan DataFrame ke Google Spreadsheet; `append=True` menambahkan baris di bawah data lama.
+
+    Mengembalikan True jika berhasil, False jika gagal.
+    """
     try:
-        creds = Credentials.from_service_account_file(
-            credential_file,
-            scopes=["https://www.googleapis.com/auth/spreadsheets"]
-        )
-        service = build('sheets', 'v4', credentials=creds)
+        service = build_sheets_service(credential_file)
+
+        if append:
+            service.spreadsheets().values().append(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={'values': df.values.tolist()}
+            ).execute()
+            print(f"[Google Sheets] {len(df)} baris berhasil ditambahkan ke Spreadsheets(Pemrosesan Data Fashion).")
+            return True
 
         # Menghapus data lama
         service.spreadsheets().values().clear(
@@ -61,8 +346,313 @@ def save_to_google_spreadsheet(
         ).execute()
 
         print(f"[Google Sheets] Data berhasil disimpan ke Spreadsheets(Pemrosesan Data Fashion).")
+        return True
     except Exception as e:
         print(f"[Google Sheets Error] Gagal menyimpan ke Google Sheets: {e}")
+        return False
+
+SHEETS_RETRY_STATUS = {429, 500, 503}
+
+
+def _execute_with_backoff(request, max_retries: int = 5, backoff_factor: float = 1.0):
+    """Menjalankan request Google API dengan backoff eksponensial saat terkena rate limit (429) atau 5xx."""
+    from googleapiclient.errors import HttpError
+
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = int(getattr(e.resp, 'status', 0))
+            if status not in SHEETS_RETRY_STATUS or attempt == max_retries:
+                raise
+            delay = backoff_factor * (2 ** attempt)
+            print(f"[Google Sheets] Status {status}, mencoba ulang dalam {delay:.1f} detik...")
+            metrics.inc('sink_retries_total', sink='gsheets', status=status)
+            time.sleep(delay)
+
+
+def _normalize_cell(value) -> str:
+    """Menyamakan representasi sel dari DataFrame dan dari Sheets agar dapat dibandingkan."""
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, (int, float)):
+        return repr(float(value))
+    return '' if value is None else str(value)
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _row_blocks(sheet_name: str, first_row: int, rows: list, chunk_size: int) -> list:
+    """Memecah baris berurutan menjadi range A<n> berukuran maksimal chunk_size baris."""
+    return [
+        {'range': f"{sheet_name}!A{first_row + offset}", 'values': block}
+        for offset, block in zip(range(0, len(rows), chunk_size), _chunks(rows, chunk_size))
+    ]
+
+
+def _write_value_ranges(values_api, spreadsheet_id: str, data: list, chunk_size: int, max_retries: int) -> int:
+    """Mengirim range nilai lewat values().batchUpdate, maksimal chunk_size baris per panggilan."""
+    calls, batch, batch_rows = 0, [], 0
+    for entry in data + [None]:
+        if entry is None or (batch and batch_rows + len(entry['values']) > chunk_size):
+            if batch:
+                _execute_with_backoff(values_api.batchUpdate(
+                    spreadsheetId=spreadsheet_id, body={'valueInputOption': 'RAW', 'data': batch}
+                ), max_retries)
+                calls += 1
+            batch, batch_rows = [], 0
+        if entry is not None:
+            batch.append(entry)
+            batch_rows += len(entry['values'])
+    return calls
+
+
+def _row_key(row: list, key_indexes: list) -> tuple:
+    return tuple(row[i] for i in key_indexes)
+
+
+def _sheet_id(service, spreadsheet_id: str, sheet_name: str, max_retries: int):
+    metadata = _execute_with_backoff(
+        service.spreadsheets().get(spreadsheetId=spreadsheet_id, fields='sheets.properties'), max_retries
+    )
+    for sheet in metadata.get('sheets', []):
+        if sheet['properties']['title'] == sheet_name:
+            return sheet['properties']['sheetId']
+    raise ValueError(f"Sheet '{sheet_name}' tidak ditemukan")
+
+
+def _contiguous_ranges(rows: list):
+    """Mengelompokkan nomor baris (1-based) menjadi rentang berurutan, dari bawah ke atas."""
+    ranges = []
+    for row in sorted(rows, reverse=True):
+        if ranges and ranges[-1][0] == row + 1:
+            ranges[-1][0] = row
+        else:
+            ranges.append([row, row])
+    return ranges
+
+
+def sync_google_spreadsheet(
+    df: pd.DataFrame,
+    spreadsheet_id: str,
+    sheet_name: str = 'Sheet1',
+    credential_file: str = 'client_secret.json',
+    key_columns=NATURAL_KEY,
+    chunk_size: int = 500,
+    service=None,
+    max_retries: int = 5,
+    ignore_columns=('Timestamp',)
+):
+    """Menyinkronkan DataFrame ke Google Spreadsheet dengan hanya menulis perubahan (delta).
+
+    Isi sheet dibaca sekali, lalu dibandingkan per natural key dengan DataFrame:
+    baris yang berubah ditimpa di tempat, baris baru ditambahkan di bawah, dan baris
+    yang hilang dihapus. Penulisan memakai batchUpdate dengan maksimal `chunk_size`
+    range/permintaan per panggilan dan backoff saat terkena rate limit. Sheet tidak
+    pernah dikosongkan selama sinkronisasi. Kolom `ignore_columns` (waktu scraping yang
+    berubah setiap run) tidak ikut dibandingkan, sehingga baris yang hanya berbeda di
+    kolom tersebut dianggap tetap. Jika header berbeda, sheet ditulis ulang
+    penuh. Mengembalikan dict ringkasan (added, changed, removed, unchanged) atau
+    False jika gagal.
+    """
+    try:
+        if service is None:
+            service = build_sheets_service(credential_file)
+        values_api = service.spreadsheets().values()
+
+        current = _execute_with_backoff(values_api.get(
+            spreadsheetId=spreadsheet_id, range=sheet_name, valueRenderOption='UNFORMATTED_VALUE'
+        ), max_retries).get('values', [])
+
+        header = df.columns.tolist()
+        new_rows = df.values.tolist()
+        key_indexes = [header.index(column) for column in key_columns]
+        compared_indexes = [index for index, column in enumerate(header) if column not in ignore_columns]
+        width = len(header)
+
+        if not current or current[0] != header:
+            # Header berbeda: tulis ulang seluruh sheet per chunk lalu kosongkan sisa baris lama
+            data = _row_blocks(sheet_name, 1, [header] + new_rows, chunk_size)
+            _write_value_ranges(values_api, spreadsheet_id, data, chunk_size, max_retries)
+            if len(current) > len(new_rows) + 1:
+                _execute_with_backoff(values_api.clear(
+                    spreadsheetId=spreadsheet_id, range=f"{sheet_name}!A{len(new_rows) + 2}:ZZ"
+                ), max_retries)
+            print(f"[Google Sheets] Sheet ditulis ulang penuh: {len(new_rows)} baris.")
+            return {'added': len(new_rows), 'changed': 0, 'removed': max(0, len(current) - 1), 'unchanged': 0}
+
+        existing = {}
+        removed_rows = []
+        for row_number, row in enumerate(current[1:], start=2):
+            normalized = [_normalize_cell(value) for value in (row + [''] * width)[:width]]
+            key = _row_key(normalized, key_indexes)
+            if key in existing:
+                removed_rows.append(row_number)  # Duplikat natural key di sheet
+            else:
+                existing[key] = (row_number, normalized)
+
+        incoming = {}
+        for row in new_rows:
+            normalized = [_normalize_cell(value) for value in row]
+            incoming[_row_key(normalized, key_indexes)] = (row, normalized)
+
+        updates, additions = [], []
+        for key, (row, normalized) in incoming.items():
+            if key not in existing:
+                additions.append(row)
+            elif _row_key(normalized, compared_indexes) != _row_key(existing[key][1], compared_indexes):
+                updates.append({'range': f"{sheet_name}!A{existing[key][0]}", 'values': [row]})
+        removed_rows += [row_number for key, (row_number, _) in existing.items() if key not in incoming]
+
+        # Baris berubah ditimpa di tempat; baris baru ditulis setelah baris terakhir
+        data = updates + _row_blocks(sheet_name, len(current) + 1, additions, chunk_size)
+        _write_value_ranges(values_api, spreadsheet_id, data, chunk_size, max_retries)
+
+        if removed_rows:
+            sheet_id = _sheet_id(service, spreadsheet_id, sheet_name, max_retries)
+            requests = [
+                {'deleteDimension': {'range': {
+                    'sheetId': sheet_id, 'dimension': 'ROWS', 'startIndex': start - 1, 'endIndex': end,
+                }}}
+                for start, end in _contiguous_ranges(removed_rows)
+            ]
+            for chunk in _chunks(requests, chunk_size):
+                _execute_with_backoff(service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id, body={'requests': chunk}
+                ), max_retries)
+
+        summary = {
+            'added': len(additions),
+            'changed': len(updates),
+            'removed': len(removed_rows),
+            'unchanged': len(incoming) - len(additions) - len(updates),
+        }
+        print(
+            f"[Google Sheets] Sinkronisasi delta: {summary['added']} baru, {summary['changed']} berubah, "
+            f"{summary['removed']} dihapus, {summary['unchanged']} tetap."
+        )
+        return summary
+    except Exception as e:
+        print(f"[Google Sheets Error] Gagal sinkronisasi ke Google Sheets: {e}")
+        return False
+
+
+SINK_NAMES = ('csv', 'postgresql', 'gsheets')
+OPTIONAL_SINKS = ('parquet', 'analytics')
+DEFAULT_SINK_TIMEOUTS = {'csv': 60, 'postgresql': 300, 'gsheets': 120, 'parquet': 120, 'analytics': 120}
+
+
+def run_sink(name: str, write, rows: int) -> dict:
+    """Menjalankan satu sink dan mengembalikan hasil terstruktur (durasi, baris, status)."""
+    start = time.perf_counter()
+    try:
+        success = write() is not False
+        error = None if success else f"Sink {name} melaporkan kegagalan (lihat log)"
+    except Exception as e:
+        success, error = False, str(e)
+    return {
+        "sink": name,
+        "success": success,
+        "rows": rows if success else 0,
+        "duration": time.perf_counter() - start,
+        "error": error,
+        "timed_out": False,
+    }
+
+
+def sink_timeout_result(name: str, error: str, duration: float = 0.0) -> dict:
+    """Hasil sink yang timeout (atau dilewati setelah timeout) dalam format yang sama dengan `run_sink`."""
+    return {"sink": name, "success": False, "rows": 0, "duration": duration, "error": error, "timed_out": True}
+
+
+def run_sinks(sink_writers: dict, rows: int, parallel: bool = True, timeouts: dict = None) -> list:
+    """Menjalankan beberapa sink secara bersamaan dengan timeout dan isolasi error per sink.
+
+    `sink_writers` memetakan nama sink ke callable tanpa argumen. Kegagalan atau
+    timeout satu sink tidak menghentikan sink lain. Sink yang melewati timeout
+    dilaporkan gagal; thread-nya tetap dibiarkan selesai di latar belakang.
+    Mengembalikan list hasil sesuai urutan `sink_writers`.
+    """
+    timeouts = {**DEFAULT_SINK_TIMEOUTS, **(timeouts or {})}
+    if not parallel or len(sink_writers) <= 1:
+        return record_sink_metrics([run_sink(name, write, rows) for name, write in sink_writers.items()])
+
+    executor = ThreadPoolExecutor(max_workers=len(sink_writers), thread_name_prefix='sink')
+    start = time.perf_counter()
+    futures = {name: executor.submit(run_sink, name, write, rows) for name, write in sink_writers.items()}
+    results = []
+    for name, future in futures.items():
+        timeout = timeouts.get(name)
+        remaining = None if timeout is None else max(0.0, timeout - (time.perf_counter() - start))
+        try:
+            results.append(future.result(timeout=remaining))
+        except FutureTimeoutError:
+            results.append(sink_timeout_result(name, f"Timeout setelah {timeout} detik", time.perf_counter() - start))
+    executor.shutdown(wait=False)
+    return record_sink_metrics(results)
+
+
+def run_batch_sinks(sink_writers: dict, rows: int, timed_out: set, parallel: bool = True,
+                    timeouts: dict = None) -> list:
+    """Menjalankan sink untuk satu batch dari rangkaian batch, melewati sink yang pernah timeout.
+
+    Thread sink yang timeout bisa masih menulis batch sebelumnya, sehingga batch baru
+    tidak ditumpuk ke sink tersebut dan dilaporkan gagal. `timed_out` adalah set nama
+    sink yang dibagi antar batch dan diperbarui dengan sink yang timeout di batch ini.
+    Mengembalikan list hasil sesuai urutan `sink_writers`.
+    """
+    skipped = {
+        name: sink_timeout_result(name, "Dilewati setelah timeout pada batch sebelumnya")
+        for name in sink_writers if name in timed_out
+    }
+    ran = run_sinks(
+        {name: write for name, write in sink_writers.items() if name not in skipped}, rows, parallel, timeouts
+    )
+    timed_out.update(result["sink"] for result in ran if result["timed_out"])
+    ran = {result["sink"]: result for result in ran}
+    return [skipped[name] if name in skipped else ran[name] for name in sink_writers]
+
+
+def record_sink_metrics(results: list) -> list:
+    """Mencatat durasi, baris tertulis, dan kegagalan setiap sink ke metrik run aktif."""
+    for result in results:
+        metrics.observe('sink_duration_seconds', result["duration"], sink=result["sink"])
+        metrics.inc('rows_out_total', result["rows"], stage=f'load_{result["sink"]}')
+        if not result["success"]:
+            metrics.inc('sink_failures_total', sink=result["sink"])
+    return results
+
+
+def merge_sink_results(name: str, results: list) -> dict:
+    """Menggabungkan hasil beberapa batch satu sink menjadi satu hasil seperti pada `run_sinks`."""
+    errors = [result["error"] for result in results if result["error"]]
+    return {
+        "sink": name,
+        "success": all(result["success"] for result in results),
+        "rows": sum(result["rows"] for result in results),
+        "duration": sum(result["duration"] for result in results),
+        "error": errors[0] if errors else None,
+        "timed_out": any(result.get("timed_out") for result in results),
+    }
+
+
+def select_writers(writers: dict, sinks) -> dict:
+    """Memilih writer sesuai nama sink yang diminta, menolak nama yang tidak dikenal."""
+    unknown = set(sinks) - set(writers)
+    if unknown:
+        raise ValueError(f"Sink tidak dikenal: {', '.join(sorted(unknown))}. Pilihan: {', '.join(writers)}")
+    return {name: writers[name] for name in sinks}
+
+
+def print_load_report(results: list):
+    """Menampilkan ringkasan hasil setiap sink ke console."""
+    for result in results:
+        status = "OK" if result["success"] else f"GAGAL ({result['error']})"
+        print(f"[Load] {result['sink']:<10} {result['rows']:>7} baris  {result['duration']:6.2f}s  {status}")
+
 
 def load_data(
     df: pd.DataFrame,
@@ -71,9 +661,122 @@ def load_data(
     user: str = 'developer',
     password: str = 'supersecretpassword',
     spreadsheet_id: str = '1MDLjCAZ2eMy-FxvBpDSJfNEkTOKOVoHORcrlyT8Vu-s',
-    range_name: str = 'Sheet1!A1'
-):
-    """Memuat data ke semua storage: CSV, PostgreSQL, dan Google Spreadsheet."""
-    save_to_csv(df, filename_csv)
-    save_to_postgresql(df, db_name, user, password)
-    save_to_google_spreadsheet(df, spreadsheet_id, range_name)
+    range_name: str = 'Sheet1!A1',
+    postgres_mode: str = 'replace',
+    sinks=SINK_NAMES,
+    parallel: bool = True,
+    timeouts: dict = None,
+    parquet_dir: str = 'data/parquet',
+    gsheets_mode: str = 'replace',
+    analytics_path: str = 'data/analytics.sqlite'
+) -> list:
+    """Memuat data ke storage terpilih: CSV, PostgreSQL, dan/atau Google Spreadsheet.
+
+    Sink dijalankan bersamaan (kecuali `parallel=False`) dengan timeout per sink
+    dari `timeouts`. `sinks` menentukan sink yang dijalankan, misalnya ('csv',)
+    untuk melewati sink jaringan; sink opsional 'parquet' menulis ke `parquet_dir`
+    dan 'analytics' menambahkan run baru ke penyimpanan analitik di `analytics_path`.
+    `gsheets_mode='sync'` hanya menulis baris yang berubah ke Google Sheets.
+    Mengembalikan list hasil per sink berisi
+    sink, success, rows, duration, dan error.
+    """
+    writers = {
+        'csv': lambda: save_to_csv(df, filename_csv),
+        'postgresql': lambda: save_to_postgresql(df, db_name, user, password, mode=postgres_mode),
+        'gsheets': (
+            (lambda: sync_google_spreadsheet(df, spreadsheet_id, range_name.split('!')[0]))
+            if gsheets_mode == 'sync'
+            else (lambda: save_to_google_spreadsheet(df, spreadsheet_id, range_name))
+        ),
+        'parquet': lambda: save_to_parquet(df, parquet_dir),
+        'analytics': lambda: save_to_analytics_store(df, analytics_path),
+    }
+    results = run_sinks(select_writers(writers, sinks), len(df), parallel, timeouts)
+    print_load_report(results)
+    return results
+
+
+def batch_writers(
+    df: pd.DataFrame,
+    batch_number: int,
+    run_timestamp: datetime,
+    filename_csv: str = 'fashion_data.csv',
+    db_name: str = 'fashion_db',
+    user: str = 'developer',
+    password: str = 'supersecretpassword',
+    spreadsheet_id: str = '1MDLjCAZ2eMy-FxvBpDSJfNEkTOKOVoHORcrlyT8Vu-s',
+    range_name: str = 'Sheet1!A1',
+    postgres_mode: str = 'replace',
+    parquet_dir: str = 'data/parquet',
+    analytics_path: str = 'data/analytics.sqlite'
+) -> dict:
+    """Membentuk writer setiap sink untuk satu batch dari rangkaian batch satu run.
+
+    Batch ke-0 mengganti isi storage dan batch berikutnya ditambahkan (append).
+    Mengembalikan dict nama sink -> callable tanpa argumen, seperti pada `run_sinks`.
+    """
+    append = batch_number > 0
+    return {
+        'csv': lambda: save_to_csv(df, filename_csv, append=append),
+        'postgresql': lambda: save_to_postgresql(
+            df, db_name, user, password,
+            if_exists='append' if append else 'replace',
+            mode=postgres_mode,
+            run_timestamp=run_timestamp
+        ),
+        'gsheets': lambda: save_to_google_spreadsheet(df, spreadsheet_id, range_name, append=append),
+        'parquet': lambda: save_to_parquet(df, parquet_dir, run_timestamp, part=batch_number),
+        'analytics': lambda: save_to_analytics_store(df, analytics_path, run_timestamp),
+    }
+
+
+def load_batches(
+    batches,
+    filename_csv: str = 'fashion_data.csv',
+    db_name: str = 'fashion_db',
+    user: str = 'developer',
+    password: str = 'supersecretpassword',
+    spreadsheet_id: str = '1MDLjCAZ2eMy-FxvBpDSJfNEkTOKOVoHORcrlyT8Vu-s',
+    range_name: str = 'Sheet1!A1',
+    postgres_mode: str = 'replace',
+    sinks=SINK_NAMES,
+    parallel: bool = True,
+    timeouts: dict = None,
+    parquet_dir: str = 'data/parquet',
+    analytics_path: str = 'data/analytics.sqlite',
+    results: list = None
+) -> int:
+    """Memuat DataFrame per batch secara bertahap ke storage terpilih.
+
+    Batch pertama mengganti isi storage, batch berikutnya ditambahkan (append),
+    sehingga baris pertama sudah tersimpan saat scraping masih berjalan.
+    Pada mode PostgreSQL 'upsert' dan 'snapshot', setiap batch ditulis dengan mode
+    tersebut (snapshot memakai satu RunTimestamp untuk seluruh batch); sink
+    'parquet' menulis satu file part per batch dalam partisi run yang sama, dan sink
+    'analytics' menggabungkan semua batch ke satu run analitik. Sink untuk
+    satu batch dijalankan bersamaan seperti pada `load_data`. Sink yang timeout
+    dilewati pada batch berikutnya karena penulisannya mungkin masih berjalan.
+    Hasil per sink (digabung dari semua batch) ditampilkan dan ditambahkan ke list
+    `results` jika diberikan. Mengembalikan jumlah baris dari batch yang berhasil
+    dimuat ke semua sink.
+    """
+    run_timestamp = datetime.now()
+    total_rows = 0
+    sink_results = {name: [] for name in sinks}
+    timed_out = set()
+    for batch_number, df in enumerate(batches):
+        writers = batch_writers(
+            df, batch_number, run_timestamp, filename_csv, db_name, user, password, spreadsheet_id, range_name,
+            postgres_mode, parquet_dir, analytics_path,
+        )
+        batch_results = run_batch_sinks(select_writers(writers, sinks), len(df), timed_out, parallel, timeouts)
+        for result in batch_results:
+            sink_results[result["sink"]].append(result)
+        if all(result["success"] for result in batch_results):
+            total_rows += len(df)
+
+    merged = [merge_sink_results(name, batch) for name, batch in sink_results.items() if batch]
+    print_load_report(merged)
+    if results is not None:
+        results.extend(merged)
+    return total_rows
@@ -0,0 +1,196 @@
+"""Instrumentasi pipeline ETL: counter dan histogram per run, laporan JSON, dan ekspor Prometheus.
+
+Modul lain mencatat metrik lewat fungsi `inc`, `observe`, dan `timed`. Jika tidak ada
+run yang aktif (`start_run` belum dipanggil), fungsi-fungsi tersebut tidak melakukan apa pun.
+"""
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+METRIC_PREFIX = 'etl_'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Histogram:
+    """Histogram kumulatif dengan batas bucket tetap, seperti histogram Prometheus."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.sum / self.count if self.count else None,
+            "buckets": {str(bound): count for bound, count in zip(self.buckets, self.counts)},
+        }
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class RunMetrics:
+    """Kumpulan counter dan histogram untuk satu run pipeline."""
+
+    def __init__(self, run_id: str = None):
+        self.started_at = datetime.now()
+        self.run_id = run_id or self.started_at.strftime('%Y%m%dT%H%M%S')
+        self.finished_at = None
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def counter_value(self, name: str, **labels) -> float:
+        """Nilai satu counter (0 jika belum pernah dicatat)."""
+        return self.counters.get((name, _label_key(labels)), 0)
+
+    def report(self) -> dict:
+        """Membentuk laporan run yang dapat diserialisasi ke JSON."""
+        finished_at = self.finished_at or datetime.now()
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self.histograms.items())
+            ]
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "duration_seconds": (finished_at - self.started_at).total_seconds(),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def write_json(self, path: str):
+        """Menyimpan laporan run sebagai file JSON."""
+        _atomic_write(path, json.dumps(self.report(), indent=2))
+
+    def prometheus_text(self) -> str:
+        """Format eksposisi teks Prometheus untuk textfile collector node_exporter."""
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE {METRIC_PREFIX}{name} counter")
+                for (metric, labels), value in sorted(self.counters.items()):
+                    if metric == name:
+                        lines.append(f"{METRIC_PREFIX}{name}{_format_labels(labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {METRIC_PREFIX}{name} histogram")
+                for (metric, labels), histogram in sorted(self.histograms.items()):
+                    if metric != name:
+                        continue
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f"{METRIC_PREFIX}{name}_bucket{_format_labels(labels + (('le', str(bound)),))} {count}")
+                    lines.append(f"{METRIC_PREFIX}{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{METRIC_PREFIX}{name}_sum{_format_labels(labels)} {histogram.sum}")
+                    lines.append(f"{METRIC_PREFIX}{name}_count{_format_labels(labels)} {histogram.count}")
+        lines.append(f"# TYPE {METRIC_PREFIX}last_run_timestamp_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}last_run_timestamp_seconds {self.started_at.timestamp()}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Menyimpan metrik dalam format textfile Prometheus (ditulis atomik)."""
+        _atomic_write(path, self.prometheus_text())
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    pairs = (
+        f'{key}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for key, value in labels
+    )
+    return "{" + ",".join(pairs) + "}"
+
+
+def _atomic_write(path: str, content: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+_active = None
+
+
+def start_run(run_id: str = None) -> RunMetrics:
+    """Memulai pencatatan metrik untuk run baru dan menjadikannya run aktif."""
+    global _active
+    _active = RunMetrics(run_id)
+    return _active
+
+
+def finish_run() -> RunMetrics:
+    """Menghentikan pencatatan dan mengembalikan metrik run yang baru selesai."""
+    global _active
+    run, _active = _active, None
+    if run is not None:
+        run.finished_at = datetime.now()
+    return run
+
+
+def active_run():
+    return _active
+
+
+def inc(name: str, value: float = 1, **labels):
+    """Menambah counter pada run aktif."""
+    if _active is not None:
+        _active.inc(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels):
+    """Mencatat satu nilai ke histogram pada run aktif."""
+    if _active is not None:
+        _active.observe(name, value, **labels)
+
+
+@contextmanager
+def timed(name: str, **labels):
+    """Context manager yang mencatat durasi blok (detik) ke histogram `name`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
@@ -0,0 +1,110 @@
+"""Backend parser HTML untuk halaman katalog.
+
+Setiap backend menyediakan dua method:
+- `iter_cards(content)`  : mengembalikan elemen 'collection-card' dari konten HTML satu halaman.
+- `extract(card, timestamp)` : mengubah satu elemen card menjadi dictionary produk dengan key
+                               dan nilai default yang sama persis dengan `extract_product_data`;
+                               `timestamp` adalah waktu halaman dari `parse_page`.
+
+Backend default berbasis BeautifulSoup berada di `utils.extract`; modul ini berisi
+backend cepat berbasis lxml dengan selector XPath yang sudah dikompilasi.
+"""
+import re
+from datetime import datetime
+
+
+def _has_class(name: str) -> str:
+    """Predikat XPath yang setara dengan selector CSS `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+FIELD_PATTERNS = {
+    "Rating": ("Rating", r"Rating:\s*(⭐\s*\d+(?:\.\d+)?)", "Invalid Rating"),
+    "Colors": ("Colors", r"(\d+)\s*Colors", "No Colors"),
+    "Size": ("Size", r"Size:\s*(\w+)", "Unknown"),
+    "Gender": ("Gender", r"Gender:\s*(\w+)", "Unknown"),
+}
+
+
+_COMPILED_FIELDS = tuple(
+    (field, keyword, re.compile(pattern), default)
+    for field, (keyword, pattern, default) in FIELD_PATTERNS.items()
+)
+
+
+def extract_card_fields(texts) -> dict:
+    """Mengisi Rating, Colors, Size, dan Gender dengan satu kali iterasi teks paragraf.
+
+    Setiap teks dicocokkan ke kata kunci field yang belum terisi, dan pola regex
+    yang sudah dikompilasi hanya dijalankan jika kata kuncinya ditemukan. Hasilnya
+    sama dengan memanggil `extract_clean_text` per field: kecocokan pertama menang,
+    dan field tanpa kecocokan memakai nilai default.
+    """
+    fields = {field: default for field, _, _, default in _COMPILED_FIELDS}
+    pending = list(_COMPILED_FIELDS)
+    for text in texts:
+        if not text:
+            continue
+        for entry in tuple(pending):
+            if entry[1] in text:
+                match = entry[2].search(text)
+                if match:
+                    fields[entry[0]] = match.group(1).strip()
+                    pending.remove(entry)
+        if not pending:
+            break
+    return fields
+
+
+class LxmlParser:
+    """Backend parser berbasis lxml dengan XPath yang dikompilasi sekali per instance."""
+
+    name = 'lxml'
+
+    def __init__(self):
+        from lxml import etree, html  # Dependensi opsional, diimpor saat backend dipakai
+
+        self._html = html
+        self._comment = etree._Comment
+        self._cards = etree.XPath(f"//div[{_has_class('collection-card')}]")
+        self._title = etree.XPath(f".//h3[{_has_class('product-title')}][ancestor::*[{_has_class('product-details')}]]")
+        self._price = etree.XPath(f".//div[{_has_class('price-container')}]")
+        self._paragraphs = etree.XPath(".//p")
+
+    def iter_cards(self, content):
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+        if not content.strip():
+            return []
+        return self._cards(self._html.document_fromstring(content))
+
+    def _string(self, element):
+        """Meniru `Tag.string` BeautifulSoup: teks jika elemen hanya memiliki satu anak teks."""
+        children = list(element)
+        if not children:
+            return element.text
+        if len(children) == 1 and not element.text and not children[0].tail:
+            child = children[0]
+            if isinstance(child, self._comment):
+                return child.text
+            return self._string(child)
+        return None
+
+    def extract(self, card, timestamp=None):
+        """Mengambil data produk dari satu elemen card dengan Timestamp halaman dari `parse_page`."""
+        try:
+            titles = self._title(card)
+            title = "".join(titles[0].itertext()).strip() if titles else ""
+            title = title or "Unknown Title"
+
+            prices = self._price(card)
+            price = "".join(prices[0].itertext()).strip() if prices else "Price Not Available"
+
+            product = {"Title": title, "Price": price}
+            product.update(extract_card_fields(self._string(p) for p in self._paragraphs(card)))
+            product["Timestamp"] = timestamp if timestamp is not None else datetime.now()
+            return product
+
+        except Exception as e:
+            print(f"Terjadi kesalahan saat mengekstrak data produk: {e}")
+            return None
@@ -0,0 +1,133 @@
+"""Profiling opsional per tahap pipeline (cProfile dan tracemalloc).
+
+Profiling diaktifkan lewat `start_profiling` (dari flag CLI) atau variabel environment:
+- `ETL_PROFILE`     : 'cpu', 'memory', atau keduanya dipisah koma ('1'/'all' = keduanya).
+- `ETL_PROFILE_DIR` : direktori induk hasil profiling (default 'profiles').
+- `ETL_PROFILE_TOP` : jumlah baris teratas pada laporan teks (default 25).
+
+Setiap run menulis ke `<dir>/<waktu run>/`: `<tahap>.prof` (bisa dibuka dengan pstats/
+snakeviz), `<tahap>_cpu.txt`, dan `<tahap>_memory.txt`. Jika profiling tidak aktif,
+`stage()` mengembalikan `nullcontext` sehingga tidak ada overhead.
+"""
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+PROFILE_MODES = ('cpu', 'memory')
+DEFAULT_PROFILE_DIR = 'profiles'
+DEFAULT_TOP_N = 25
+
+
+class StageProfiler:
+    """Menjalankan cProfile dan/atau tracemalloc di sekitar setiap tahap dan menyimpan laporannya."""
+
+    def __init__(self, run_dir: str, cpu: bool = False, memory: bool = False, top_n: int = DEFAULT_TOP_N):
+        self.run_dir = run_dir
+        self.cpu = cpu
+        self.memory = memory
+        self.top_n = top_n
+        self.reports = []
+        os.makedirs(run_dir, exist_ok=True)
+
+    def _path(self, filename):
+        path = os.path.join(self.run_dir, filename)
+        self.reports.append(path)
+        return path
+
+    @contextmanager
+    def stage(self, name: str):
+        """Memprofil satu tahap; cProfile hanya mengukur thread yang menjalankan tahap ini."""
+        profiler = cProfile.Profile() if self.cpu else None
+        started_tracing = False
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._write_cpu_report(name, profiler)
+            if self.memory:
+                after = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+                if started_tracing:
+                    tracemalloc.stop()
+                self._write_memory_report(name, before, after, current, peak)
+
+    def _write_cpu_report(self, name, profiler):
+        profiler.dump_stats(self._path(f"{name}.prof"))
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats('cumulative').print_stats(self.top_n)
+        with open(self._path(f"{name}_cpu.txt"), 'w', encoding='utf-8') as f:
+            f.write(buffer.getvalue())
+
+    def _write_memory_report(self, name, before, after, current, peak):
+        filters = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+        lines = [
+            f"Tahap: {name}",
+            f"Puncak alokasi selama tahap: {peak / 2**20:.1f} MiB",
+            f"Alokasi yang masih hidup di akhir tahap: {current / 2**20:.1f} MiB",
+            f"Top {self.top_n} lokasi alokasi (selisih terhadap awal tahap):",
+        ]
+        lines.extend(str(stat) for stat in stats[:self.top_n])
+        with open(self._path(f"{name}_memory.txt"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+
+_active = None
+
+
+def parse_modes(value) -> set:
+    """Mengubah nilai flag/env ('cpu', 'memory', 'cpu,memory', '1', 'all') menjadi set mode."""
+    if not value:
+        return set()
+    modes = {mode.strip().lower() for mode in str(value).split(',') if mode.strip()}
+    if modes & {'1', 'true', 'all', 'yes'}:
+        return set(PROFILE_MODES)
+    unknown = modes - set(PROFILE_MODES)
+    if unknown:
+        raise ValueError(f"Mode profiling tidak dikenal: {', '.join(sorted(unknown))}. Pilihan: {', '.join(PROFILE_MODES)}")
+    return modes
+
+
+def start_profiling(modes=None, base_dir: str = None, top_n: int = None):
+    """Mengaktifkan profiling untuk run ini; nilai None diambil dari variabel environment.
+
+    Mengembalikan StageProfiler yang aktif, atau None jika tidak ada mode yang diminta.
+    """
+    global _active
+    modes = parse_modes(modes if modes is not None else os.environ.get('ETL_PROFILE'))
+    if not modes:
+        _active = None
+        return None
+    base_dir = base_dir or os.environ.get('ETL_PROFILE_DIR', DEFAULT_PROFILE_DIR)
+    top_n = top_n or int(os.environ.get('ETL_PROFILE_TOP', DEFAULT_TOP_N))
+    run_dir = os.path.join(base_dir, datetime.now().strftime('%Y%m%dT%H%M%S'))
+    _active = StageProfiler(run_dir, cpu='cpu' in modes, memory='memory' in modes, top_n=top_n)
+    print(f"[Profiling] Aktif ({', '.join(sorted(modes))}), laporan ditulis ke {run_dir}")
+    return _active
+
+
+def stop_profiling():
+    """Menonaktifkan profiling dan mengembalikan profiler yang baru selesai (atau None)."""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+def stage(name: str):
+    """Context manager profiling untuk satu tahap; `nullcontext` jika profiling tidak aktif."""
+    if _active is None:
+        return nullcontext()
+    return _active.stage(name)
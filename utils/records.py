@@ -0,0 +1,49 @@
+import pandas as pd
+
+PRODUCT_FIELDS = ('Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender')
+
+
+class ProductColumns:
+    """Penampung produk hasil scraping per kolom sebagai pengganti list berisi dictionary.
+
+    Setiap field disimpan di list tersendiri dan nilai string yang berulang (Price,
+    Rating, Colors, Size, Gender) memakai satu objek yang sama. Timestamp disimpan
+    sekali per rangkaian produk dengan waktu yang sama (satu halaman) bersama jumlah
+    barisnya, lalu baru diperluas saat `to_frame`.
+    """
+
+    __slots__ = ('_columns', '_pools', '_timestamps', '_counts')
+
+    def __init__(self):
+        self._columns = {field: [] for field in PRODUCT_FIELDS}
+        self._pools = {field: {} for field in PRODUCT_FIELDS if field != 'Title'}
+        self._timestamps = []
+        self._counts = []
+
+    def append(self, product: dict):
+        """Menambahkan satu produk (dictionary hasil ekstraksi)."""
+        for field, column in self._columns.items():
+            value = product[field]
+            pool = self._pools.get(field)
+            column.append(value if pool is None else pool.setdefault(value, value))
+        timestamp = product.get('Timestamp')
+        if self._timestamps and self._timestamps[-1] == timestamp:
+            self._counts[-1] += 1
+        else:
+            self._timestamps.append(timestamp)
+            self._counts.append(1)
+
+    def extend(self, products):
+        """Menambahkan banyak produk sekaligus, misalnya satu batch halaman."""
+        for product in products:
+            self.append(product)
+
+    def __len__(self):
+        return len(self._columns['Title'])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Membentuk DataFrame dengan kolom dan urutan yang sama seperti `pd.DataFrame(list_of_dicts)`."""
+        frame = pd.DataFrame(self._columns, columns=list(PRODUCT_FIELDS))
+        timestamps = pd.Series(pd.to_datetime(self._timestamps)).repeat(self._counts)
+        frame['Timestamp'] = timestamps.to_numpy()
+        return frame
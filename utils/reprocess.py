@@ -0,0 +1,137 @@
+"""Pemrosesan ulang file CSV lama per chunk dengan aturan transformasi terbaru, tanpa scraping ulang.
+
+File dibaca dengan `pd.read_csv(chunksize=...)` sehingga hanya beberapa chunk yang ada di
+memori pada satu waktu, berapa pun ukuran file. Chunk ditransformasi (opsional di process
+pool dengan jumlah chunk yang sedang diproses dibatasi) lalu ditulis ke sink sesuai urutan:
+chunk pertama mengganti isi storage, chunk berikutnya ditambahkan.
+
+Jenis input:
+- 'raw'     : CSV data mentah hasil `python main.py extract`; dibersihkan dengan `clean_and_transform`.
+- 'cleaned' : CSV hasil transformasi lama; hanya harga yang dihitung ulang dari kurs lama (`source_rate`).
+- 'auto'    : ditentukan dari kolom Price chunk pertama (teks '$...' berarti data mentah).
+"""
+import os
+import time
+from collections import deque
+from datetime import datetime
+import pandas as pd
+
+from utils import metrics
+from utils.load import (
+    OPTIONAL_SINKS, SINK_NAMES, batch_writers, merge_sink_results, print_load_report, run_batch_sinks, select_writers,
+)
+from utils.transform import EXCHANGE_RATE, clean_and_transform
+
+INPUT_KINDS = ('auto', 'raw', 'cleaned')
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def detect_kind(chunk: pd.DataFrame) -> str:
+    """Menentukan jenis CSV dari chunk pertama: 'raw' jika harga masih berupa teks dolar."""
+    prices = chunk['Price'].dropna().astype(str)
+    return 'raw' if prices.str.startswith('$').any() else 'cleaned'
+
+
+def iter_csv_chunks(paths, chunksize: int = DEFAULT_CHUNKSIZE, kind: str = 'raw'):
+    """Membaca beberapa file CSV berurutan sebagai satu aliran chunk DataFrame.
+
+    Data mentah dibaca sebagai teks (seperti hasil scraping) agar aturan pembersihan
+    tidak berubah; data bersih dibaca dengan tipe kolom bawaan pandas.
+    """
+    options = {'dtype': str, 'keep_default_na': False} if kind == 'raw' else {}
+    for path in paths:
+        with pd.read_csv(path, chunksize=chunksize, memory_map=True, **options) as reader:
+            yield from reader
+
+
+def reprocess_chunk(chunk: pd.DataFrame, kind: str, exchange_rate: float = EXCHANGE_RATE,
+                    source_rate: float = EXCHANGE_RATE) -> pd.DataFrame:
+    """Menerapkan aturan transformasi terbaru pada satu chunk (dijalankan juga di proses worker)."""
+    if kind == 'raw':
+        return clean_and_transform(chunk, exchange_rate)
+    df = chunk.copy()
+    df['Price'] = (df['Price'].astype(float) / source_rate * exchange_rate).round(1)
+    return df
+
+
+def _submit_chunks(chunks, kind, exchange_rate, source_rate, workers):
+    """Menghasilkan (jumlah baris input, hasil) per chunk sesuai urutan.
+
+    Dengan `workers`, transformasi berjalan di process pool dan maksimal dua kali
+    jumlah worker chunk yang sedang diproses, sehingga memori tetap konstan.
+    """
+    if not workers:
+        for chunk in chunks:
+            yield len(chunk), reprocess_chunk(chunk, kind, exchange_rate, source_rate)
+        return
+
+    from utils.extract import start_parse_pool  # requests/bs4 hanya di-import jika process pool dipakai
+
+    executor = start_parse_pool(workers)
+    in_flight = deque()
+    try:
+        for chunk in chunks:
+            in_flight.append((len(chunk), executor.submit(reprocess_chunk, chunk, kind, exchange_rate, source_rate)))
+            del chunk  # Chunk input hanya dipegang oleh future selama diproses
+            if len(in_flight) >= 2 * workers:
+                rows, future = in_flight.popleft()
+                yield rows, future.result()
+        while in_flight:
+            rows, future = in_flight.popleft()
+            yield rows, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def reprocess_csv(paths, sinks=('csv',), kind: str = 'auto', exchange_rate: float = EXCHANGE_RATE,
+                  source_rate: float = EXCHANGE_RATE, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = None,
+                  sink_options: dict = None, parallel: bool = True, timeouts: dict = None) -> dict:
+    """Memproses ulang file CSV per chunk dan menulis hasilnya ke sink terpilih.
+
+    `workers` mengaktifkan process pool untuk transformasi. `sink_options` diteruskan ke
+    `batch_writers` (misalnya filename_csv). Mengembalikan ringkasan berisi kind, chunks,
+    batches (chunk yang ditulis), rows_in, rows_out, duration, dan hasil per sink
+    (digabung dari semua chunk). Sink yang timeout dilewati pada chunk berikutnya seperti
+    pada `load_batches`. Menolak berjalan (ValueError) jika output sink csv
+    adalah salah satu file input.
+    """
+    if kind not in INPUT_KINDS:
+        raise ValueError(f"Jenis input tidak dikenal: {kind}. Pilihan: {', '.join(INPUT_KINDS)}")
+    select_writers(dict.fromkeys(SINK_NAMES + OPTIONAL_SINKS), sinks)  # Validasi nama sink sebelum membaca file
+    paths = [paths] if isinstance(paths, str) else list(paths)
+    if 'csv' in sinks:
+        output = os.path.realpath((sink_options or {}).get('filename_csv', 'fashion_data.csv'))
+        if any(os.path.realpath(path) == output for path in paths):
+            # Batch pertama sink csv menimpa file yang sedang dibaca per chunk (memory-mapped)
+            raise ValueError(f"Output CSV {output} sama dengan salah satu file input; pilih path output lain.")
+    start = time.perf_counter()
+    run_timestamp = datetime.now()
+
+    if kind == 'auto':
+        kind = detect_kind(pd.read_csv(paths[0], nrows=100, dtype=str, keep_default_na=False))
+    print(f"[Reprocess] Memproses {len(paths)} file sebagai data {kind} per {chunksize} baris "
+          f"(kurs {exchange_rate}{f', kurs lama {source_rate}' if kind == 'cleaned' else ''})...")
+
+    summary = {"kind": kind, "chunks": 0, "batches": 0, "rows_in": 0, "rows_out": 0, "sinks": {}}
+    timed_out = set()
+    chunks = iter_csv_chunks(paths, chunksize, kind)
+    for rows_in, df in _submit_chunks(chunks, kind, exchange_rate, source_rate, workers):
+        summary["chunks"] += 1
+        summary["rows_in"] += rows_in
+        metrics.inc('rows_in_total', rows_in, stage='reprocess')
+        if df.empty:
+            continue
+        # Chunk yang kosong setelah transformasi tidak dihitung agar chunk pertama yang ditulis tetap mengganti isi storage
+        writers = batch_writers(df, summary["batches"], run_timestamp, **(sink_options or {}))
+        summary["rows_out"] += len(df)
+        summary["batches"] += 1
+        metrics.inc('rows_out_total', len(df), stage='reprocess')
+        for result in run_batch_sinks(select_writers(writers, sinks), len(df), timed_out, parallel, timeouts):
+            summary["sinks"].setdefault(result["sink"], []).append(result)
+
+    summary["sinks"] = [merge_sink_results(name, results) for name, results in summary["sinks"].items()]
+    summary["duration"] = time.perf_counter() - start
+    print(f"[Reprocess] {summary['chunks']} chunk, {summary['rows_in']} baris masuk, "
+          f"{summary['rows_out']} baris keluar dalam {summary['duration']:.2f}s")
+    print_load_report(summary["sinks"])
+    return summary
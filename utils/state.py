@@ -0,0 +1,131 @@
+import hashlib
+import os
+import sqlite3
+from datetime import datetime
+
+KEY_FIELDS = ('Title', 'Size', 'Gender')
+BUSINESS_FIELDS = ('Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender')
+_SEPARATOR = '\x1f'
+
+
+def product_key(product: dict) -> str:
+    """Membentuk natural key produk (Title+Size+Gender) sebagai string."""
+    return _SEPARATOR.join(str(product.get(field)) for field in KEY_FIELDS)
+
+
+def fingerprint_product(product: dict) -> str:
+    """Menghitung hash konten produk dari field bisnis (tanpa Timestamp)."""
+    payload = _SEPARATOR.join(str(product.get(field)) for field in BUSINESS_FIELDS)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ProductStateStore:
+    """Menyimpan fingerprint produk antar run di SQLite untuk mendeteksi perubahan katalog."""
+
+    def __init__(self, path: str = '.state/products.sqlite'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS products (
+                product_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_at TEXT PRIMARY KEY,
+                total INTEGER NOT NULL,
+                new INTEGER NOT NULL,
+                changed INTEGER NOT NULL,
+                removed INTEGER NOT NULL,
+                unchanged INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def compute_changeset(self, products: list, detect_removed: bool = True) -> dict:
+        """Membandingkan produk hasil scraping dengan state tersimpan.
+
+        Mengembalikan dict berisi list produk 'new' dan 'changed', list key
+        'removed', jumlah 'unchanged', serta 'fingerprints' untuk commit. Set
+        `detect_removed=False` jika crawl tidak lengkap agar produk yang tidak
+        terlihat tidak dianggap terhapus.
+        """
+        stored = dict(self._conn.execute("SELECT product_key, fingerprint FROM products"))
+        fingerprints = {}
+        new, changed = [], []
+        unchanged = 0
+        for product in products:
+            key = product_key(product)
+            if key in fingerprints:
+                continue  # Duplikat natural key dalam satu run: produk pertama yang dipakai
+            fingerprint = fingerprint_product(product)
+            fingerprints[key] = fingerprint
+            if key not in stored:
+                new.append(product)
+            elif stored[key] != fingerprint:
+                changed.append(product)
+            else:
+                unchanged += 1
+        removed = [key for key in stored if key not in fingerprints] if detect_removed else []
+        return {
+            'new': new,
+            'changed': changed,
+            'removed': removed,
+            'unchanged': unchanged,
+            'fingerprints': fingerprints,
+        }
+
+    def commit(self, changeset: dict, run_at: datetime = None) -> dict:
+        """Menyimpan fingerprint hasil run ke state dan mencatat statistik run.
+
+        Panggil setelah changeset berhasil dimuat ke storage, supaya perubahan yang
+        gagal dimuat tetap terdeteksi pada run berikutnya.
+        """
+        run_at = (run_at or datetime.now()).isoformat()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO products (product_key, fingerprint, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT (product_key) DO UPDATE SET fingerprint = excluded.fingerprint,
+                                                       last_seen = excluded.last_seen
+                """,
+                [(key, fingerprint, run_at, run_at) for key, fingerprint in changeset['fingerprints'].items()],
+            )
+            self._conn.executemany(
+                "DELETE FROM products WHERE product_key = ?", [(key,) for key in changeset['removed']]
+            )
+            stats = changeset_stats(changeset)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (run_at, total, new, changed, removed, unchanged) VALUES (?, ?, ?, ?, ?, ?)",
+                (run_at, stats['total'], stats['new'], stats['changed'], stats['removed'], stats['unchanged']),
+            )
+        return stats
+
+    def run_history(self) -> list:
+        """Mengembalikan statistik semua run yang tercatat, dari yang terlama."""
+        cursor = self._conn.execute("SELECT * FROM runs ORDER BY run_at")
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def close(self):
+        self._conn.close()
+
+
+def changeset_stats(changeset: dict) -> dict:
+    """Meringkas changeset menjadi jumlah produk per kategori dan rasio pekerjaan yang dilewati."""
+    new, changed = len(changeset['new']), len(changeset['changed'])
+    total = new + changed + changeset['unchanged']
+    return {
+        'total': total,
+        'new': new,
+        'changed': changed,
+        'removed': len(changeset['removed']),
+        'unchanged': changeset['unchanged'],
+        'skipped_ratio': changeset['unchanged'] / total if total else 0.0,
+    }
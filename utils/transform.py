@@ -1,11 +1,39 @@
+import time
+import numpy as np
 import pandas as pd
+from utils import metrics
 
-def clean_and_transform(df: pd.DataFrame) -> pd.DataFrame:
-    """Transformasi data hasil ekstraksi agar siap untuk dimuat ke storage dengan penanganan kesalahan."""
+EXCHANGE_RATE = 16000
 
+def build_column_schema(exchange_rate: float = EXCHANGE_RATE) -> dict:
+    """Skema kolom untuk transform_with_schema; harga dolar dikalikan kurs `exchange_rate`."""
+    return {
+        'Title': {'parser': 'text'},
+        'Price': {'parser': 'currency', 'multiplier': exchange_rate, 'round': 1, 'dtype': 'float64'},
+        'Rating': {'parser': 'extract', 'pattern': r'⭐\s*(\d+\.\d+)', 'dtype': 'float32',
+                   'drop_value': 'Invalid Rating'},
+        'Colors': {'parser': 'extract', 'pattern': r'(\d+)', 'dtype': 'uint16'},
+        'Size': {'parser': 'category'},
+        'Gender': {'parser': 'category'},
+        'Timestamp': {'parser': 'datetime'},
+    }
+
+# Skema kolom default (kurs EXCHANGE_RATE): setiap kolom di-parse sekali secara vektor
+COLUMN_SCHEMA = build_column_schema()
+
+def clean_and_transform(df: pd.DataFrame, exchange_rate: float = EXCHANGE_RATE) -> pd.DataFrame:
+    """Transformasi data hasil ekstraksi agar siap untuk dimuat ke storage dengan penanganan kesalahan.
+
+    Harga dolar dikonversi ke rupiah dengan kurs `exchange_rate`.
+    """
+
+    start = time.perf_counter()
+    metrics.inc('rows_in_total', len(df), stage='transform')
     try:
         # Menghapus baris dengan rating invalid
-        df = df[df['Rating'] != 'Invalid Rating'].copy()
+        valid = df['Rating'] != 'Invalid Rating'
+        metrics.inc('rows_dropped_total', int((~valid).sum()), stage='transform', reason='invalid_rating')
+        df = df[valid].copy()
 
         # Membersihkan dan mengonversi kolom Rating ke float
         df['Rating'] = df['Rating'].str.extract(r'⭐\s*(\d+\.\d+)')
@@ -13,7 +41,7 @@ def clean_and_transform(df: pd.DataFrame) -> pd.DataFrame:
 
         # Membersihkan dan mengonversi kolom Price ke float, lalu ke rupiah
         df['Price'] = df['Price'].str.replace('$', '', regex=False).str.replace(',', '', regex=False)
-        df['Price'] = df['Price'].astype(float) * 16000
+        df['Price'] = df['Price'].astype(float) * exchange_rate
         df['Price'] = df['Price'].round(1).astype('float64')
 
         # mengonversi Colors menjadi integer
@@ -28,6 +56,93 @@ def clean_and_transform(df: pd.DataFrame) -> pd.DataFrame:
 
     except Exception as e:
         print(f"[Transform Error] Terjadi kesalahan saat transformasi data: {e}")
+        metrics.inc('transform_errors_total')
         return pd.DataFrame()  # Mengembalikan DataFrame kosong jika error
 
+    metrics.observe('transform_duration_seconds', time.perf_counter() - start)
+    metrics.inc('rows_out_total', len(df), stage='transform')
     return df
+
+
+def transform_batches(batches, exchange_rate: float = EXCHANGE_RATE):
+    """Menjalankan clean_and_transform pada setiap batch hasil ekstraksi secara streaming.
+
+    Menerima iterable berisi list dictionary produk (per halaman) dan menghasilkan
+    DataFrame bersih per batch; batch yang kosong setelah dibersihkan dilewati.
+    """
+    for products in batches:
+        df_cleaned = clean_and_transform(pd.DataFrame(products), exchange_rate)
+        if not df_cleaned.empty:
+            yield df_cleaned
+
+
+def _parse_text(series: pd.Series, spec: dict) -> pd.Series:
+    return series
+
+
+def _parse_currency(series: pd.Series, spec: dict) -> pd.Series:
+    values = pd.to_numeric(series.str.replace(r'[$,]', '', regex=True), errors='raise')
+    values = values * spec.get('multiplier', 1)
+    if 'round' in spec:
+        values = values.round(spec['round'])
+    return values.astype(spec.get('dtype', 'float64'))
+
+
+def _parse_extract(series: pd.Series, spec: dict) -> pd.Series:
+    values = series.str.extract(spec['pattern'], expand=False)
+    dtype = np.dtype(spec['dtype'])
+    if dtype.kind in 'iu':
+        values = pd.to_numeric(values, errors='raise')
+        bounds = np.iinfo(dtype)
+        if len(values) and (values.min() < bounds.min or values.max() > bounds.max):
+            dtype = np.dtype('int64')  # Nilai di luar jangkauan tipe ringkas: dilebarkan, bukan overflow
+    return values.astype(dtype)
+
+
+def _parse_category(series: pd.Series, spec: dict) -> pd.Series:
+    return series.astype('category')
+
+
+def _parse_datetime(series: pd.Series, spec: dict) -> pd.Series:
+    return pd.to_datetime(series, errors='coerce')
+
+
+COLUMN_PARSERS = {
+    'text': _parse_text,
+    'currency': _parse_currency,
+    'extract': _parse_extract,
+    'category': _parse_category,
+    'datetime': _parse_datetime,
+}
+
+
+def transform_with_schema(df: pd.DataFrame, schema: dict = None, exchange_rate: float = EXCHANGE_RATE) -> pd.DataFrame:
+    """Transformasi berbasis skema kolom dengan output bertipe ringkas.
+
+    Baris dengan nilai `drop_value` dibuang lewat satu mask, lalu setiap kolom
+    di-parse sekali secara vektor sesuai parser di skema. Hasilnya memakai tipe
+    ringkas (category untuk Size/Gender, uint16 untuk Colors, float32 untuk Rating)
+    dan Timestamp tetap datetime64, bukan string; kolom integer yang nilainya di luar
+    jangkauan tipe ringkas dilebarkan ke int64. Aturan pembersihan sama dengan
+    clean_and_transform; DataFrame kosong dikembalikan jika terjadi kesalahan.
+    Tanpa `schema`, skema dibuat dari `build_column_schema(exchange_rate)` sehingga
+    kurs dapat diubah seperti pada clean_and_transform.
+
+    Fungsi ini hanya API library (dipakai test dan benchmark); pipeline di main.py
+    dan semua sink tetap memakai clean_and_transform.
+    """
+    schema = schema or build_column_schema(exchange_rate)
+    try:
+        keep = pd.Series(True, index=df.index)
+        for column, spec in schema.items():
+            if 'drop_value' in spec:
+                keep &= df[column].ne(spec['drop_value'])
+
+        return pd.DataFrame({
+            column: COLUMN_PARSERS[spec['parser']](df[column][keep], spec)
+            for column, spec in schema.items()
+        })
+
+    except Exception as e:
+        print(f"[Transform Error] Terjadi kesalahan saat transformasi data: {e}")
+        return pd.DataFrame()